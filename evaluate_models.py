@@ -1,14 +1,38 @@
+import asyncio
+import hashlib
+import io
+import json
+import os
+import re
 import sys
 import time
 import logging
 from pathlib import Path
 from difflib import SequenceMatcher
 
+try:
+    # C++ bit-parallel Indel distance; same semantics as SequenceMatcher.ratio()
+    from rapidfuzz.distance import Indel
+except ImportError:  # pragma: no cover - optional, falls back to difflib
+    Indel = None
+
+try:
+    # Token-level alignment for WER (the metric that matters for ASR)
+    import jiwer
+except ImportError:  # pragma: no cover - optional, WER column shows n/a
+    jiwer = None
+
 # Add src to path
 sys.path.append(str(Path.cwd() / "src"))
 
+from metalscribe.config import WHISPER_MODELS, get_cache_dir
 from metalscribe.core.audio import convert_to_wav_16k
-from metalscribe.core.whisper import run_transcription
+from metalscribe.core.whisper import (
+    BACKEND_CT2_INT8,
+    BACKEND_WHISPER_CPP,
+    WhisperModel,
+    run_transcription,
+)
 from metalscribe.utils.logging import setup_logging
 
 # Setup
@@ -19,104 +43,170 @@ FILES = [
 MODELS = [
     "large-v3",
     "large-v3-q5_0",
-    "large-v3-turbo"
+    "large-v3-turbo",
+    "large-v3-turbo-q8_0",
 ]
+# "<model>@<backend>" runs through a non-default backend; CTranslate2 int8 only
+# when faster-whisper is installed (pip install 'metalscribe[ct2]')
+if WhisperModel is not None:
+    MODELS += [f"large-v3@{BACKEND_CT2_INT8}", f"large-v3-turbo@{BACKEND_CT2_INT8}"]
 
 EVAL_DIR = Path(".models_eval")
 EVAL_DIR.mkdir(exist_ok=True)
 
+LIMIT_MINUTES = 15.0
+WAV_MANIFEST = EVAL_DIR / "wav_manifest.json"
+# Metric results keyed by (ref_sha256, cand_sha256, metric); survives reruns
+METRIC_CACHE_DIR = EVAL_DIR / "cache"
+METRIC_CACHE_DIR.mkdir(exist_ok=True)
+
+# Concurrent whisper.cpp processes allowed on the GPU at once (one GPU worker each).
+# Keep at 1 for meaningful RTF numbers; conversions still overlap with transcription.
+GPU_SLOTS = int(os.environ.get("EVAL_GPU_SLOTS", "1"))
+# Converted WAVs waiting for the GPU; bounds disk usage and read-ahead
+QUEUE_SIZE = 2
+# Concurrent ffmpeg conversions (CPU-bound, independent of the GPU slots)
+CONVERT_WORKERS = int(os.environ.get("EVAL_CONVERT_WORKERS", "2"))
+
 setup_logging(verbose=True)
 logger = logging.getLogger("eval")
 
 def read_text(path):
-    if not path.exists():
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
         return ""
-    return path.read_text(encoding="utf-8").strip()
 
 def similarity(a, b):
+    if Indel is not None:
+        return Indel.normalized_similarity(a, b)
     return SequenceMatcher(None, a, b).ratio()
 
-report_lines = []
-report_lines.append("# Relatório de Avaliação de Modelos Whisper")
-report_lines.append(f"Date: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-report_lines.append("")
-
-for file_str in FILES:
-    input_path = Path(file_str)
-    if not input_path.exists():
-        logger.error(f"File not found: {input_path}")
-        continue
-    
-    file_id = input_path.stem
-    logger.info(f"Processing {file_id}...")
-    
-    # 1. Convert/Truncate
-    wav_path = EVAL_DIR / f"{file_id}_15m.wav"
-    if not wav_path.exists():
-        logger.info(f"Converting {file_id} to 15m WAV...")
-        convert_to_wav_16k(input_path, wav_path, limit_minutes=15.0)
+def normalize_words(text):
+    """Lowercases and strips punctuation so WER counts word errors only."""
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
+
+def word_error_rate(ref_words, cand_words):
+    """WER of already-normalized texts, or None when jiwer is unavailable."""
+    if jiwer is None or not ref_words:
+        return None
+    return jiwer.wer(ref_words, cand_words)
+
+def cached_metric(metric_name, fn, ref_text, cand_text):
+    """Returns fn(ref_text, cand_text), memoized on disk by the content of both texts."""
+    ref_sha = hashlib.sha256(ref_text.encode("utf-8")).hexdigest()
+    cand_sha = hashlib.sha256(cand_text.encode("utf-8")).hexdigest()
+    cache_path = METRIC_CACHE_DIR / f"{metric_name}_{ref_sha[:16]}_{cand_sha[:16]}.json"
+    if cache_path.exists():
+        return json.loads(cache_path.read_text(encoding="utf-8"))["value"]
+
+    value = fn(ref_text, cand_text)
+    # None means the metric backend is missing; retry once it is installed
+    if value is not None:
+        cache_path.write_text(json.dumps({"metric": metric_name, "value": value}), encoding="utf-8")
+    return value
+
+def split_model(entry):
+    """'large-v3@ct2-int8' -> ('large-v3', 'ct2-int8'); plain names use whisper.cpp."""
+    model, _, backend = entry.partition("@")
+    return model, backend or BACKEND_WHISPER_CPP
+
+def model_size_mb(entry):
+    """Size of the downloaded ggml file, to weigh quantization savings against quality.
+
+    None for other backends (their weights live in the Hugging Face cache).
+    """
+    model, backend = split_model(entry)
+    if backend != BACKEND_WHISPER_CPP:
+        return None
+    model_path = get_cache_dir() / "models" / WHISPER_MODELS[model]["filename"]
+    if not model_path.exists():
+        return 0.0
+    return model_path.stat().st_size / (1024 * 1024)
+
+def wav_cache_key(input_path: Path, limit_minutes: float) -> str:
+    """Content-addressed key: source bytes + truncation limit (not the file name)."""
+    with open(input_path, "rb") as f:
+        digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+    return f"{digest}_{int(limit_minutes * 60)}"
+
+def scan_eval_dir() -> set[str]:
+    """Names of the files already in EVAL_DIR, from a single directory read.
+
+    Replaces per-file exists() stats; the pipeline adds names as it creates files.
+    """
+    with os.scandir(EVAL_DIR) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+def _convert_one(input_path: Path, wav_path: Path, eval_files: set[str]) -> Path:
+    """Converts/truncates one input file to a 15m WAV (CPU-only, runs outside the GPU slot)."""
+    if wav_path.name not in eval_files:
+        logger.info(f"Converting {input_path.stem} to 15m WAV...")
+        convert_to_wav_16k(input_path, wav_path, limit_minutes=LIMIT_MINUTES)
     else:
         logger.info(f"WAV already exists: {wav_path}")
-    
-    # 2. Transcribe with each model
-    results = {} # model -> {time, text_path, rtf}
-    
-    for model in MODELS:
-        logger.info(f"Transcribing {file_id} with {model}...")
-        
-        # We want the output txt. run_transcription uses output_base to generate .txt
-        output_base = EVAL_DIR / f"{file_id}_{model}"
-        expected_txt = Path(f"{output_base}.txt")
-        
-        start_t = time.time()
-        
-        # Check if already processed to save time (optional, but good for retries)
-        if not expected_txt.exists():
-             run_transcription(
-                wav_path, 
-                model_name=model, 
-                language="pt", 
-                output_base=output_base
-            )
-        else:
-             logger.info(f"Output already exists for {model}")
-        
-        duration = time.time() - start_t
-        # If cached, duration is ~0, so we can't calculate RTF correctly from this run
-        # For the purpose of the report, we only get accurate RTF if we run it.
-        # But for now let's assume we run it or report 0.
-        
-        rtf = duration / 900.0 
-        
-        results[model] = {
-            "time": duration,
-            "rtf": rtf,
-            "path": expected_txt
-        }
-        
-    # 3. Compare
+    eval_files.add(wav_path.name)
+    return wav_path
+
+def _transcribe_one(
+    wav_path: Path, model: str, output_base: Path, eval_files: set[str]
+) -> tuple[str, float, Path]:
+    """Transcribes one (file, model) pair. Runs in a GPU worker thread."""
+    # We want the output txt. run_transcription uses output_base to generate .txt
+    expected_txt = Path(f"{output_base}.txt")
+
+    # Check if already processed to save time (optional, but good for retries)
+    if expected_txt.name in eval_files:
+        logger.info(f"Output already exists for {model}")
+        # If cached, duration is 0, so we can't calculate RTF correctly from this run
+        return model, 0.0, expected_txt
+
+    logger.info(f"Transcribing {wav_path.name} with {model}...")
+    start_t = time.time()
+    model_name, backend = split_model(model)
+    run_transcription(
+        wav_path,
+        model_name=model_name,
+        language="pt",
+        output_base=output_base,
+        backend=backend,
+    )
+    duration = time.time() - start_t
+    eval_files.add(expected_txt.name)
+
+    return model, duration, expected_txt
+
+def compare_file(file_id: str, file_results: dict) -> str:
+    """Builds the report section comparing every model against the reference."""
     ref_model = "large-v3"
-    if ref_model not in results or not results[ref_model]["path"].exists():
+    ref_text = read_text(file_results[ref_model]["path"]) if ref_model in file_results else ""
+    if not ref_text:
         logger.error(f"Reference model {ref_model} failed for {file_id}")
-        continue
-        
-    ref_text = read_text(results[ref_model]["path"])
+        return ""
+
     ref_len = len(ref_text)
-    
-    report_lines.append(f"## Arquivo: {file_id}")
-    report_lines.append(f"**Referência ({ref_model}):** {ref_len} caracteres")
-    report_lines.append("")
-    report_lines.append("| Modelo | Tempo (s) | RTF | Similaridade | Diferença Chars | Notas |")
-    report_lines.append("|---|---|---|---|---|---|")
-    
+    # Normalized once per file, reused for every candidate
+    ref_words = normalize_words(ref_text)
+
+    buf = io.StringIO()
+    buf.write(f"## Arquivo: {file_id}\n")
+    buf.write(f"**Referência ({ref_model}):** {ref_len} caracteres\n")
+    buf.write("\n")
+    buf.write("| Modelo | Tamanho (MB) | Tempo (s) | RTF | Similaridade | WER | Diferença Chars | Notas |\n")
+    buf.write("|---|---|---|---|---|---|---|---|\n")
+
     for model in MODELS:
-        res = results[model]
+        res = file_results[model]
         cand_text = read_text(res["path"])
         cand_len = len(cand_text)
-        
-        sim = similarity(ref_text, cand_text)
+
+        sim = cached_metric("similarity", similarity, ref_text, cand_text)
+        wer = cached_metric("wer", word_error_rate, ref_words, normalize_words(cand_text))
+        wer_str = f"{wer:.4f}" if wer is not None else "n/a"
+        size_mb = model_size_mb(model)
+        size_str = f"{size_mb:.0f}" if size_mb is not None else "n/a"
         diff_len = cand_len - ref_len
-        
+
         # Hallucination heuristic: Repetition or huge length diff
         notes = ""
         if abs(diff_len) > ref_len * 0.2:
@@ -125,13 +215,146 @@ for file_str in FILES:
             notes += "⚠️ Baixa similaridade "
         if model == ref_model:
             notes = "Referência"
-            
-        report_lines.append(f"| {model} | {res['time']:.2f} | {res['rtf']:.3f} | {sim:.4f} | {diff_len} | {notes} |")
-    
-    report_lines.append("")
-
-# Write report
-report_path = EVAL_DIR / "evaluation_report.md"
-report_path.write_text("\n".join(report_lines), encoding="utf-8")
-logger.info(f"Report generated at {report_path}")
-print(f"Report generated at {report_path}")
+
+        buf.write(f"| {model} | {size_str} | {res['time']:.2f} | {res['rtf']:.3f} | {sim:.4f} | {wer_str} | {diff_len} | {notes} |\n")
+
+    buf.write("\n")
+    return buf.getvalue()
+
+async def convert_stage(manifest: dict, eval_files: set[str], wav_queue: asyncio.Queue) -> None:
+    """Producer: converts up to CONVERT_WORKERS sources at once (ffmpeg, CPU) and feeds the GPU queue.
+
+    Files are queued in completion order; the report is reordered by FILES in main().
+    """
+    slots = asyncio.Semaphore(CONVERT_WORKERS)
+    # Same audio under two paths shares a WAV; never convert it twice concurrently
+    key_locks: dict[str, asyncio.Lock] = {}
+
+    async def convert(input_path: Path) -> None:
+        file_id = input_path.stem
+        async with slots:
+            logger.info(f"Processing {file_id}...")
+
+            # WAV is keyed by content, so a changed source is re-converted and
+            # the same audio under another path reuses the cached conversion
+            wav_key = await asyncio.to_thread(wav_cache_key, input_path, LIMIT_MINUTES)
+            manifest[file_id] = wav_key
+            wav_path = EVAL_DIR / f"{wav_key}.wav"
+            async with key_locks.setdefault(wav_key, asyncio.Lock()):
+                await asyncio.to_thread(_convert_one, input_path, wav_path, eval_files)
+
+        # Blocks while QUEUE_SIZE WAVs are already waiting for the GPU
+        # (outside the slot, so a full queue doesn't stall other conversions' slots)
+        await wav_queue.put((file_id, wav_key, wav_path))
+
+    inputs = []
+    for file_str in FILES:
+        input_path = Path(file_str)
+        if not input_path.exists():
+            logger.error(f"File not found: {input_path}")
+            continue
+        inputs.append(input_path)
+
+    await asyncio.gather(*(convert(input_path) for input_path in inputs))
+
+    for _ in range(GPU_SLOTS):
+        await wav_queue.put(None)
+
+async def transcribe_stage(
+    eval_files: set[str], wav_queue: asyncio.Queue, done_queue: asyncio.Queue
+) -> None:
+    """GPU worker: drains converted WAVs and runs every model on each.
+
+    Takes every WAV already waiting in the queue and runs the batch
+    model-major, so each ggml model is used back to back (warm in the page
+    cache) instead of alternating models per file.
+    """
+    finished = False
+    while not finished:
+        batch = [await wav_queue.get()]
+        while not wav_queue.empty():
+            batch.append(wav_queue.get_nowait())
+
+        sentinels = batch.count(None)
+        if sentinels:
+            finished = True
+            batch = [item for item in batch if item is not None]
+            # Sentinels meant for the other GPU workers go back in the queue
+            for _ in range(sentinels - 1):
+                wav_queue.put_nowait(None)
+
+        batch_results = {file_id: {} for file_id, _, _ in batch}
+        for model in MODELS:
+            for file_id, wav_key, wav_path in batch:
+                # Include the WAV key so transcripts of a stale source are not reused
+                output_base = EVAL_DIR / f"{file_id}_{wav_key[:12]}_{model}"
+                model, duration, path = await asyncio.to_thread(
+                    _transcribe_one, wav_path, model, output_base, eval_files
+                )
+                batch_results[file_id][model] = {
+                    "time": duration,
+                    "rtf": duration / 900.0,
+                    "path": path
+                }
+
+        for file_id, file_results in batch_results.items():
+            await done_queue.put((file_id, file_results))
+
+    await done_queue.put(None)
+
+async def compare_stage(done_queue: asyncio.Queue, sections: dict) -> None:
+    """Consumer: scores each transcribed file while the next one is on the GPU."""
+    remaining = GPU_SLOTS
+    while remaining:
+        item = await done_queue.get()
+        if item is None:
+            remaining -= 1
+            continue
+        file_id, file_results = item
+        sections[file_id] = await asyncio.to_thread(compare_file, file_id, file_results)
+
+async def run_pipeline() -> dict:
+    """Runs source -> wav -> transcribed -> report as three overlapping stages.
+
+    Stages stream into each other through bounded queues, so the first
+    transcription starts while later files are still converting.
+    """
+    eval_files = scan_eval_dir()
+    manifest = (
+        json.loads(WAV_MANIFEST.read_text(encoding="utf-8"))
+        if WAV_MANIFEST.name in eval_files
+        else {}
+    )
+    sections = {}
+
+    wav_queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    done_queue = asyncio.Queue()
+    await asyncio.gather(
+        convert_stage(manifest, eval_files, wav_queue),
+        *(transcribe_stage(eval_files, wav_queue, done_queue) for _ in range(GPU_SLOTS)),
+        compare_stage(done_queue, sections),
+    )
+
+    WAV_MANIFEST.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return sections
+
+def main() -> None:
+    report = io.StringIO()
+    report.write("# Relatório de Avaliação de Modelos Whisper\n")
+    report.write(f"Date: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+    report.write("\n")
+
+    sections = asyncio.run(run_pipeline())
+
+    # Keep report order stable regardless of which GPU worker finished first
+    for file_str in FILES:
+        report.write(sections.get(Path(file_str).stem, ""))
+
+    # Write report
+    report_path = EVAL_DIR / "evaluation_report.md"
+    report_path.write_text(report.getvalue(), encoding="utf-8")
+    logger.info(f"Report generated at {report_path}")
+    print(f"Report generated at {report_path}")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 """Adaptadores para importação de transcrições externas."""
 
 from metalscribe.adapters.base import TranscriptAdapter
-from metalscribe.adapters.detector import detect_format
-from metalscribe.adapters.importer import import_transcript
+from metalscribe.adapters.detector import detect_format, detect_format_and_adapter
+from metalscribe.adapters.importer import import_transcript, iter_transcript
 from metalscribe.adapters.registry import TranscriptFormat, register_adapter
 
 # Importa adaptadores para registrá-los
@@ -13,5 +13,7 @@ __all__ = [
     "TranscriptAdapter",
     "register_adapter",
     "import_transcript",
+    "iter_transcript",
     "detect_format",
+    "detect_format_and_adapter",
 ]
@@ -2,8 +2,9 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
+from metalscribe.adapters.triggers import CompiledTrigger, resolve_path
 from metalscribe.core.models import MergedSegment
 
 
@@ -14,6 +15,9 @@ class TranscriptAdapter(ABC):
     # Exemplo: [{"field": "model", "contains": "voxtral"}]
     TRIGGERS: List[dict] = []
 
+    # TRIGGERS pré-compilados (CompiledTrigger) por @register_adapter
+    _COMPILED_TRIGGERS: List[CompiledTrigger] = []
+
     @classmethod
     @abstractmethod
     def detect(cls, data: dict) -> bool:
@@ -28,6 +32,14 @@ class TranscriptAdapter(ABC):
         """
         pass
 
+    @classmethod
+    def matches_triggers(cls, data: dict) -> bool:
+        """Retorna True se qualquer gatilho pré-compilado casar (short-circuit)."""
+        return any(
+            trigger.predicate(resolve_path(data, trigger.path))
+            for trigger in cls._COMPILED_TRIGGERS
+        )
+
     @classmethod
     @abstractmethod
     def parse(cls, data: dict) -> List[MergedSegment]:
@@ -42,6 +54,22 @@ class TranscriptAdapter(ABC):
         """
         pass
 
+    @classmethod
+    def iter_parse(cls, data: dict) -> Iterator[MergedSegment]:
+        """
+        Converte o JSON em MergedSegment sob demanda (gerador).
+
+        Adaptadores podem sobrescrever para não materializar a lista inteira;
+        a implementação padrão delega para parse().
+
+        Args:
+            data: JSON carregado como dict
+
+        Yields:
+            MergedSegment na ordem do arquivo
+        """
+        yield from cls.parse(data)
+
     @classmethod
     def get_schema_path(cls) -> Path | None:
         """Retorna path do schema JSON para validação (opcional)."""
@@ -4,29 +4,46 @@ import logging
 from typing import Type
 
 from metalscribe.adapters.base import TranscriptAdapter
-from metalscribe.adapters.registry import TranscriptFormat, get_all_adapters
+from metalscribe.adapters.registry import TranscriptFormat, get_registry_entries
 
 logger = logging.getLogger(__name__)
 
 
+def detect_format_and_adapter(
+    data: dict,
+) -> tuple[TranscriptFormat, Type[TranscriptAdapter]] | tuple[None, None]:
+    """
+    Detecta o formato do JSON e retorna também o adaptador correspondente.
+
+    Testa os adaptadores registrados na ordem de registro e retorna o
+    primeiro que reconhecer o formato (detect() avalia os TRIGGERS
+    pré-compilados com short-circuit).
+
+    Args:
+        data: JSON carregado como dict
+
+    Returns:
+        Tupla (TranscriptFormat, adaptador) ou (None, None) se não reconhecido
+    """
+    for format, (adapter, detect) in get_registry_entries():
+        if detect(data):
+            logger.debug(f"Formato detectado: {format.value}")
+            return format, adapter
+
+    return None, None
+
+
 def detect_format(data: dict) -> TranscriptFormat | None:
     """
     Detecta automaticamente o formato do JSON.
 
-    Itera sobre todos os adaptadores registrados e retorna
-    o primeiro que reconhecer o formato.
-
     Args:
         data: JSON carregado como dict
 
     Returns:
         TranscriptFormat ou None se não reconhecido
     """
-    for format, adapter in get_all_adapters().items():
-        if adapter.detect(data):
-            logger.debug(f"Formato detectado: {format.value}")
-            return format
-    return None
+    return detect_format_and_adapter(data)[0]
 
 
 def get_adapter_for_data(data: dict) -> Type[TranscriptAdapter] | None:
@@ -39,7 +56,4 @@ def get_adapter_for_data(data: dict) -> Type[TranscriptAdapter] | None:
     Returns:
         Classe do adaptador ou None
     """
-    for format, adapter in get_all_adapters().items():
-        if adapter.detect(data):
-            return adapter
-    return None
+    return detect_format_and_adapter(data)[1]
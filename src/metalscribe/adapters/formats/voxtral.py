@@ -1,12 +1,27 @@
 """Adaptador para formato Voxtral."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from metalscribe.adapters.base import TranscriptAdapter
 from metalscribe.adapters.registry import TranscriptFormat, register_adapter
 from metalscribe.core.models import MergedSegment
 
+try:
+    import numpy as np
+except ImportError:  # Opcional: conversão em Python puro como fallback
+    np = None
+
+
+def _seconds_to_ms(raw: List[dict], key: str) -> List[int]:
+    """Converte o campo `key` (segundos) de todos os segmentos para ms inteiros."""
+    if np is not None:
+        # float64 preserva precisão de ms em áudios longos; astype trunca como int()
+        seconds = np.fromiter((seg.get(key, 0) for seg in raw), dtype=np.float64, count=len(raw))
+        return (seconds * 1000).astype(np.int64).tolist()
+    return [int(seg.get(key, 0) * 1000) for seg in raw]
+
 
 @register_adapter(TranscriptFormat.VOXTRAL)
 class VoxtralAdapter(TranscriptAdapter):
@@ -22,49 +37,34 @@ class VoxtralAdapter(TranscriptAdapter):
     @classmethod
     def detect(cls, data: dict) -> bool:
         """Detecta formato Voxtral."""
-        # Gatilho 1: campo 'model' contém 'voxtral'
-        if "voxtral" in data.get("model", "").lower():
-            return True
-
-        # Gatilho 2: segments com speaker_id e type específico
-        segments = data.get("segments", [])
-        if segments:
-            first = segments[0]
-            if first.get("type") == "transcription_segment":
-                return True
-            if "speaker_id" in first:
-                return True
-
-        return False
+        return cls.matches_triggers(data)
 
     @classmethod
     def parse(cls, data: dict) -> List[MergedSegment]:
         """Converte Voxtral JSON para MergedSegment."""
-        segments = []
-        for seg in data.get("segments", []):
-            # start/end em segundos -> ms
-            start_ms = int(seg.get("start", 0) * 1000)
-            end_ms = int(seg.get("end", 0) * 1000)
-            text = seg.get("text", "").strip()
+        return list(cls.iter_parse(data))
 
-            # speaker_id: "speaker_1" -> "SPEAKER_01"
-            speaker_id = seg.get("speaker_id", "unknown")
-            speaker = cls._normalize_speaker(speaker_id)
+    @classmethod
+    def iter_parse(cls, data: dict) -> Iterator[MergedSegment]:
+        """Converte Voxtral JSON para MergedSegment sob demanda."""
+        raw = data.get("segments", [])
+
+        # Colunas (SoA): start/end em segundos -> ms de uma vez só
+        start_ms = _seconds_to_ms(raw, "start")
+        end_ms = _seconds_to_ms(raw, "end")
 
-            if text:
-                segments.append(
-                    MergedSegment(
-                        start_ms=start_ms,
-                        end_ms=end_ms,
-                        text=text,
-                        speaker=speaker,
-                    )
-                )
-        return segments
+        for seg, start, end in zip(raw, start_ms, end_ms):
+            text = seg.get("text", "").strip()
+            if not text:
+                continue
+            # speaker_id: "speaker_1" -> "SPEAKER_01"
+            speaker = cls._normalize_speaker(seg.get("speaker_id", "unknown"))
+            yield MergedSegment(start_ms=start, end_ms=end, text=text, speaker=speaker)
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def _normalize_speaker(speaker_id: str) -> str:
-        """Normaliza speaker_id para formato SPEAKER_XX."""
+        """Normaliza speaker_id para formato SPEAKER_XX (memoizado: poucos speakers únicos)."""
         # "speaker_1" -> "SPEAKER_01"
         if speaker_id.startswith("speaker_"):
             num = speaker_id.split("_")[1]
@@ -3,34 +3,48 @@
 import json
 import logging
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
-from metalscribe.adapters.detector import detect_format, get_adapter_for_data
+from metalscribe.adapters.detector import detect_format_and_adapter
 from metalscribe.adapters.registry import TranscriptFormat
 from metalscribe.core.models import MergedSegment
 
+try:
+    import orjson
+except ImportError:  # Opcional: usa json da stdlib como fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
-def import_transcript(json_path: Path) -> List[MergedSegment]:
+def _load_json(json_path: Path) -> dict:
+    """Carrega JSON a partir dos bytes brutos, usando orjson quando disponível."""
+    raw = json_path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def iter_transcript(json_path: Path) -> Iterator[MergedSegment]:
     """
-    Importa transcrição de arquivo JSON externo.
+    Importa transcrição de arquivo JSON externo sob demanda.
 
-    Detecta automaticamente o formato e converte para MergedSegment.
+    Detecta o formato imediatamente (erros aparecem na chamada) e devolve
+    um gerador de MergedSegment, para consumidores de passagem única
+    (ex: export_srt) não materializarem a lista inteira.
 
     Args:
         json_path: Caminho para o arquivo JSON
 
     Returns:
-        Lista de MergedSegment
+        Iterador de MergedSegment
 
     Raises:
         ValueError: Se formato não for reconhecido
     """
-    with open(json_path, encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json(json_path)
 
-    format = detect_format(data)
+    format, adapter = detect_format_and_adapter(data)
     if not format:
         supported = [f.value for f in TranscriptFormat]
         raise ValueError(
@@ -39,9 +53,25 @@ def import_transcript(json_path: Path) -> List[MergedSegment]:
         )
 
     logger.info(f"Formato detectado: {format.value}")
+    return adapter.iter_parse(data)
+
+
+def import_transcript(json_path: Path) -> List[MergedSegment]:
+    """
+    Importa transcrição de arquivo JSON externo.
 
-    adapter = get_adapter_for_data(data)
-    segments = adapter.parse(data)
+    Detecta automaticamente o formato e converte para MergedSegment.
+
+    Args:
+        json_path: Caminho para o arquivo JSON
+
+    Returns:
+        Lista de MergedSegment
+
+    Raises:
+        ValueError: Se formato não for reconhecido
+    """
+    segments = list(iter_transcript(json_path))
 
     logger.info(f"Importados {len(segments)} segmentos de {json_path.name}")
     return segments
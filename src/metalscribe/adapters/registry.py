@@ -1,7 +1,9 @@
 """Registro de adaptadores de transcrição."""
 
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, Type
+from typing import TYPE_CHECKING, Callable, Dict, ItemsView, Tuple, Type
+
+from metalscribe.adapters.triggers import compile_triggers
 
 if TYPE_CHECKING:
     from metalscribe.adapters.base import TranscriptAdapter
@@ -15,14 +17,19 @@ class TranscriptFormat(Enum):
 
 
 # Registro de adaptadores (preenchido em runtime via decorators)
-_ADAPTER_REGISTRY: Dict[TranscriptFormat, Type["TranscriptAdapter"]] = {}
+# Guarda (classe, detect) já resolvidos: o laço de detecção chama
+# detect(data) direto, sem resolver o descriptor de classmethod a cada chamada
+_ADAPTER_REGISTRY: Dict[
+    TranscriptFormat, Tuple[Type["TranscriptAdapter"], Callable[[dict], bool]]
+] = {}
 
 
 def register_adapter(format: TranscriptFormat):
     """Decorator para registrar um adaptador."""
 
     def decorator(cls):
-        _ADAPTER_REGISTRY[format] = cls
+        cls._COMPILED_TRIGGERS = compile_triggers(cls.TRIGGERS)
+        _ADAPTER_REGISTRY[format] = (cls, cls.detect)
         return cls
 
     return decorator
@@ -30,9 +37,16 @@ def register_adapter(format: TranscriptFormat):
 
 def get_adapter(format: TranscriptFormat) -> Type["TranscriptAdapter"]:
     """Retorna a classe do adaptador para o formato."""
-    return _ADAPTER_REGISTRY[format]
+    return _ADAPTER_REGISTRY[format][0]
 
 
 def get_all_adapters() -> Dict[TranscriptFormat, Type["TranscriptAdapter"]]:
     """Retorna todos os adaptadores registrados."""
-    return _ADAPTER_REGISTRY.copy()
+    return {format: entry[0] for format, entry in _ADAPTER_REGISTRY.items()}
+
+
+def get_registry_entries() -> ItemsView[
+    TranscriptFormat, Tuple[Type["TranscriptAdapter"], Callable[[dict], bool]]
+]:
+    """Retorna as entradas (formato, (classe, detect)) sem copiar o registro."""
+    return _ADAPTER_REGISTRY.items()
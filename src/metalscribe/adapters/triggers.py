@@ -0,0 +1,82 @@
+"""Compilação dos gatilhos de detecção (TRIGGERS) dos adaptadores."""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, List, NamedTuple, Tuple
+
+# "segments[0]" -> ("segments", "0")
+_PATH_PART = re.compile(r"^(\w+)(?:\[(\d+)\])?$")
+
+# Sentinela para campo ausente (distingue de valores None no JSON)
+MISSING = object()
+
+Predicate = Callable[[Any], bool]
+
+
+@lru_cache(maxsize=None)
+def parse_path(field: str) -> Tuple[str | int, ...]:
+    """
+    Converte um campo de TRIGGERS em caminho.
+
+    Exemplo: "segments[0].type" -> ("segments", 0, "type")
+
+    Raises:
+        ValueError: Se o campo não tiver sintaxe válida
+    """
+    path: List[str | int] = []
+    for part in field.split("."):
+        match = _PATH_PART.match(part)
+        if not match:
+            raise ValueError(f"Campo de gatilho inválido: {field}")
+        path.append(match.group(1))
+        if match.group(2) is not None:
+            path.append(int(match.group(2)))
+    return tuple(path)
+
+
+def resolve_path(data: Any, path: Tuple[str | int, ...]) -> Any:
+    """Percorre o JSON pelo caminho; retorna MISSING se algum passo não existir."""
+    value = data
+    for key in path:
+        if isinstance(key, int):
+            if not isinstance(value, list) or key >= len(value):
+                return MISSING
+        elif not isinstance(value, dict) or key not in value:
+            return MISSING
+        value = value[key]
+    return value
+
+
+def _make_predicate(trigger: dict) -> Predicate:
+    if "contains" in trigger:
+        needle = str(trigger["contains"]).lower()
+        return lambda value: isinstance(value, str) and needle in value.lower()
+    if "equals" in trigger:
+        expected = trigger["equals"]
+        return lambda value: value is not MISSING and value == expected
+    if "exists" in trigger:
+        should_exist = bool(trigger["exists"])
+        return lambda value: (value is not MISSING) == should_exist
+    raise ValueError(f"Gatilho sem operador (contains/equals/exists): {trigger}")
+
+
+class CompiledTrigger(NamedTuple):
+    """Gatilho pré-compilado: caminho já parseado e predicado pronto."""
+
+    path: Tuple[str | int, ...]
+    predicate: Predicate
+
+
+def compile_trigger(trigger: dict) -> CompiledTrigger:
+    """Compila um gatilho de TRIGGERS."""
+    return CompiledTrigger(path=parse_path(trigger["field"]), predicate=_make_predicate(trigger))
+
+
+def compile_triggers(triggers: List[dict]) -> List[CompiledTrigger]:
+    """
+    Pré-compila TRIGGERS de um adaptador.
+
+    Chamado uma vez no registro do adaptador; a detecção avalia os gatilhos
+    com short-circuit sem reinterpretar os dicts a cada chamada.
+    """
+    return [compile_trigger(trigger) for trigger in triggers]
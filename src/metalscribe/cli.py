@@ -1,38 +1,45 @@
 """CLI entry point using Click."""
 
+import importlib
+
 import click
 
 from metalscribe import __version__
-from metalscribe.commands.combine import combine
-from metalscribe.commands.context import context
-from metalscribe.commands.diarize import diarize
-from metalscribe.commands.doctor import doctor
-from metalscribe.commands.format_meeting import format_meeting
-from metalscribe.commands.refine import refine
-from metalscribe.commands.run import run
-from metalscribe.commands.run_meeting import run_meeting
-from metalscribe.commands.transcribe import transcribe
-
-
-@click.group()
+
+# Subcommands are imported only when invoked: command name -> (module, attribute)
+LAZY_COMMANDS = {
+    "doctor": ("metalscribe.commands.doctor", "doctor"),
+    "context": ("metalscribe.commands.context", "context"),
+    "transcribe": ("metalscribe.commands.transcribe", "transcribe"),
+    "diarize": ("metalscribe.commands.diarize", "diarize"),
+    "combine": ("metalscribe.commands.combine", "combine"),
+    "run": ("metalscribe.commands.run", "run"),
+    "run-meeting": ("metalscribe.commands.run_meeting", "run_meeting"),
+    "refine": ("metalscribe.commands.refine", "refine"),
+    "format-meeting": ("metalscribe.commands.format_meeting", "format_meeting"),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that defers importing subcommand modules until they are used."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *LAZY_COMMANDS])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in LAZY_COMMANDS:
+            module_name, attr_name = LAZY_COMMANDS[cmd_name]
+            return getattr(importlib.import_module(module_name), attr_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__, prog_name="metalscribe")
 def main() -> None:
     """metalscribe - CLI for audio transcription and diarization with GPU."""
     pass
 
 
-# Register commands
-main.add_command(doctor)
-main.add_command(context)
-main.add_command(transcribe)
-main.add_command(diarize)
-main.add_command(combine)
-main.add_command(run)
-main.add_command(run_meeting)
-main.add_command(refine)
-main.add_command(format_meeting)
-
-
 @main.command()
 def version() -> None:
     """Shows metalscribe version."""
@@ -4,15 +4,14 @@ import logging
 from pathlib import Path
 
 import click
-from rich.console import Console
 
 from metalscribe.core.merge import merge_segments
 from metalscribe.exporters.markdown_exporter import export_markdown
 from metalscribe.parsers.diarize_parser import parse_diarize_output
 from metalscribe.parsers.whisper_parser import parse_whisper_output
+from metalscribe.utils.console import console
 from metalscribe.utils.logging import log_timing, setup_logging
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 
@@ -76,8 +75,6 @@ def combine(transcript: Path, diarize: Path, output: Path, verbose: bool) -> Non
         else:
             base_name = stem
         output = transcript.parent / base_name
-    else:
-        output = Path(output)
 
     # Export only merged markdown (no .json or .srt)
     console.print("[cyan]Exporting markdown...[/cyan]")
@@ -6,12 +6,10 @@ from importlib import resources
 from pathlib import Path
 
 import click
-from rich.console import Console
 
 from metalscribe.config import ExitCode
 from metalscribe.core.context_validator import validate_context
-
-console = Console()
+from metalscribe.utils.console import console
 
 
 def _load_template() -> str:
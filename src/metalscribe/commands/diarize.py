@@ -1,17 +1,19 @@
 """Diarization command."""
 
 import logging
+import shutil
 from pathlib import Path
 
 import click
-from rich.console import Console
 
+from metalscribe.config import DIARIZATION_DEVICES
 from metalscribe.core.audio import convert_to_wav_16k
 from metalscribe.core.pyannote import run_diarization
 from metalscribe.exporters.json_exporter import export_json
+from metalscribe.utils.console import console
+from metalscribe.utils.files import make_work_dir
 from metalscribe.utils.logging import log_timing, setup_logging
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 
@@ -43,13 +45,41 @@ logger = logging.getLogger(__name__)
     default=None,
     help="Limit audio processing to X minutes (for testing)",
 )
+@click.option(
+    "--device",
+    type=click.Choice(DIARIZATION_DEVICES, case_sensitive=False),
+    default="auto",
+    show_default=True,
+    help="Diarization device (auto: MPS, then CUDA, then CPU)",
+)
+@click.option(
+    "--embedding-batch-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Diarization embedding batch size (lower it if the GPU runs out of memory)",
+)
+@click.option(
+    "--segmentation-batch-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Diarization segmentation batch size",
+)
 @click.option(
     "--verbose",
     "-v",
     is_flag=True,
     help="Verbose mode",
 )
-def diarize(input: Path, speakers: int, output: Path, limit: float, verbose: bool) -> None:
+def diarize(
+    input: Path,
+    speakers: int,
+    output: Path,
+    limit: float,
+    device: str,
+    embedding_batch_size: int | None,
+    segmentation_batch_size: int | None,
+    verbose: bool,
+) -> None:
     """Identifies speakers using pyannote.audio."""
     setup_logging(verbose=verbose)
 
@@ -57,15 +87,24 @@ def diarize(input: Path, speakers: int, output: Path, limit: float, verbose: boo
 
     start_time = time.time()
 
-    # Convert audio
-    wav_path = input.with_suffix(".wav")
+    # Convert audio into a private work dir (RAM-backed when available),
+    # removed when the command exits
+    work_dir = make_work_dir()
+    click.get_current_context().call_on_close(lambda: shutil.rmtree(work_dir, ignore_errors=True))
+    wav_path = work_dir / "audio.wav"
     convert_to_wav_16k(input, wav_path, limit_minutes=limit)
     conversion_time = time.time() - start_time
     log_timing("Audio conversion", conversion_time)
 
     # Diarize
     diarize_start = time.time()
-    segments = run_diarization(wav_path, num_speakers=speakers)
+    segments = run_diarization(
+        wav_path,
+        num_speakers=speakers,
+        device=device,
+        embedding_batch_size=embedding_batch_size,
+        segmentation_batch_size=segmentation_batch_size,
+    )
     diarize_time = time.time() - diarize_start
     log_timing("Diarization", diarize_time)
 
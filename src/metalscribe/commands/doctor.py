@@ -1,35 +1,29 @@
 """Doctor command for dependency verification and setup."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import click
-from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
-from metalscribe.core.checks import (
-    check_claude_code_auth,
-    check_claude_code_cli,
-    check_claude_code_sdk,
-    check_ffmpeg,
-    check_hf_token,
-    check_homebrew,
-    check_metal_available,
-    check_mps_available,
-    check_platform,
-    check_pyannote_installation,
-    check_python,
-    check_whisper_installation,
-)
-from metalscribe.core.setup import (
-    setup_claude_code_cli,
-    setup_claude_code_sdk,
-    setup_pyannote,
-    setup_whisper,
-)
+from metalscribe.utils.console import console
 
-console = Console()
 logger = logging.getLogger(__name__)
 
+# Status cells as Text, built once: no markup parsing per row
+STATUS_OK = Text("✓", style="green")
+STATUS_FAIL = Text("✗", style="red")
+
+
+def _make_status_table() -> Table:
+    """Returns a new dependency status table with its columns configured."""
+    table = Table(title="Dependency Status")
+    table.add_column("Component", style="cyan")
+    table.add_column("Status", justify="center")
+    table.add_column("Message", style="white")
+    return table
+
 
 @click.command()
 @click.option(
@@ -44,35 +38,56 @@ logger = logging.getLogger(__name__)
 )
 def doctor(check_only: bool, setup: bool) -> None:
     """Check and setup metalscribe dependencies."""
-    checks = [
-        check_platform(),
-        check_homebrew(),
-        check_python(),
-        check_ffmpeg(),
-        check_whisper_installation(),
-        check_pyannote_installation(),
-        check_metal_available(),
-        check_mps_available(),
-        check_hf_token(),
-        check_claude_code_cli(),
-        check_claude_code_sdk(),
-        check_claude_code_auth(),
-    ]
-
-    table = Table(title="Dependency Status")
-    table.add_column("Component", style="cyan")
-    table.add_column("Status", justify="center")
-    table.add_column("Message", style="white")
+    # Imported here so other commands (and `--help`) don't load the setup machinery
+    from metalscribe.core.checks import (
+        check_claude_code_auth,
+        check_claude_code_cli,
+        check_claude_code_sdk,
+        check_ffmpeg,
+        check_hf_token,
+        check_homebrew,
+        check_metal_available,
+        check_mps_available,
+        check_platform,
+        check_pyannote_installation,
+        check_python,
+        check_whisper_installation,
+    )
+    from metalscribe.core.setup import (
+        setup_claude_code_cli,
+        setup_claude_code_sdk,
+        setup_pyannote,
+        setup_whisper,
+    )
+
+    # Display order of the status table
+    check_fns = (
+        check_platform,
+        check_homebrew,
+        check_python,
+        check_ffmpeg,
+        check_whisper_installation,
+        check_pyannote_installation,
+        check_metal_available,
+        check_mps_available,
+        check_hf_token,
+        check_claude_code_cli,
+        check_claude_code_sdk,
+        check_claude_code_auth,
+    )
+
+    # Checks are independent and mostly wait on subprocesses, so run them
+    # concurrently; map() keeps results in check_fns order
+    with ThreadPoolExecutor(max_workers=len(check_fns)) as executor:
+        checks = list(executor.map(lambda check_fn: check_fn(), check_fns))
+    # Reused by the setup branch instead of probing each component again
+    results = dict(zip(check_fns, checks))
+
+    table = _make_status_table()
 
     all_ok = True
     for check in checks:
-        status = "✓" if check.status else "✗"
-        status_style = "green" if check.status else "red"
-        table.add_row(
-            check.name,
-            f"[{status_style}]{status}[/{status_style}]",
-            check.message,
-        )
+        table.add_row(check.name, STATUS_OK if check.status else STATUS_FAIL, check.message)
         if not check.status:
             all_ok = False
             if check.fix_hint:
@@ -92,59 +107,62 @@ def doctor(check_only: bool, setup: bool) -> None:
 
     if setup:
         console.print("[cyan]Starting setup...[/cyan]")
-
-        # Setup whisper
-        whisper_check = check_whisper_installation()
-        if not whisper_check.status:
-            console.print("[cyan]Configuring whisper.cpp...[/cyan]")
-            try:
-                setup_whisper()
-                console.print("[green]✓ whisper.cpp configured[/green]")
-            except Exception as e:
-                console.print(f"[red]✗ Error configuring whisper.cpp: {e}[/red]")
-                raise click.Abort()
-
-        # Setup pyannote
-        pyannote_check = check_pyannote_installation()
-        if not pyannote_check.status:
-            console.print("[cyan]Configuring pyannote.audio...[/cyan]")
-            try:
-                setup_pyannote()
-                console.print("[green]✓ pyannote.audio configured[/green]")
-            except Exception as e:
-                console.print(f"[red]✗ Error configuring pyannote.audio: {e}[/red]")
-                raise click.Abort()
-
-        # Setup Claude Code CLI
-        claude_cli_check = check_claude_code_cli()
-        if not claude_cli_check.status:
-            console.print("[cyan]Installing Claude Code CLI...[/cyan]")
-            try:
-                setup_claude_code_cli()
-                console.print("[green]✓ Claude Code CLI installed[/green]")
-            except Exception as e:
-                console.print(f"[red]✗ Error installing Claude Code CLI: {e}[/red]")
-                console.print("[yellow]You can install manually: npm install -g @anthropic-ai/claude-code[/yellow]")
-                # Não aborta, pois é opcional para alguns comandos
-
-        # Setup Claude Agent SDK
-        claude_sdk_check = check_claude_code_sdk()
-        if not claude_sdk_check.status:
-            console.print("[cyan]Installing Claude Agent SDK...[/cyan]")
-            try:
-                setup_claude_code_sdk()
-                console.print("[green]✓ Claude Agent SDK installed[/green]")
-            except Exception as e:
-                console.print(f"[red]✗ Error installing Claude Agent SDK: {e}[/red]")
-                console.print("[yellow]You can install manually: pip install claude-agent-sdk[/yellow]")
-                # Não aborta, pois é opcional para alguns comandos
+        # Each setup is guarded by the cached status only: a healthy
+        # component costs no extra probe, so setup is O(missing components).
+        # (setup, check, label, required, manual install hint)
+        setup_steps = (
+            (setup_whisper, check_whisper_installation, "whisper.cpp", True, None),
+            (setup_pyannote, check_pyannote_installation, "pyannote.audio", True, None),
+            (
+                setup_claude_code_cli,
+                check_claude_code_cli,
+                "Claude Code CLI",
+                False,
+                "npm install -g @anthropic-ai/claude-code",
+            ),
+            (
+                setup_claude_code_sdk,
+                check_claude_code_sdk,
+                "Claude Agent SDK",
+                False,
+                "pip install claude-agent-sdk",
+            ),
+        )
+        pending = [step for step in setup_steps if not results[step[1]].status]
+
+        # Setups are dominated by downloads and subprocesses (git clone,
+        # pip/npm install), so run them concurrently: total time is roughly
+        # the slowest setup instead of the sum
+        for _, _, label, _, _ in pending:
+            console.print(f"[cyan]Configuring {label}...[/cyan]")
+        failed = set()
+        with ThreadPoolExecutor(max_workers=max(len(pending), 1)) as executor:
+            futures = {executor.submit(step[0]): step for step in pending}
+            for future in as_completed(futures):
+                setup_fn, _, label, _, hint = futures[future]
+                try:
+                    future.result()
+                    console.print(f"[green]✓ {label} configured[/green]")
+                except Exception as e:
+                    failed.add(setup_fn)
+                    console.print(f"[red]✗ Error configuring {label}: {e}[/red]")
+                    if hint:
+                        console.print(f"[yellow]You can install manually: {hint}[/yellow]")
+
+        # Required components abort only after every setup has finished, so a
+        # failing whisper.cpp build doesn't leave the other installs half done.
+        # Claude CLI/SDK are optional for some commands and never abort.
+        if any(step[3] and step[0] in failed for step in pending):
+            raise click.Abort()
+
+        claude_cli_installed = (
+            results[check_claude_code_cli].status or setup_claude_code_cli not in failed
+        )
 
         # Verifica autenticação Claude Code (mas não força, apenas avisa)
-        claude_auth_check = check_claude_code_auth()
-        if not claude_auth_check.status:
-            # Verifica novamente se CLI está instalado após setup
-            claude_cli_check_after = check_claude_code_cli()
-            if claude_cli_check_after.status:
+        if not results[check_claude_code_auth].status:
+            # CLI instalado (antes ou pelo setup acima) mas sem login
+            if claude_cli_installed:
                 console.print("[yellow]⚠ Claude Code authentication required for LLM commands[/yellow]")
                 console.print("[dim]Run 'claude auth login' to authenticate[/dim]")
 
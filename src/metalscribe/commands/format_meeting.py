@@ -4,29 +4,32 @@ import logging
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from metalscribe.config import DEFAULT_PROMPT_LANGUAGE
-from metalscribe.core.format_meeting import (
-    estimate_tokens,
-    extract_language_from_metadata,
-    format_meeting_file,
-    get_language_warning,
-    load_format_meeting_prompt,
-)
-from metalscribe.llm import (
-    AuthenticationError,
-    CLINotInstalledError,
-    LLMError,
-    SDKNotInstalledError,
-)
-from metalscribe.utils.logging import setup_logging
+from metalscribe.utils.console import console
+from metalscribe.utils.metadata import read_body, read_header
 
-console = Console()
 logger = logging.getLogger(__name__)
 
+# Stem suffixes of earlier pipeline steps, replaced by "_05_formatted-meeting"
+# ("_03_merged" when the refine step was skipped)
+PIPELINE_SUFFIXES = ("_04_refined", "_03_merged")
+
+
+def _make_estimate_table(estimates: dict) -> Table:
+    """Builds the token estimate table shown before the confirmation prompt."""
+    table = Table(title="Token Estimate", show_header=True)
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", justify="right")
+    table.add_row("Input tokens", f"~{estimates['input_tokens']:,}")
+    table.add_row("Output tokens (est.)", f"~{estimates['output_tokens_estimate']:,}")
+    table.add_row("Total tokens (est.)", f"~{estimates['total_tokens_estimate']:,}")
+    table.add_row("", "")
+    table.add_row("Estimated cost", f"${estimates['total_cost_usd']:.2f} USD")
+    return table
+
 
 @click.command("format-meeting")
 @click.option(
@@ -118,11 +121,23 @@ def format_meeting(
         metalscribe format-meeting -i meeting.md --yes
         metalscribe format-meeting --import-transcript transcript.json -c context.md --yes
     """
-    setup_logging(verbose=verbose)
-
     import tempfile
     import time
 
+    # Imported here so `--help` and sibling commands don't pay for the LLM stack
+    from metalscribe.core.format_meeting import (
+        estimate_tokens,
+        format_meeting_file,
+        get_language_warning,
+        load_format_meeting_prompt,
+    )
+    from metalscribe.llm import (
+        AuthenticationError,
+        CLINotInstalledError,
+        LLMError,
+        SDKNotInstalledError,
+    )
+
     start_time = time.time()
 
     # Validate input options
@@ -136,9 +151,18 @@ def format_meeting(
         )
         raise click.Abort()
 
+    # After validation: option errors exit without configuring logging
+    from metalscribe.utils.logging import setup_logging
+
+    setup_logging(verbose=verbose)
+
     # Load domain context if provided
     domain_context = ""
-    if context:
+    if context and context.stat().st_size == 0:
+        # Nothing to inject; load_prompt drops the section for an empty context
+        console.print(f"[yellow]Context file is empty, ignoring: {context}[/yellow]")
+    elif context:
+        # Read once; the same string feeds the estimate prompt and, via prompt=, the LLM call
         domain_context = context.read_text(encoding="utf-8")
         console.print(f"[cyan]Using context file: {context} ({len(domain_context)} chars)[/cyan]")
 
@@ -153,8 +177,10 @@ def format_meeting(
             # Import segments
             merged = import_transcript_func(import_transcript)
 
-            # Create temporary markdown file
-            temp_md = Path(tempfile.mktemp(suffix=".md"))
+            # Create temporary markdown file (removed when the command exits)
+            with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as temp_file:
+                temp_md = Path(temp_file.name)
+            click.get_current_context().call_on_close(lambda: temp_md.unlink(missing_ok=True))
             prompt_language = DEFAULT_PROMPT_LANGUAGE
             metadata = {
                 "source": "imported",
@@ -176,13 +202,10 @@ def format_meeting(
         # Extract the base name without the numbered suffix if present
         # e.g., "audio_04_refined.md" -> "audio"
         stem = input.stem
-        if "_04_refined" in stem:
-            base_name = stem.replace("_04_refined", "")
-            output = input.parent / f"{base_name}_05_formatted-meeting.md"
-        elif "_03_merged" in stem:
-            # If refine step was skipped
-            base_name = stem.replace("_03_merged", "")
-            output = input.parent / f"{base_name}_05_formatted-meeting.md"
+        for suffix in PIPELINE_SUFFIXES:
+            if stem.endswith(suffix):
+                output = input.parent / f"{stem.removesuffix(suffix)}_05_formatted-meeting.md"
+                break
         else:
             # Fallback for files without the numbered pattern
             output = input.with_name(f"{stem}_05_formatted-meeting.md")
@@ -192,10 +215,8 @@ def format_meeting(
     console.print(f"[dim]Output: {output}[/dim]")
 
     try:
-        content = input.read_text(encoding="utf-8")
-
-        # Extract language from file metadata
-        file_language = extract_language_from_metadata(content)
+        # Only the header is needed for the language; the body is read below
+        file_language, _, body_offset = read_header(input)
         language = file_language or DEFAULT_PROMPT_LANGUAGE
         language_source = "file" if file_language else "default"
 
@@ -212,35 +233,21 @@ def format_meeting(
             )
 
         # Extract body (skip header)
-        lines = content.split("\n")
-        body_start_idx = 0
-        for i, line in enumerate(lines):
-            if line.strip() == "---":
-                body_start_idx = i + 1
-                break
-        body = "\n".join(lines[body_start_idx:]).strip()
+        body = read_body(input, body_offset)
 
         if not body:
             console.print("[red]Error: No content found in input file.[/red]")
             raise click.Abort()
 
-        # Load prompt for estimation
+        # Load prompt (for estimation and, via prompt=, the LLM call)
         prompt = load_format_meeting_prompt(language, domain_context=domain_context)
 
-        # Estimate tokens
-        estimates = estimate_tokens(body, prompt)
-
-        # Display token estimate
-        console.print()
-        table = Table(title="Token Estimate", show_header=True)
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", justify="right")
-        table.add_row("Input tokens", f"~{estimates['input_tokens']:,}")
-        table.add_row("Output tokens (est.)", f"~{estimates['output_tokens_estimate']:,}")
-        table.add_row("Total tokens (est.)", f"~{estimates['total_tokens_estimate']:,}")
-        table.add_row("", "")
-        table.add_row("Estimated cost", f"${estimates['total_cost_usd']:.2f} USD")
-        console.print(table)
+        # Display token estimate, unless --yes already skipped the confirmation
+        # (verbose runs still show it; format_meeting_text logs it either way)
+        if not yes or verbose:
+            estimates = estimate_tokens(body, prompt)
+            console.print()
+            console.print(_make_estimate_table(estimates))
 
         # Confirmation prompt
         if not yes:
@@ -266,6 +273,7 @@ def format_meeting(
             model=model,
             language=language,
             domain_context=domain_context,
+            prompt=prompt,
         )
 
         elapsed = time.time() - start_time
@@ -4,9 +4,9 @@ import logging
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 
+from metalscribe.config import DEFAULT_REFINE_PARALLELISM
 from metalscribe.core.refine import get_language_warning, refine_markdown_file
 from metalscribe.llm import (
     AuthenticationError,
@@ -14,9 +14,9 @@ from metalscribe.llm import (
     LLMError,
     SDKNotInstalledError,
 )
+from metalscribe.utils.console import console
 from metalscribe.utils.logging import setup_logging
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +48,23 @@ logger = logging.getLogger(__name__)
     default=None,
     help="Specific model (uses Claude Code default if not specified)",
 )
+@click.option(
+    "--parallelism",
+    type=click.IntRange(min=1),
+    default=DEFAULT_REFINE_PARALLELISM,
+    show_default=True,
+    help="Maximum number of chunks refined concurrently",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Query the LLM for every chunk, ignoring previously refined chunks",
+)
+@click.option(
+    "--edits-only",
+    is_flag=True,
+    help="Ask the LLM for the corrected lines only instead of the whole text (faster)",
+)
 @click.option(
     "--verbose",
     "-v",
@@ -59,6 +76,9 @@ def refine(
     import_transcript: Path | None,
     output: Path,
     model: str,
+    parallelism: int,
+    no_cache: bool,
+    edits_only: bool,
     verbose: bool,
 ) -> None:
     """
@@ -79,6 +99,7 @@ def refine(
     Examples:
         metalscribe refine -i transcription.md
         metalscribe refine -i transcription.md -o refined.md
+        metalscribe refine -i transcription.md --edits-only
         metalscribe refine --import-transcript transcript.json -o refined.md
     """
     setup_logging(verbose=verbose)
@@ -111,8 +132,10 @@ def refine(
             # Import segments
             merged = import_transcript_func(import_transcript)
 
-            # Create temporary markdown file
-            temp_md = Path(tempfile.mktemp(suffix=".md"))
+            # Create temporary markdown file (removed when the command exits)
+            with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as temp_file:
+                temp_md = Path(temp_file.name)
+            click.get_current_context().call_on_close(lambda: temp_md.unlink(missing_ok=True))
             prompt_language = DEFAULT_PROMPT_LANGUAGE
             metadata = {
                 "source": "imported",
@@ -150,6 +173,9 @@ def refine(
             input_path=input,
             output_path=output,
             model=model,
+            parallelism=parallelism,
+            use_cache=not no_cache,
+            edits_only=edits_only,
         )
 
         # Show language notice after processing
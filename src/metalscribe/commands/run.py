@@ -1,28 +1,61 @@
 """Run command - full pipeline."""
 
+import json
 import logging
-import tempfile
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import click
-from rich.console import Console
-
-from metalscribe.config import DEFAULT_LANGUAGE, get_prompt_language
-from metalscribe.core.audio import convert_to_wav_16k
-from metalscribe.core.merge import merge_segments
-from metalscribe.core.pyannote import run_diarization
-from metalscribe.core.whisper import run_transcription
-from metalscribe.exporters.json_exporter import (
-    export_diarize_json,
-    export_transcript_json,
-)
-from metalscribe.exporters.markdown_exporter import export_markdown
-from metalscribe.utils.audio_info import get_audio_duration
-from metalscribe.utils.logging import format_duration, log_timing, setup_logging
 
-console = Console()
+from metalscribe.config import DEFAULT_LANGUAGE, DIARIZATION_DEVICES, get_prompt_language
+from metalscribe.utils.console import console
+from metalscribe.utils.files import atomic_write_text, make_work_dir
+from metalscribe.utils.logging import format_timing, log_timing, setup_logging, timed
+
 logger = logging.getLogger(__name__)
 
+# Output formats selectable with --formats ("all" selects every one)
+EXPORT_FORMATS = ("md", "json", "srt")
+DEFAULT_EXPORT_FORMATS = "md,json"
+
+
+def _parse_formats(ctx: click.Context, param: click.Parameter, value: str) -> tuple[str, ...]:
+    """Parses a comma-separated --formats value into a sorted tuple of formats."""
+    formats = {item.strip().lower() for item in value.split(",") if item.strip()}
+    if "all" in formats:
+        return tuple(sorted(EXPORT_FORMATS))
+    unknown = formats - set(EXPORT_FORMATS)
+    if unknown or not formats:
+        raise click.BadParameter(
+            f"expected a comma-separated list of {', '.join(EXPORT_FORMATS)} or 'all'"
+        )
+    return tuple(sorted(formats))
+
+
+def _run_fingerprint(input: Path, **params) -> dict:
+    """Identifies a run: input file identity (path, size, mtime) plus the parameters."""
+    stat = input.stat()
+    return {
+        "input": str(input.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "params": params,
+    }
+
+
+def _outputs_fresh(meta_path: Path, fingerprint: dict, outputs: tuple) -> bool:
+    """True if a previous run with the same fingerprint left all its outputs in place."""
+    try:
+        if json.loads(meta_path.read_text(encoding="utf-8")) != fingerprint:
+            return False
+        input_mtime = fingerprint["mtime_ns"]
+        return all(path.stat().st_mtime_ns >= input_mtime for path in outputs)
+    except (OSError, ValueError):
+        return False
+
 
 @click.command()
 @click.option(
@@ -100,17 +133,86 @@ logger = logging.getLogger(__name__)
     default=None,
     help="Limit audio processing to X minutes (for testing)",
 )
+@click.option(
+    "--device",
+    type=click.Choice(DIARIZATION_DEVICES, case_sensitive=False),
+    default="auto",
+    show_default=True,
+    help="Diarization device (auto: MPS, then CUDA, then CPU)",
+)
+@click.option(
+    "--embedding-batch-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Diarization embedding batch size (lower it if the GPU runs out of memory)",
+)
+@click.option(
+    "--segmentation-batch-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Diarization segmentation batch size",
+)
+@click.option(
+    "--formats",
+    type=str,
+    default=DEFAULT_EXPORT_FORMATS,
+    callback=_parse_formats,
+    show_default=True,
+    help="Outputs to write: md (merged markdown), json (transcript and diarization "
+    "JSON), srt (merged subtitles), or all",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always rerun every stage, ignoring cached results and up-to-date outputs",
+)
 @click.option(
     "--verbose",
     "-v",
     is_flag=True,
     help="Verbose mode",
 )
-def run(input: Path, model: str, lang: str, speakers: int, output: Path, limit: float, verbose: bool) -> None:
+def run(
+    input: Path,
+    model: str,
+    lang: str,
+    speakers: int,
+    output: Path,
+    limit: float,
+    device: str,
+    embedding_batch_size: int | None,
+    segmentation_batch_size: int | None,
+    formats: tuple[str, ...],
+    no_cache: bool,
+    verbose: bool,
+) -> None:
     """Full pipeline: transcription + diarization + merge + export."""
     setup_logging(verbose=verbose)
 
-    import time
+    # Imported here so `--help` and sibling commands don't load the pipeline
+    # (whisper pulls in the optional faster-whisper/CTranslate2 stack)
+    from metalscribe.core import stage_cache
+    from metalscribe.core.audio import convert_to_wav_16k
+    from metalscribe.core.merge import merge_segments
+    from metalscribe.core.pyannote import run_diarization
+    from metalscribe.core.stage_cache import (
+        audio_digest,
+        diarize_cache_path,
+        lookup_source,
+        remember_source,
+        run_cached_stage,
+        transcript_cache_path,
+    )
+    from metalscribe.core.whisper import run_transcription
+    from metalscribe.exporters.json_exporter import (
+        export_diarize_json,
+        export_transcript_json,
+    )
+    from metalscribe.exporters.markdown_exporter import export_markdown
+    from metalscribe.exporters.srt_exporter import export_srt
+    from metalscribe.parsers.diarize_parser import parse_diarize_output
+    from metalscribe.parsers.whisper_parser import parse_whisper_output
+    from metalscribe.utils.audio_info import get_audio_duration
 
     start_time = time.time()
 
@@ -118,51 +220,125 @@ def run(input: Path, model: str, lang: str, speakers: int, output: Path, limit:
     if output is None:
         # Use input stem as base for output files
         output = input.parent / input.stem
-    else:
-        output = Path(output)
 
-    # Get audio duration to calculate RTF
-    # Note: If limited, we should use the limit as duration for RTF calc if it's smaller than actual duration
-    actual_duration = get_audio_duration(input)
-    audio_duration = actual_duration
-    if limit:
-        limit_seconds = limit * 60
-        if limit_seconds < actual_duration:
-            audio_duration = limit_seconds
+    # New naming convention:
+    # 1. audio_01_transcript.json
+    # 2. audio_02_diarize.json
+    # 3. audio_03_merged.md (and audio_03_merged.srt)
+    # 6. audio_06_timings.log
+    transcript_json_path = output.parent / f"{output.stem}_01_transcript.json"
+    diarize_json_path = output.parent / f"{output.stem}_02_diarize.json"
+    merged_md_path = output.parent / f"{output.stem}_03_merged.md"
+    merged_srt_path = output.parent / f"{output.stem}_03_merged.srt"
+    timings_log = output.parent / f"{output.stem}_06_timings.log"
+    # Only the requested formats are serialized and written
+    outputs = (
+        ((transcript_json_path, diarize_json_path) if "json" in formats else ())
+        + ((merged_md_path,) if "md" in formats else ())
+        + ((merged_srt_path,) if "srt" in formats else ())
+        + (timings_log,)
+    )
+
+    # make-style freshness: skip everything if the outputs were produced from
+    # this same input file with the same parameters
+    run_meta_path = output.parent / f".{output.stem}_run.meta.json"
+    fingerprint = _run_fingerprint(
+        input, model=model, lang=lang, speakers=speakers, limit=limit, formats=list(formats)
+    )
+    if not no_cache and _outputs_fresh(run_meta_path, fingerprint, outputs):
+        console.print("[green]✓ Outputs are up to date (cached), nothing to do[/green]")
+        for path in outputs:
+            console.print(f"  - {path}")
+        return
 
     # Step 1: Audio conversion
     console.print("[cyan]Step 1: Converting audio...[/cyan]")
-    wav_path = Path(tempfile.mktemp(suffix=".wav"))
-    convert_start = time.time()
-    convert_to_wav_16k(input, wav_path, limit_minutes=limit)
-    convert_time = time.time() - convert_start
-    convert_rtf = convert_time / audio_duration if audio_duration > 0 else None
-    log_timing("Conversion", convert_time, rtf=convert_rtf)
-
-    # Step 2: Transcription
+    # Intermediates live in a private work dir (RAM-backed when available)
+    # that is removed when the command exits
+    work_dir = make_work_dir()
+    click.get_current_context().call_on_close(lambda: shutil.rmtree(work_dir, ignore_errors=True))
+    wav_path = work_dir / "audio.wav"
+    # An unchanged source (same path, size, mtime and --limit) whose stages are
+    # both cached needs no WAV: its digest and duration were recorded when it
+    # was last converted
+    source = None if no_cache else lookup_source(input, limit)
+    if (
+        source
+        and transcript_cache_path(source["digest"], model, lang).exists()
+        and diarize_cache_path(source["digest"], speakers).exists()
+    ):
+        digest, audio_duration = source["digest"], source["duration"]
+        convert_time, convert_rtf = 0.0, None
+        console.print("[dim]Input unchanged and stages cached, conversion skipped[/dim]")
+    else:
+        convert_start = time.time()
+        convert_to_wav_16k(input, wav_path, limit_minutes=limit)
+        convert_time = time.time() - convert_start
+        # RTFs use the converted WAV's duration, read from its header: already
+        # capped by --limit, and no ffprobe run on the original container
+        audio_duration = get_audio_duration(wav_path)
+        convert_rtf = convert_time / audio_duration if audio_duration > 0 else None
+        log_timing("Conversion", convert_time, rtf=convert_rtf)
+        # Reuse earlier outputs for the same audio content and parameters
+        digest = None if no_cache else audio_digest(wav_path)
+        if digest:
+            remember_source(input, limit, digest, audio_duration)
+
+    # Steps 2 and 3 only share the read-only WAV and each wait on their own
+    # subprocess (whisper-cli / the pyannote venv), so they run concurrently:
+    # wall time is max(transcription, diarization) instead of the sum
     console.print("[cyan]Step 2: Transcribing...[/cyan]")
-    transcript_json = Path(tempfile.mktemp(suffix=".json"))
-    transcribe_start = time.time()
-    transcript_base = transcript_json.parent / transcript_json.stem
-    transcript_segments = run_transcription(
-        wav_path,
-        model_name=model,
-        language=lang,
-        output_base=transcript_base,
-        verbose=verbose,
-    )
-    transcribe_time = time.time() - transcribe_start
+    console.print("[cyan]Step 3: Diarizing...[/cyan]")
+    transcript_base = work_dir / "transcript"
+    transcript_json = transcript_base.with_suffix(".json")
+    diarize_json = work_dir / "diarize.json"
+    parallel_start = time.time()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        transcribe_future = executor.submit(
+            timed,
+            run_cached_stage,
+            digest and transcript_cache_path(digest, model, lang),
+            transcript_json,
+            partial(
+                run_transcription,
+                wav_path,
+                model_name=model,
+                language=lang,
+                output_base=transcript_base,
+                verbose=verbose,
+            ),
+            parse_whisper_output,
+        )
+        diarize_future = executor.submit(
+            timed,
+            run_cached_stage,
+            digest and diarize_cache_path(digest, speakers),
+            diarize_json,
+            partial(
+                run_diarization,
+                wav_path,
+                num_speakers=speakers,
+                output_json=diarize_json,
+                device=device,
+                embedding_batch_size=embedding_batch_size,
+                segmentation_batch_size=segmentation_batch_size,
+            ),
+            parse_diarize_output,
+        )
+        transcript_segments, transcribe_time = transcribe_future.result()
+        diarize_segments, diarize_time = diarize_future.result()
+
     transcribe_rtf = transcribe_time / audio_duration if audio_duration > 0 else None
     log_timing("Transcription", transcribe_time, rtf=transcribe_rtf)
-
-    # Step 3: Diarization
-    console.print("[cyan]Step 3: Diarizing...[/cyan]")
-    diarize_json = Path(tempfile.mktemp(suffix=".json"))
-    diarize_start = time.time()
-    diarize_segments = run_diarization(wav_path, num_speakers=speakers, output_json=diarize_json)
-    diarize_time = time.time() - diarize_start
     diarize_rtf = diarize_time / audio_duration if audio_duration > 0 else None
     log_timing("Diarization", diarize_time, rtf=diarize_rtf)
+    # Wall time of both stages together (the slower one, not their sum)
+    log_timing("Transcription + Diarization (parallel)", time.time() - parallel_start)
+    if digest:
+        console.print(
+            f"[dim]Stage cache: {stage_cache.stats['hits']} hits, "
+            f"{stage_cache.stats['misses']} misses[/dim]"
+        )
 
     # Step 4: Merge
     console.print("[cyan]Step 4: Combining...[/cyan]")
@@ -175,73 +351,88 @@ def run(input: Path, model: str, lang: str, speakers: int, output: Path, limit:
     console.print("[cyan]Step 5: Exporting...[/cyan]")
     export_start = time.time()
 
-    # New naming convention:
-    # 1. audio_01_transcript.json
-    # 2. audio_02_diarize.json
-    # 3. audio_03_merged.md
-    transcript_json_path = output.parent / f"{output.stem}_01_transcript.json"
-    diarize_json_path = output.parent / f"{output.stem}_02_diarize.json"
-    merged_md_path = output.parent / f"{output.stem}_03_merged.md"
-
     # Resolve prompt language from Whisper language code
     prompt_language = get_prompt_language(lang)
 
+    # The markdown carries all run metadata; each JSON export the subset that
+    # applies to it. Shared values are computed once so the three stay in sync
+    input_file = str(input)
+    num_speakers = speakers or "auto"
     metadata = {
         "model": model,
         "language": lang,
         "prompt_language": prompt_language,
-        "num_speakers": speakers or "auto",
-        "input_file": str(input),
+        "num_speakers": num_speakers,
+        "input_file": input_file,
     }
 
     # Export transcription only (without speaker info)
-    transcript_metadata = {
-        "model": model,
-        "language": lang,
-        "input_file": str(input),
-    }
-    export_transcript_json(transcript_segments, transcript_json_path, metadata=transcript_metadata)
+    transcript_metadata = {"model": model, "language": lang, "input_file": input_file}
 
     # Export diarization only (speaker info only)
-    diarize_metadata = {
-        "num_speakers": speakers or "auto",
-        "input_file": str(input),
-    }
-    export_diarize_json(diarize_segments, diarize_json_path, metadata=diarize_metadata)
+    diarize_metadata = {"num_speakers": num_speakers, "input_file": input_file}
 
-    # Export merged markdown only (no .json or .srt)
-    export_markdown(merged, merged_md_path, title=input.stem, metadata=metadata)
+    # The exporters only read the segments and write their own file (no
+    # shared state besides logging), so formatting and disk writes overlap
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        export_futures = []
+        if "json" in formats:
+            export_futures.append(
+                executor.submit(
+                    export_transcript_json,
+                    transcript_segments,
+                    transcript_json_path,
+                    metadata=transcript_metadata,
+                )
+            )
+            export_futures.append(
+                executor.submit(
+                    export_diarize_json,
+                    diarize_segments,
+                    diarize_json_path,
+                    metadata=diarize_metadata,
+                )
+            )
+        if "md" in formats:
+            export_futures.append(
+                executor.submit(
+                    export_markdown, merged, merged_md_path, title=input.stem, metadata=metadata
+                )
+            )
+        if "srt" in formats:
+            export_futures.append(executor.submit(export_srt, merged, merged_srt_path))
+        for future in export_futures:
+            future.result()
 
     export_time = time.time() - export_start
     log_timing("Export", export_time)
 
     # Timings log (06_timings.log)
-    timings_log = output.parent / f"{output.stem}_06_timings.log"
     total_time = time.time() - start_time
     total_rtf = total_time / audio_duration if audio_duration > 0 else None
-    with open(timings_log, "w") as f:
-        f.write(f"Audio duration: {format_duration(audio_duration)} ({audio_duration:.2f}s)\n")
-        f.write(f"\nConversion: {format_duration(convert_time)} ({convert_time:.2f}s)")
-        if convert_rtf:
-            f.write(f" (RTF: {convert_rtf:.3f})")
-        f.write(f"\nTranscription: {format_duration(transcribe_time)} ({transcribe_time:.2f}s)")
-        if transcribe_rtf:
-            f.write(f" (RTF: {transcribe_rtf:.3f})")
-        f.write(f"\nDiarization: {format_duration(diarize_time)} ({diarize_time:.2f}s)")
-        if diarize_rtf:
-            f.write(f" (RTF: {diarize_rtf:.3f})")
-        f.write(f"\nMerge: {format_duration(merge_time)} ({merge_time:.2f}s)\n")
-        f.write(f"Export: {format_duration(export_time)} ({export_time:.2f}s)\n")
-        f.write(f"\nTotal: {format_duration(total_time)} ({total_time:.2f}s)")
-        if total_rtf:
-            f.write(f" (RTF: {total_rtf:.3f})")
-        f.write("\n")
+    report = [
+        format_timing("Audio duration", audio_duration),
+        "",
+        format_timing("Conversion", convert_time, convert_rtf),
+        format_timing("Transcription", transcribe_time, transcribe_rtf),
+        format_timing("Diarization", diarize_time, diarize_rtf),
+        format_timing("Merge", merge_time),
+        format_timing("Export", export_time),
+        "",
+        format_timing("Total", total_time, total_rtf),
+    ]
+    # Built in memory and written in one call, atomically
+    atomic_write_text(timings_log, "\n".join(report) + "\n")
 
     log_timing("Total", total_time)
 
+    # Written last and atomically: an interrupted run never looks fresh
+    try:
+        atomic_write_text(run_meta_path, json.dumps(fingerprint))
+    except OSError as e:
+        logger.debug(f"Could not write {run_meta_path}: {e}")
+
     console.print("\n[green]✓ Pipeline complete![/green]")
     console.print("[green]Generated files:[/green]")
-    console.print(f"  - {transcript_json_path}")
-    console.print(f"  - {diarize_json_path}")
-    console.print(f"  - {merged_md_path}")
-    console.print(f"  - {timings_log}")
+    for path in outputs:
+        console.print(f"  - {path}")
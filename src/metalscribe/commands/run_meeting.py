@@ -1,44 +1,24 @@
 """Run meeting command - full pipeline with refine and format-meeting."""
 
 import logging
-import tempfile
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from metalscribe.config import DEFAULT_LANGUAGE, DEFAULT_PROMPT_LANGUAGE, get_prompt_language
-from metalscribe.core.audio import convert_to_wav_16k
-from metalscribe.core.context_validator import validate_context
-from metalscribe.core.format_meeting import (
-    estimate_tokens,
-    format_meeting_file,
-    get_language_warning,
-    load_format_meeting_prompt,
+from metalscribe.config import (
+    DEFAULT_LANGUAGE,
+    DIARIZATION_DEVICES,
+    get_prompt_language,
 )
-from metalscribe.core.merge import merge_segments
-from metalscribe.core.pyannote import run_diarization
-from metalscribe.core.refine import get_language_warning as get_refine_language_warning
-from metalscribe.core.refine import refine_markdown_file
-from metalscribe.core.whisper import run_transcription
-from metalscribe.exporters.json_exporter import (
-    export_diarize_json,
-    export_transcript_json,
-)
-from metalscribe.exporters.markdown_exporter import export_markdown
-from metalscribe.llm import (
-    AuthenticationError,
-    CLINotInstalledError,
-    LLMError,
-    SDKNotInstalledError,
-)
-from metalscribe.utils.audio_info import get_audio_duration
-from metalscribe.utils.logging import format_duration, log_timing, setup_logging
-from metalscribe.utils.metadata import extract_language_from_metadata
+from metalscribe.utils.console import console
+from metalscribe.utils.files import atomic_write_text, make_work_dir
+from metalscribe.utils.logging import format_timing, log_timing, setup_logging, timed
+from metalscribe.utils.metadata import parse_md_header
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 
@@ -137,12 +117,37 @@ logger = logging.getLogger(__name__)
     is_flag=True,
     help="Skip token confirmation prompt for format-meeting",
 )
+@click.option(
+    "--skip-refine-if-clean",
+    is_flag=True,
+    help="Skip the LLM refinement when no repetition loops or Whisper boilerplate "
+    "are found in the transcript",
+)
 @click.option(
     "--limit",
     type=float,
     default=None,
     help="Limit audio processing to X minutes (for testing)",
 )
+@click.option(
+    "--device",
+    type=click.Choice(DIARIZATION_DEVICES, case_sensitive=False),
+    default="auto",
+    show_default=True,
+    help="Diarization device (auto: MPS, then CUDA, then CPU)",
+)
+@click.option(
+    "--embedding-batch-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Diarization embedding batch size (lower it if the GPU runs out of memory)",
+)
+@click.option(
+    "--segmentation-batch-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Diarization segmentation batch size",
+)
 @click.option(
     "--verbose",
     "-v",
@@ -159,7 +164,11 @@ def run_meeting(
     llm_model: str,
     context: Path | None,
     yes: bool,
+    skip_refine_if_clean: bool,
     limit: float,
+    device: str,
+    embedding_batch_size: int | None,
+    segmentation_batch_size: int | None,
     verbose: bool,
 ) -> None:
     """
@@ -176,6 +185,35 @@ def run_meeting(
 
     import time
 
+    # Imported here so `--help` and sibling commands don't load the pipeline
+    # and LLM stacks (whisper pulls in the optional faster-whisper/CTranslate2)
+    from metalscribe.core.audio import convert_to_wav_16k
+    from metalscribe.core.context_validator import validate_context
+    from metalscribe.core.format_meeting import (
+        estimate_tokens,
+        format_meeting_file,
+        get_language_warning,
+        load_format_meeting_prompt,
+    )
+    from metalscribe.core.merge import merge_segments
+    from metalscribe.core.pyannote import run_diarization
+    from metalscribe.core.refine import get_language_warning as get_refine_language_warning
+    from metalscribe.core.refine import needs_refine, refine_markdown
+    from metalscribe.core.whisper import preload_model, run_transcription
+    from metalscribe.exporters.json_exporter import (
+        export_diarize_json,
+        export_transcript_json,
+    )
+    from metalscribe.exporters.markdown_exporter import export_markdown
+    from metalscribe.llm import (
+        AuthenticationError,
+        CLINotInstalledError,
+        LLMError,
+        SDKNotInstalledError,
+        warm_up_authentication,
+    )
+    from metalscribe.utils.audio_info import get_audio_duration
+
     start_time = time.time()
 
     # Validate input options
@@ -209,6 +247,10 @@ def run_meeting(
             )
             raise click.Abort()
 
+    # Verify the LLM setup (CLI lookup + test query) while Steps 1-5 run,
+    # so refine's first query doesn't wait for it
+    warm_up_authentication()
+
     # Determine output prefix
     if output is None:
         # Use input stem as base for output files
@@ -216,318 +258,372 @@ def run_meeting(
             output = import_transcript.parent / import_transcript.stem
         else:
             output = input.parent / input.stem
-    else:
-        output = Path(output)
-
-    # Branch: Import transcript or run full pipeline
-    if import_transcript:
-        # Import mode: skip Steps 1-4
-        console.print(f"[cyan]Importing transcript from: {import_transcript}[/cyan]")
-        from metalscribe.adapters import import_transcript as import_transcript_func
 
-        try:
-            import_start = time.time()
-            merged = import_transcript_func(import_transcript)
-            import_time = time.time() - import_start
-            log_timing("Import", import_time)
-        except ValueError as e:
-            console.print(f"[red]Error importing transcript: {e}[/red]")
-            raise click.Abort()
-
-        # Export merged markdown
-        console.print("[cyan]Exporting imported transcript...[/cyan]")
-        export_start = time.time()
-        merged_md_path = output.parent / f"{output.stem}_03_merged.md"
-
-        # Resolve prompt language (use CLI arg or default)
-        prompt_language = get_prompt_language(lang) if lang else DEFAULT_PROMPT_LANGUAGE
-
-        metadata = {
-            "source": "imported",
-            "import_file": str(import_transcript),
-            "prompt_language": prompt_language,
-        }
-        if lang:
-            metadata["language"] = lang
-
-        export_markdown(merged, merged_md_path, title=output.stem, metadata=metadata)
-        export_time = time.time() - export_start
-        log_timing("Export", export_time)
-
-        # Set timing variables for later use (not applicable in import mode)
-        convert_time = None
-        transcribe_time = None
-        diarize_time = None
-        merge_time = None
-        audio_duration = None
+    # Output files, resolved once (naming convention):
+    # 1. audio_01_transcript.json
+    # 2. audio_02_diarize.json
+    # 3. audio_03_merged.md
+    # 4. audio_04_refined.md
+    # 5. audio_05_formatted-meeting.md
+    # 6. audio_06_timings.log
+    transcript_json_path = output.parent / f"{output.stem}_01_transcript.json"
+    diarize_json_path = output.parent / f"{output.stem}_02_diarize.json"
+    merged_md_path = output.parent / f"{output.stem}_03_merged.md"
+    refined_md_path = output.parent / f"{output.stem}_04_refined.md"
+    formatted_md_path = output.parent / f"{output.stem}_05_formatted-meeting.md"
+    timings_log = output.parent / f"{output.stem}_06_timings.log"
 
-    else:
-        # Normal mode: run full pipeline
-        # Get audio duration to calculate RTF
-        # Note: If limited, we should use the limit as duration for RTF calc if it's smaller than actual duration
-        actual_duration = get_audio_duration(input)
-        audio_duration = actual_duration
-        if limit:
-            limit_seconds = limit * 60
-            if limit_seconds < actual_duration:
-                audio_duration = limit_seconds
-
-        # Step 1: Audio conversion
-        console.print("[cyan]Step 1: Converting audio...[/cyan]")
-        wav_path = Path(tempfile.mktemp(suffix=".wav"))
-        convert_start = time.time()
-        convert_to_wav_16k(input, wav_path, limit_minutes=limit)
-        convert_time = time.time() - convert_start
-        convert_rtf = convert_time / audio_duration if audio_duration > 0 else None
-        log_timing("Conversion", convert_time, rtf=convert_rtf)
-
-        # Step 2: Transcription
-        console.print("[cyan]Step 2: Transcribing...[/cyan]")
-        transcript_json = Path(tempfile.mktemp(suffix=".json"))
-        transcript_base = transcript_json.parent / transcript_json.stem
-        transcribe_start = time.time()
-        transcript_segments = run_transcription(
-            wav_path,
-            model_name=model,
-            language=lang,
-            output_base=transcript_base,
-            verbose=verbose,
-        )
-        transcribe_time = time.time() - transcribe_start
-        transcribe_rtf = transcribe_time / audio_duration if audio_duration > 0 else None
-        log_timing("Transcription", transcribe_time, rtf=transcribe_rtf)
-
-        # Step 3: Diarization
-        console.print("[cyan]Step 3: Diarizing...[/cyan]")
-        diarize_json = Path(tempfile.mktemp(suffix=".json"))
-        diarize_start = time.time()
-        diarize_segments = run_diarization(
-            wav_path, num_speakers=speakers, output_json=diarize_json
-        )
-        diarize_time = time.time() - diarize_start
-        diarize_rtf = diarize_time / audio_duration if audio_duration > 0 else None
-        log_timing("Diarization", diarize_time, rtf=diarize_rtf)
-
-        # Step 4: Merge
-        console.print("[cyan]Step 4: Combining...[/cyan]")
-        merge_start = time.time()
-        merged = merge_segments(transcript_segments, diarize_segments)
-        merge_time = time.time() - merge_start
-        log_timing("Merge", merge_time)
-
-        # Step 5: Export
-        console.print("[cyan]Step 5: Exporting...[/cyan]")
-        export_start = time.time()
-
-        # New naming convention:
-        # 1. audio_01_transcript.json
-        # 2. audio_02_diarize.json
-        # 3. audio_03_merged.md
-        transcript_json_path = output.parent / f"{output.stem}_01_transcript.json"
-        diarize_json_path = output.parent / f"{output.stem}_02_diarize.json"
-        merged_md_path = output.parent / f"{output.stem}_03_merged.md"
-
-        # Resolve prompt language from Whisper language code
-        prompt_language = get_prompt_language(lang)
-
-        metadata = {
-            "model": model,
-            "language": lang,
-            "prompt_language": prompt_language,
-            "num_speakers": speakers or "auto",
-            "input_file": str(input),
-        }
-
-        # Export transcription only (without speaker info)
-        transcript_metadata = {
-            "model": model,
-            "language": lang,
-            "input_file": str(input),
-        }
-        export_transcript_json(
-            transcript_segments, transcript_json_path, metadata=transcript_metadata
-        )
+    # Prompt language for the exported metadata and Step 7, resolved once for
+    # both branches (DEFAULT_PROMPT_LANGUAGE when --lang is not given)
+    prompt_language = get_prompt_language(lang)
 
-        # Export diarization only (speaker info only)
-        diarize_metadata = {
-            "num_speakers": speakers or "auto",
-            "input_file": str(input),
-        }
-        export_diarize_json(diarize_segments, diarize_json_path, metadata=diarize_metadata)
+    # Background JSON exports (Step 5), joined in the finally below so they are
+    # checked however the later steps end
+    json_export_futures = []
+    try:
+        # Branch: Import transcript or run full pipeline
+        if import_transcript:
+            # Import mode: skip Steps 1-4
+            console.print(f"[cyan]Importing transcript from: {import_transcript}[/cyan]")
+            from metalscribe.adapters import import_transcript as import_transcript_func
+
+            try:
+                import_start = time.time()
+                merged = import_transcript_func(import_transcript)
+                import_time = time.time() - import_start
+                log_timing("Import", import_time)
+            except ValueError as e:
+                console.print(f"[red]Error importing transcript: {e}[/red]")
+                raise click.Abort()
 
-        # Export merged markdown only (no .json or .srt)
-        export_markdown(merged, merged_md_path, title=input.stem, metadata=metadata)
+            # Export merged markdown
+            console.print("[cyan]Exporting imported transcript...[/cyan]")
+            export_start = time.time()
 
-        export_time = time.time() - export_start
-        log_timing("Export", export_time)
+            metadata = {
+                "source": "imported",
+                "import_file": str(import_transcript),
+                "prompt_language": prompt_language,
+            }
+            if lang:
+                metadata["language"] = lang
 
-    # Step 6: Refine
-    console.print("\n[cyan]Step 6: Refining transcription...[/cyan]")
-    refine_start = time.time()
-    refined_md_path = output.parent / f"{output.stem}_04_refined.md"
+            merged_markdown = export_markdown(
+                merged, merged_md_path, title=output.stem, metadata=metadata
+            )
+            export_time = time.time() - export_start
+            log_timing("Export", export_time)
 
-    try:
-        language_used, language_source = refine_markdown_file(
-            input_path=merged_md_path,
-            output_path=refined_md_path,
-            model=llm_model,
-            domain_context=domain_context,
-        )
+            # Set timing variables for later use (not applicable in import mode)
+            convert_time = None
+            transcribe_time = None
+            diarize_time = None
+            merge_time = None
+            audio_duration = None
 
-        # Show language notice
-        warning = get_refine_language_warning(language_used, language_source)
-        if warning:
-            console.print()
-            console.print(
-                Panel(
-                    f"[yellow]{warning}[/yellow]",
-                    title="Language Notice",
-                    border_style="yellow",
+        else:
+            # Normal mode: run full pipeline
+            # Step 1: Audio conversion
+            console.print("[cyan]Step 1: Converting audio...[/cyan]")
+            # Intermediates live in a private work dir (RAM-backed when available)
+            # that is removed when the command exits
+            work_dir = make_work_dir()
+            ctx = click.get_current_context()
+            ctx.call_on_close(lambda: shutil.rmtree(work_dir, ignore_errors=True))
+            wav_path = work_dir / "audio.wav"
+            # Whisper model files are resolved and read into the page cache while
+            # ffmpeg converts; leaving the block waits for both. A failed preload
+            # is not raised here, Step 2 resolves the model again and reports it
+            with ThreadPoolExecutor(max_workers=1) as preload_executor:
+                preload_executor.submit(preload_model, model)
+                convert_start = time.time()
+                convert_to_wav_16k(input, wav_path, limit_minutes=limit)
+                convert_time = time.time() - convert_start
+            # RTFs use the converted WAV's duration, read from its header: already
+            # capped by --limit, and no ffprobe run on the original container
+            audio_duration = get_audio_duration(wav_path)
+            convert_rtf = convert_time / audio_duration if audio_duration > 0 else None
+            log_timing("Conversion", convert_time, rtf=convert_rtf)
+
+            # Steps 2 and 3 only share the read-only WAV and each wait on their own
+            # subprocess (whisper-cli / the pyannote venv), so they run concurrently:
+            # wall time is max(transcription, diarization) instead of the sum
+            console.print("[cyan]Step 2: Transcribing...[/cyan]")
+            console.print("[cyan]Step 3: Diarizing...[/cyan]")
+            transcript_base = work_dir / "transcript"
+            diarize_json = work_dir / "diarize.json"
+            parallel_start = time.time()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                transcribe_future = executor.submit(
+                    timed,
+                    run_transcription,
+                    wav_path,
+                    model_name=model,
+                    language=lang,
+                    output_base=transcript_base,
+                    verbose=verbose,
+                )
+                diarize_future = executor.submit(
+                    timed,
+                    run_diarization,
+                    wav_path,
+                    num_speakers=speakers,
+                    output_json=diarize_json,
+                    device=device,
+                    embedding_batch_size=embedding_batch_size,
+                    segmentation_batch_size=segmentation_batch_size,
                 )
+                transcript_segments, transcribe_time = transcribe_future.result()
+                diarize_segments, diarize_time = diarize_future.result()
+
+            transcribe_rtf = transcribe_time / audio_duration if audio_duration > 0 else None
+            log_timing("Transcription", transcribe_time, rtf=transcribe_rtf)
+            diarize_rtf = diarize_time / audio_duration if audio_duration > 0 else None
+            log_timing("Diarization", diarize_time, rtf=diarize_rtf)
+            # Wall time of both stages together (the slower one, not their sum)
+            log_timing("Transcription + Diarization (parallel)", time.time() - parallel_start)
+
+            # Step 4: Merge
+            console.print("[cyan]Step 4: Combining...[/cyan]")
+            merge_start = time.time()
+            merged = merge_segments(transcript_segments, diarize_segments)
+            merge_time = time.time() - merge_start
+            log_timing("Merge", merge_time)
+
+            # Step 5: Export
+            console.print("[cyan]Step 5: Exporting...[/cyan]")
+            export_start = time.time()
+
+            # The markdown carries all run metadata; each JSON export the subset that
+            # applies to it. Shared values are computed once so the three stay in sync
+            input_file = str(input)
+            num_speakers = speakers or "auto"
+            metadata = {
+                "model": model,
+                "language": lang,
+                "prompt_language": prompt_language,
+                "num_speakers": num_speakers,
+                "input_file": input_file,
+            }
+
+            # Export transcription only (without speaker info)
+            transcript_metadata = {"model": model, "language": lang, "input_file": input_file}
+
+            # Export diarization only (speaker info only)
+            diarize_metadata = {"num_speakers": num_speakers, "input_file": input_file}
+
+            # Refine (Step 6) only needs the merged markdown, so the JSON exports
+            # run in the background while it is rendered and the LLM calls start;
+            # they are joined when the pipeline ends, even on error.
+            # shutdown(wait=False) only stops new submissions, the two queued
+            # exports still run to completion
+            json_executor = ThreadPoolExecutor(max_workers=2)
+            json_export_futures = [
+                json_executor.submit(
+                    export_transcript_json,
+                    transcript_segments,
+                    transcript_json_path,
+                    metadata=transcript_metadata,
+                ),
+                json_executor.submit(
+                    export_diarize_json,
+                    diarize_segments,
+                    diarize_json_path,
+                    metadata=diarize_metadata,
+                ),
+            ]
+            json_executor.shutdown(wait=False)
+
+            # Merged markdown only (no .json or .srt)
+            merged_markdown = export_markdown(
+                merged, merged_md_path, title=input.stem, metadata=metadata
             )
 
-        refine_time = time.time() - refine_start
-        log_timing("Refine", refine_time)
-        console.print("[green]✓ Refinement completed[/green]")
+            export_time = time.time() - export_start
+            log_timing("Export", export_time)
 
-    except (AuthenticationError, CLINotInstalledError, SDKNotInstalledError):
-        console.print("[red]LLM authentication required. Run: claude auth login[/red]")
-        raise click.Abort()
-    except LLMError as e:
-        console.print(f"[red]LLM error during refinement: {e}[/red]")
-        raise click.Abort()
-    except Exception as e:
-        logger.exception("Error during refinement")
-        console.print(f"[red]Error during refinement: {e}[/red]")
-        raise click.Abort()
-
-    # Step 7: Format Meeting
-    console.print("\n[cyan]Step 7: Formatting meeting...[/cyan]")
-    format_start = time.time()
-    formatted_md_path = output.parent / f"{output.stem}_05_formatted-meeting.md"
+        # Step 6: Refine
+        console.print("\n[cyan]Step 6: Refining transcription...[/cyan]")
+        refine_start = time.time()
 
-    try:
-        # Extract language from refined file metadata
-        refined_content = refined_md_path.read_text(encoding="utf-8")
-        file_language = extract_language_from_metadata(refined_content)
-        language = file_language or prompt_language or DEFAULT_PROMPT_LANGUAGE
-        language_source = "file" if file_language else ("cli" if lang else "default")
-
-        # Show language notice
-        warning = get_language_warning(language, language_source)
-        if warning:
-            console.print()
-            console.print(
-                Panel(
-                    f"[yellow]{warning}[/yellow]",
-                    title="Language Notice",
-                    border_style="yellow",
+        try:
+            if skip_refine_if_clean and not needs_refine(merged_markdown):
+                # No markers of the defects refine fixes: Step 7 gets the merged
+                # markdown as is, saving the LLM round-trips
+                refined_content = merged_markdown
+                refined_md_path.write_text(refined_content, encoding="utf-8")
+                refine_time = time.time() - refine_start
+                log_timing("Refine", refine_time)
+                console.print("[green]✓ Transcript looks clean, refinement skipped[/green]")
+            else:
+                # Refine the markdown Step 5 just rendered instead of reading it
+                # back, and keep the result in memory for Step 7
+                refined_content, language_used, language_source = refine_markdown(
+                    merged_markdown,
+                    model=llm_model,
+                    domain_context=domain_context,
                 )
-            )
-
-        # Extract body (skip header)
-        lines = refined_content.split("\n")
-        body_start_idx = 0
-        for i, line in enumerate(lines):
-            if line.strip() == "---":
-                body_start_idx = i + 1
-                break
-        body = "\n".join(lines[body_start_idx:]).strip()
-
-        if not body:
-            console.print("[red]Error: No content found in refined file.[/red]")
+                refined_md_path.write_text(refined_content, encoding="utf-8")
+
+                # Show language notice
+                warning = get_refine_language_warning(language_used, language_source)
+                if warning:
+                    console.print()
+                    console.print(
+                        Panel(
+                            f"[yellow]{warning}[/yellow]",
+                            title="Language Notice",
+                            border_style="yellow",
+                        )
+                    )
+
+                refine_time = time.time() - refine_start
+                log_timing("Refine", refine_time)
+                console.print("[green]✓ Refinement completed[/green]")
+
+        except (AuthenticationError, CLINotInstalledError, SDKNotInstalledError):
+            console.print("[red]LLM authentication required. Run: claude auth login[/red]")
+            raise click.Abort()
+        except LLMError as e:
+            console.print(f"[red]LLM error during refinement: {e}[/red]")
+            raise click.Abort()
+        except Exception as e:
+            logger.exception("Error during refinement")
+            console.print(f"[red]Error during refinement: {e}[/red]")
             raise click.Abort()
 
-        # Load prompt for estimation
-        prompt = load_format_meeting_prompt(language, domain_context=domain_context)
-
-        # Estimate tokens
-        estimates = estimate_tokens(body, prompt)
-
-        # Display token estimate
-        console.print()
-        table = Table(title="Token Estimate", show_header=True)
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", justify="right")
-        table.add_row("Input tokens", f"~{estimates['input_tokens']:,}")
-        table.add_row("Output tokens (est.)", f"~{estimates['output_tokens_estimate']:,}")
-        table.add_row("Total tokens (est.)", f"~{estimates['total_tokens_estimate']:,}")
-        table.add_row("", "")
-        table.add_row("Estimated cost", f"${estimates['total_cost_usd']:.2f} USD")
-        console.print(table)
-
-        # Confirmation prompt
-        if not yes:
-            console.print()
-            console.print(
-                Panel(
-                    "[yellow]This operation may consume significant tokens.[/yellow]\n"
-                    "Use --yes flag to skip this confirmation.",
-                    title="Warning",
-                    border_style="yellow",
+        # Step 7: Format Meeting
+        console.print("\n[cyan]Step 7: Formatting meeting...[/cyan]")
+        format_start = time.time()
+
+        try:
+            # Extract language from the refined metadata (Step 6 output, in memory).
+            # Language, header skip and body extraction in a single pass
+            file_language, _, body = parse_md_header(refined_content)
+            language = file_language or prompt_language
+            language_source = "file" if file_language else ("cli" if lang else "default")
+
+            # Show language notice
+            warning = get_language_warning(language, language_source)
+            if warning:
+                console.print()
+                console.print(
+                    Panel(
+                        f"[yellow]{warning}[/yellow]",
+                        title="Language Notice",
+                        border_style="yellow",
+                    )
                 )
-            )
-            if not click.confirm("Do you want to proceed?", default=False):
-                console.print("[dim]Operation cancelled.[/dim]")
+
+            if not body:
+                console.print("[red]Error: No content found in refined file.[/red]")
                 raise click.Abort()
 
-        console.print()
-        console.print("[cyan]Processing...[/cyan]")
+            # Load prompt for estimation
+            prompt = load_format_meeting_prompt(language, domain_context=domain_context)
 
-        format_meeting_file(
-            input_path=refined_md_path,
-            output_path=formatted_md_path,
-            model=llm_model,
-            language=language,
-            domain_context=domain_context,
-        )
+            # Estimate tokens
+            estimates = estimate_tokens(body, prompt)
 
-        format_time = time.time() - format_start
-        log_timing("Format Meeting", format_time)
-        console.print("[green]✓ Formatting completed[/green]")
+            # Display token estimate
+            console.print()
+            table = Table(title="Token Estimate", show_header=True)
+            table.add_column("Metric", style="cyan")
+            table.add_column("Value", justify="right")
+            table.add_row("Input tokens", f"~{estimates['input_tokens']:,}")
+            table.add_row("Output tokens (est.)", f"~{estimates['output_tokens_estimate']:,}")
+            table.add_row("Total tokens (est.)", f"~{estimates['total_tokens_estimate']:,}")
+            table.add_row("", "")
+            table.add_row("Estimated cost", f"${estimates['total_cost_usd']:.2f} USD")
+            console.print(table)
+
+            # Confirmation prompt
+            if not yes:
+                console.print()
+                console.print(
+                    Panel(
+                        "[yellow]This operation may consume significant tokens.[/yellow]\n"
+                        "Use --yes flag to skip this confirmation.",
+                        title="Warning",
+                        border_style="yellow",
+                    )
+                )
+                if not click.confirm("Do you want to proceed?", default=False):
+                    console.print("[dim]Operation cancelled.[/dim]")
+                    raise click.Abort()
 
-    except (AuthenticationError, CLINotInstalledError, SDKNotInstalledError):
-        console.print("[red]LLM authentication required. Run: claude auth login[/red]")
-        raise click.Abort()
-    except LLMError as e:
-        console.print(f"[red]LLM error during formatting: {e}[/red]")
-        raise click.Abort()
-    except Exception as e:
-        logger.exception("Error during formatting")
-        console.print(f"[red]Error during formatting: {e}[/red]")
-        raise click.Abort()
+            console.print()
+            console.print("[cyan]Processing...[/cyan]")
+
+            format_meeting_file(
+                input_path=refined_md_path,
+                output_path=formatted_md_path,
+                model=llm_model,
+                language=language,
+                domain_context=domain_context,
+                prompt=prompt,
+                # Step 6 output, so the file just written is not read back
+                content=refined_content,
+            )
+
+            format_time = time.time() - format_start
+            log_timing("Format Meeting", format_time)
+            console.print("[green]✓ Formatting completed[/green]")
+
+        except (AuthenticationError, CLINotInstalledError, SDKNotInstalledError):
+            console.print("[red]LLM authentication required. Run: claude auth login[/red]")
+            raise click.Abort()
+        except LLMError as e:
+            console.print(f"[red]LLM error during formatting: {e}[/red]")
+            raise click.Abort()
+        except Exception as e:
+            logger.exception("Error during formatting")
+            console.print(f"[red]Error during formatting: {e}[/red]")
+            raise click.Abort()
+    finally:
+        # JSON exports started in Step 5, checked even when a later step aborts
+        export_errors = []
+        for future in json_export_futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("Error exporting JSON", exc_info=e)
+                export_errors.append(e)
+        for e in export_errors:
+            console.print(f"[red]Error exporting JSON: {e}[/red]")
+        if export_errors:
+            raise click.Abort()
 
     # Timings log (06_timings.log)
-    timings_log = output.parent / f"{output.stem}_06_timings.log"
     total_time = time.time() - start_time
     total_rtf = total_time / audio_duration if audio_duration and audio_duration > 0 else None
-    with open(timings_log, "w") as f:
-        if import_transcript:
-            # Import mode timings
-            f.write("Mode: Import transcript\n")
-            f.write(f"Import file: {import_transcript}\n\n")
-            f.write(f"Import: {format_duration(import_time)} ({import_time:.2f}s)\n")
-        else:
-            # Normal mode timings
-            f.write(f"Audio duration: {format_duration(audio_duration)} ({audio_duration:.2f}s)\n")
-            f.write(f"\nConversion: {format_duration(convert_time)} ({convert_time:.2f}s)")
-            if convert_rtf:
-                f.write(f" (RTF: {convert_rtf:.3f})")
-            f.write(f"\nTranscription: {format_duration(transcribe_time)} ({transcribe_time:.2f}s)")
-            if transcribe_rtf:
-                f.write(f" (RTF: {transcribe_rtf:.3f})")
-            f.write(f"\nDiarization: {format_duration(diarize_time)} ({diarize_time:.2f}s)")
-            if diarize_rtf:
-                f.write(f" (RTF: {diarize_rtf:.3f})")
-            f.write(f"\nMerge: {format_duration(merge_time)} ({merge_time:.2f}s)\n")
-
-        f.write(f"Export: {format_duration(export_time)} ({export_time:.2f}s)\n")
-        f.write(f"Refine: {format_duration(refine_time)} ({refine_time:.2f}s)\n")
-        f.write(f"Format Meeting: {format_duration(format_time)} ({format_time:.2f}s)\n")
-        f.write(f"\nTotal: {format_duration(total_time)} ({total_time:.2f}s)")
-        if total_rtf:
-            f.write(f" (RTF: {total_rtf:.3f})")
-        f.write("\n")
+    if import_transcript:
+        # Import mode timings
+        report = [
+            "Mode: Import transcript",
+            f"Import file: {import_transcript}",
+            "",
+            format_timing("Import", import_time),
+        ]
+    else:
+        # Normal mode timings
+        report = [
+            format_timing("Audio duration", audio_duration),
+            "",
+            format_timing("Conversion", convert_time, convert_rtf),
+            format_timing("Transcription", transcribe_time, transcribe_rtf),
+            format_timing("Diarization", diarize_time, diarize_rtf),
+            format_timing("Merge", merge_time),
+        ]
+    report += [
+        format_timing("Export", export_time),
+        format_timing("Refine", refine_time),
+        format_timing("Format Meeting", format_time),
+        "",
+        format_timing("Total", total_time, total_rtf),
+    ]
+    # Built in memory and written in one call, atomically
+    atomic_write_text(timings_log, "\n".join(report) + "\n")
 
     log_timing("Total", total_time)
 
@@ -1,18 +1,15 @@
 """Transcription command."""
 
 import logging
+import shutil
 from pathlib import Path
 
 import click
-from rich.console import Console
 
-from metalscribe.core.audio import convert_to_wav_16k
-from metalscribe.core.models import MergedSegment
-from metalscribe.core.whisper import run_transcription
-from metalscribe.exporters.json_exporter import export_json
+from metalscribe.utils.console import console
+from metalscribe.utils.files import make_work_dir
 from metalscribe.utils.logging import log_timing, setup_logging
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 
@@ -97,10 +94,20 @@ def transcribe(input: Path, model: str, lang: str, output: Path, limit: float, v
 
     import time
 
+    # Imported here so `--help` doesn't load whisper (and the optional
+    # faster-whisper/CTranslate2 stack it pulls in)
+    from metalscribe.core.audio import convert_to_wav_16k
+    from metalscribe.core.models import MergedSegment
+    from metalscribe.core.whisper import run_transcription
+    from metalscribe.exporters.json_exporter import export_json
+
     start_time = time.time()
 
-    # Convert audio
-    wav_path = input.with_suffix(".wav")
+    # Convert audio into a private work dir (RAM-backed when available),
+    # removed when the command exits
+    work_dir = make_work_dir()
+    click.get_current_context().call_on_close(lambda: shutil.rmtree(work_dir, ignore_errors=True))
+    wav_path = work_dir / "audio.wav"
     convert_to_wav_16k(input, wav_path, limit_minutes=limit)
     conversion_time = time.time() - start_time
     log_timing("Audio conversion", conversion_time)
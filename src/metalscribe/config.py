@@ -2,6 +2,8 @@
 
 import os
 import platform
+import tempfile
+from functools import lru_cache
 from importlib import resources
 from enum import IntEnum
 from pathlib import Path
@@ -22,21 +24,49 @@ class ExitCode(IntEnum):
     TIMEOUT = 61
 
 
-def get_cache_dir() -> Path:
-    """Returns the user cache directory."""
-    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+@lru_cache(maxsize=None)
+def _ensure_cache_dir(cache_home: str) -> Path:
+    """Creates the metalscribe cache directory under cache_home (once per location)."""
     cache_dir = Path(cache_home) / "metalscribe"
     cache_dir.mkdir(parents=True, exist_ok=True)
     return cache_dir
 
 
+def get_cache_dir() -> Path:
+    """
+    Returns the user cache directory.
+
+    XDG_CACHE_HOME is read on every call (so changing it takes effect); the
+    directory is created only the first time a location is returned.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return _ensure_cache_dir(cache_home)
+
+
+def get_temp_dir() -> Path:
+    """
+    Returns the directory for pipeline intermediates (converted WAV, raw JSON).
+
+    METALSCRIBE_TMPDIR overrides it; otherwise /dev/shm is used where it exists
+    (RAM-backed on Linux, so the WAV read by both transcription and diarization
+    never touches disk), falling back to the system temp directory.
+    """
+    override = os.environ.get("METALSCRIBE_TMPDIR")
+    if override:
+        return Path(override)
+    if os.path.isdir("/dev/shm"):
+        return Path("/dev/shm")
+    return Path(tempfile.gettempdir())
+
+
 def get_pyannote_venv_path() -> Path:
     """Returns the pyannote.audio venv path in cache."""
     return get_cache_dir() / "pyannote_venv"
 
 
+@lru_cache(maxsize=1)
 def get_brew_prefix() -> Path:
-    """Returns the Homebrew prefix."""
+    """Returns the Homebrew prefix (cached: the machine does not change)."""
     if platform.machine() == "arm64":
         return Path("/opt/homebrew")
     return Path("/usr/local")
@@ -174,6 +204,9 @@ VAD_MODELS = {
     },
 }
 
+# Devices pyannote diarization can run on ("auto": MPS, then CUDA, then CPU)
+DIARIZATION_DEVICES = ["auto", "mps", "cuda", "cpu"]
+
 # Default LLM models for refine and format-meeting commands
 # These are the model identifiers accepted by claude-agent-sdk
 # Can use aliases ("sonnet", "opus") or full names ("claude-sonnet-4-5", "claude-opus-4-6")
@@ -181,6 +214,9 @@ VAD_MODELS = {
 DEFAULT_REFINE_MODEL = "claude-opus-4-6"  # Opus 4.6 with thinking for refine command
 DEFAULT_FORMAT_MEETING_MODEL = "claude-opus-4-6"  # Opus 4.6 with thinking for format-meeting
 
+# Maximum number of refine chunks sent to the LLM at the same time
+DEFAULT_REFINE_PARALLELISM = 4
+
 # Legacy: Default LLM model (deprecated, use command-specific defaults above)
 # None means use Claude Code SDK default model
 # Can be overridden via METALSCRIBE_DEFAULT_LLM_MODEL environment variable
@@ -235,8 +271,9 @@ def get_prompt_language(whisper_lang: str | None = None) -> str:
     return prompt_lang
 
 
+@lru_cache(maxsize=1)
 def get_prompts_dir() -> Path:
-    """Returns the base prompts directory."""
+    """Returns the base prompts directory (resolved once per process)."""
     prompts_dir = resources.files("metalscribe") / "prompts"
     if isinstance(prompts_dir, Path):
         return prompts_dir
@@ -1,11 +1,17 @@
 """Audio conversion."""
 
 import logging
+import wave
 from pathlib import Path
 
 from metalscribe.config import ExitCode
 from metalscribe.utils.subprocess import run_command
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
 SUPPORTED_FORMATS = {
@@ -22,10 +28,43 @@ SUPPORTED_FORMATS = {
 }
 
 
+def is_wav_16k_mono(path: Path) -> bool:
+    """True if path is already an uncompressed 16-bit WAV, 16kHz mono (read from the header)."""
+    if path.suffix.lower() != ".wav":
+        return False
+    try:
+        with wave.open(str(path), "rb") as wav:
+            return (
+                wav.getframerate() == 16000
+                and wav.getnchannels() == 1
+                and wav.getsampwidth() == 2
+                and wav.getcomptype() == "NONE"
+            )
+    except (wave.Error, EOFError, OSError):
+        return False
+
+
+def load_wav_16k_mono(path: Path) -> "np.ndarray":
+    """
+    Reads a WAV 16kHz mono file (see is_wav_16k_mono) as float32 samples in [-1, 1).
+
+    The PCM frames are copied straight into an array, without decoding or
+    resampling again, for in-process consumers such as faster-whisper.
+    """
+    if np is None:
+        raise ImportError("numpy is required to load audio in memory")
+    with wave.open(str(path), "rb") as wav:
+        frames = wav.readframes(wav.getnframes())
+    return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+
+
 def convert_to_wav_16k(input_path: Path, output_path: Path, limit_minutes: float | None = None) -> None:
     """
     Converts audio to WAV 16kHz mono using ffmpeg.
 
+    An input that is already WAV 16kHz mono is not re-encoded: output_path
+    becomes a symlink to it, saving a full audio-sized write and read.
+
     Args:
         input_path: Input file path
         output_path: Output WAV file path
@@ -42,6 +81,14 @@ def convert_to_wav_16k(input_path: Path, output_path: Path, limit_minutes: float
     if suffix not in SUPPORTED_FORMATS:
         logger.warning(f"Format {suffix} might not be supported")
 
+    if limit_minutes is None and is_wav_16k_mono(input_path):
+        logger.info(f"{input_path} is already WAV 16kHz mono, skipping conversion")
+        if output_path.resolve() == input_path.resolve():
+            return
+        output_path.unlink(missing_ok=True)
+        output_path.symlink_to(input_path.resolve())
+        return
+
     logger.info(f"Converting {input_path} to WAV 16kHz mono...")
 
     # ffmpeg -i input -ar 16000 -ac 1 output.wav
@@ -7,7 +7,7 @@ from typing import Optional
 from metalscribe.config import DEFAULT_PROMPT_LANGUAGE, DEFAULT_FORMAT_MEETING_MODEL
 from metalscribe.core.prompt_loader import load_prompt
 from metalscribe.llm import LLMProvider
-from metalscribe.utils.metadata import extract_language_from_metadata
+from metalscribe.utils.metadata import parse_md_header
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +75,8 @@ def estimate_tokens(text: str, prompt: str) -> dict:
     Returns:
         Dictionary with token estimates and cost estimation
     """
+    # len() is O(1) on str: the estimate stays constant-time for any transcript
+    # size, so no tokenizer (tiktoken etc.) is needed for this heuristic
     input_tokens = (len(text) + len(prompt)) // DEFAULT_CHARS_PER_TOKEN
     output_tokens_estimate = int(input_tokens * DEFAULT_OUTPUT_MULTIPLIER)
 
@@ -97,6 +99,7 @@ def format_meeting_text(
     model: Optional[str] = None,
     language: Optional[str] = None,
     domain_context: str = "",
+    prompt: Optional[str] = None,
 ) -> str:
     """
     Format a meeting transcription text using LLM.
@@ -106,11 +109,16 @@ def format_meeting_text(
         model: Specific model (optional)
         language: Language code for prompt (optional)
         domain_context: Optional domain context to inject.
+        prompt: Prompt already loaded for language/domain_context (e.g. for
+            token estimation); loaded here if None.
 
     Returns:
         Formatted text
     """
-    prompt = load_format_meeting_prompt(language, domain_context=domain_context)
+    if prompt is None:
+        prompt = load_format_meeting_prompt(language, domain_context=domain_context)
+    estimates = estimate_tokens(text, prompt)
+    logger.info(f"Estimated tokens: ~{estimates['total_tokens_estimate']:,}")
 
     # Build full message with prompt and text
     full_text = f"{prompt}\n\n---\n\nTRANSCRIPTION TO FORMAT:\n\n{text}"
@@ -128,6 +136,8 @@ def format_meeting_file(
     model: Optional[str] = None,
     language: Optional[str] = None,
     domain_context: str = "",
+    prompt: Optional[str] = None,
+    content: Optional[str] = None,
 ) -> tuple[str, str]:
     """
     Format a meeting transcription markdown file.
@@ -138,40 +148,32 @@ def format_meeting_file(
         model: Specific model
         language: Language code for prompt (overrides file metadata)
         domain_context: Optional domain context to inject.
+        prompt: Prompt already loaded for language/domain_context; only
+            used together with an explicit language.
+        content: Content of input_path if the caller already read it (the
+            file is not read again).
 
     Returns:
         Tuple of (language_used, language_source) where source is "file", "cli", or "default"
     """
-    content = input_path.read_text(encoding="utf-8")
+    if content is None:
+        content = input_path.read_text(encoding="utf-8")
 
-    # Extract language from file metadata if not provided
+    # Separate header/metadata from main content and read the file language
+    # in one pass. metalscribe format has: title, metadata, "---", then content
+    file_language, _, body = parse_md_header(content)
+
+    # Use language from file metadata if not provided
     language_source = "default"
     if language:
         language_source = "cli"
     else:
-        file_language = extract_language_from_metadata(content)
         if file_language:
             language = file_language
             language_source = "file"
         else:
             language = DEFAULT_PROMPT_LANGUAGE
 
-    # Separate header/metadata from main content
-    # metalscribe format has: title, metadata, "---", then content
-    lines = content.split("\n")
-    header_lines = []
-    body_start_idx = 0
-
-    # Find where header ends (line "---")
-    for i, line in enumerate(lines):
-        if line.strip() == "---":
-            body_start_idx = i + 1
-            break
-        header_lines.append(line)
-
-    body_lines = lines[body_start_idx:] if body_start_idx < len(lines) else lines
-    body = "\n".join(body_lines).strip()
-
     if not body:
         logger.warning("No content found to format. Copying original file.")
         output_path.write_text(content, encoding="utf-8")
@@ -184,6 +186,7 @@ def format_meeting_file(
         model=model,
         language=language,
         domain_context=domain_context,
+        prompt=prompt if language_source == "cli" else None,
     )
 
     # The format-meeting prompt produces a complete document, so we use it directly
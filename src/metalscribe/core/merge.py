@@ -1,7 +1,8 @@
 """Merge algorithm for transcription and diarization."""
 
 import logging
-from typing import List
+from collections import deque
+from typing import Deque, Iterable, Iterator, List
 
 from metalscribe.core.models import DiarizeSegment, MergedSegment, TranscriptSegment
 
@@ -35,60 +36,45 @@ def calculate_overlap_ratio(
     return overlap_duration / transcript_duration
 
 
-def merge_segments(
-    transcript_segments: List[TranscriptSegment],
-    diarize_segments: List[DiarizeSegment],
-) -> List[MergedSegment]:
+def iter_merged_segments(
+    transcript_segments: Iterable[TranscriptSegment],
+    diarize_segments: Iterable[DiarizeSegment],
+) -> Iterator[MergedSegment]:
     """
-    Merges transcription and diarization segments using O(N+M) two-pointer algorithm.
+    Streaming O(N+M) two-pointer merge over time-ordered segments.
+
+    Both inputs are consumed lazily and only a sliding window of diarization
+    segments that can still overlap the current transcription segment is kept,
+    so merged segments are yielded as soon as the turns covering them are read.
 
     For each transcription segment, finds the diarization segment with highest overlap
-    and assigns the corresponding speaker.
+    and assigns the corresponding speaker ("UNKNOWN" if none overlaps).
 
     Args:
         transcript_segments: Transcription segments sorted by time
-        diarize_segments: Diarization segments sorted by time
+        diarize_segments: Diarization segments sorted by start time
 
-    Returns:
-        List of MergedSegment with text and speaker
+    Yields:
+        MergedSegment with text and speaker
     """
-    if not transcript_segments:
-        return []
-
-    if not diarize_segments:
-        # If no diarization, return transcription without speaker
-        return [
-            MergedSegment(
-                start_ms=seg.start_ms,
-                end_ms=seg.end_ms,
-                text=seg.text,
-                speaker="UNKNOWN",
-            )
-            for seg in transcript_segments
-        ]
-
-    merged = []
-    diarize_idx = 0
+    diarize_iter = iter(diarize_segments)
+    next_diarize = next(diarize_iter, None)
+    window: Deque[DiarizeSegment] = deque()
 
     for transcript_seg in transcript_segments:
-        best_speaker = "UNKNOWN"
-        best_overlap = 0.0
-
-        # Find diarization segment with highest overlap
-        # Uses two-pointer: starts from where it stopped (diarize_idx) and advances
-        for i in range(diarize_idx, len(diarize_segments)):
-            diarize_seg = diarize_segments[i]
+        # Pull in diarization segments starting before this segment ends
+        while next_diarize is not None and next_diarize.start_ms <= transcript_seg.end_ms:
+            window.append(next_diarize)
+            next_diarize = next(diarize_iter, None)
 
-            # If diarize is too early, skip
-            if diarize_seg.end_ms < transcript_seg.start_ms:
-                diarize_idx = i + 1
-                continue
+        # Drop segments that ended before this one starts: later transcription
+        # segments start even later, so they can't overlap them either
+        while window and window[0].end_ms < transcript_seg.start_ms:
+            window.popleft()
 
-            # If diarize is too late, stop
-            if diarize_seg.start_ms > transcript_seg.end_ms:
-                break
-
-            # Calculate overlap
+        best_speaker = "UNKNOWN"
+        best_overlap = 0.0
+        for diarize_seg in window:
             overlap = calculate_overlap_ratio(
                 transcript_seg.start_ms,
                 transcript_seg.end_ms,
@@ -100,14 +86,28 @@ def merge_segments(
                 best_overlap = overlap
                 best_speaker = diarize_seg.speaker
 
-        merged.append(
-            MergedSegment(
-                start_ms=transcript_seg.start_ms,
-                end_ms=transcript_seg.end_ms,
-                text=transcript_seg.text,
-                speaker=best_speaker,
-            )
+        yield MergedSegment(
+            start_ms=transcript_seg.start_ms,
+            end_ms=transcript_seg.end_ms,
+            text=transcript_seg.text,
+            speaker=best_speaker,
         )
 
+
+def merge_segments(
+    transcript_segments: Iterable[TranscriptSegment],
+    diarize_segments: Iterable[DiarizeSegment],
+) -> List[MergedSegment]:
+    """
+    Merges transcription and diarization segments (see iter_merged_segments).
+
+    Args:
+        transcript_segments: Transcription segments sorted by time
+        diarize_segments: Diarization segments sorted by time
+
+    Returns:
+        List of MergedSegment with text and speaker
+    """
+    merged = list(iter_merged_segments(transcript_segments, diarize_segments))
     logger.info(f"Merge complete: {len(merged)} combined segments")
     return merged
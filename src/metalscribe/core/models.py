@@ -2,8 +2,11 @@
 
 from dataclasses import dataclass
 
+# slots=True: sem __dict__ por instância, o que reduz memória e acelera o acesso
+# a atributos em reuniões longas (dezenas de milhares de segmentos)
 
-@dataclass
+
+@dataclass(slots=True)
 class TranscriptSegment:
     """Segmento de transcrição com timestamps."""
 
@@ -12,7 +15,7 @@ class TranscriptSegment:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DiarizeSegment:
     """Segmento de diarização com speaker."""
 
@@ -21,7 +24,7 @@ class DiarizeSegment:
     speaker: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MergedSegment:
     """Segmento combinado com transcrição e speaker."""
 
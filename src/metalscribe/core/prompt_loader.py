@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
+import time
+from functools import lru_cache
+from pathlib import Path
 
-from metalscribe.config import get_prompt_path
+from metalscribe.config import get_cache_dir, get_prompt_path
+from metalscribe.utils.files import atomic_write_text
+
+# Built prompts persisted across runs; entries unused for this long are evicted
+PROMPT_CACHE_MAX_AGE_S = 30 * 24 * 3600
 
 DOMAIN_CONTEXT_PATTERN = re.compile(
     r"## (?:DOMAIN CONTEXT|CONTEXTO DE DOMÍNIO)\s*\n+\{\{DOMAIN_CONTEXT\}\}.*?(?=\n## |\Z)",
@@ -13,12 +21,11 @@ DOMAIN_CONTEXT_PATTERN = re.compile(
 
 
 def _strip_main_title(content: str) -> str:
-    lines = content.split("\n")
-    if lines and lines[0].startswith("# "):
-        lines = lines[1:]
-    if lines and not lines[0].strip():
-        lines = lines[1:]
-    return "\n".join(lines)
+    # Only the first two lines are inspected; the rest is never split
+    if content.startswith("# "):
+        content = content.partition("\n")[2]
+    first_line, _, rest = content.partition("\n")
+    return rest if not first_line.strip() else content
 
 
 def _remove_domain_context_section(content: str) -> str:
@@ -27,6 +34,67 @@ def _remove_domain_context_section(content: str) -> str:
     return cleaned.strip()
 
 
+@lru_cache(maxsize=32)
+def _load_template(prompt_path: Path, mtime_ns: int) -> tuple[str, str]:
+    """
+    Read and pre-process a prompt file once per (path, mtime).
+
+    Returns the template with the title stripped and the same template with
+    the domain context section already removed.
+    """
+    content = _strip_main_title(prompt_path.read_text(encoding="utf-8"))
+    without_context = _remove_domain_context_section(content).replace("{{DOMAIN_CONTEXT}}", "")
+    return content, without_context
+
+
+def _prompt_cache_dir() -> Path:
+    return get_cache_dir() / "prompts"
+
+
+def _evict_stale_prompts(cache_dir: Path) -> None:
+    cutoff = time.time() - PROMPT_CACHE_MAX_AGE_S
+    for entry in cache_dir.glob("*.txt"):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=32)
+def _build_prompt(prompt_path: Path, mtime_ns: int, cleaned_context: str) -> str:
+    """
+    Build the final prompt, going through the on-disk prompt cache.
+
+    Keyed by template path + mtime and a digest of the context, so an edited
+    template or a different context never hits a stale entry. The cache is
+    best effort: any filesystem error just falls back to building the prompt.
+    """
+    digest = hashlib.blake2b(
+        f"{prompt_path}\0{cleaned_context}".encode("utf-8"), digest_size=8
+    ).hexdigest()
+    cache_dir = _prompt_cache_dir()
+    cache_path = cache_dir / f"{prompt_path.stem}-{mtime_ns}-{digest}.txt"
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    content, without_context = _load_template(prompt_path, mtime_ns)
+    if cleaned_context:
+        prompt = content.replace("{{DOMAIN_CONTEXT}}", cleaned_context)
+    else:
+        prompt = without_context
+
+    try:
+        # Atomic so concurrent runs never read a partial entry
+        atomic_write_text(cache_path, prompt)
+        _evict_stale_prompts(cache_dir)
+    except OSError:
+        pass
+    return prompt
+
+
 def load_prompt(
     prompt_name: str,
     language: str | None = None,
@@ -37,14 +105,9 @@ def load_prompt(
 
     If domain_context is non-empty: replaces {{DOMAIN_CONTEXT}} placeholder.
     If domain_context is empty: removes the entire DOMAIN CONTEXT section.
+
+    Built prompts are cached in memory and on disk (see _build_prompt), keyed
+    by the template mtime, so warm runs skip reading and interpolating it.
     """
     prompt_path = get_prompt_path(prompt_name, language)
-    content = prompt_path.read_text(encoding="utf-8")
-    content = _strip_main_title(content)
-
-    cleaned_context = domain_context.strip()
-    if cleaned_context:
-        return content.replace("{{DOMAIN_CONTEXT}}", cleaned_context)
-
-    cleaned = _remove_domain_context_section(content)
-    return cleaned.replace("{{DOMAIN_CONTEXT}}", "")
+    return _build_prompt(prompt_path, prompt_path.stat().st_mtime_ns, domain_context.strip())
@@ -5,7 +5,7 @@ import tempfile
 from pathlib import Path
 from typing import List, Optional
 
-from metalscribe.config import ExitCode, get_pyannote_venv_path
+from metalscribe.config import ExitCode, get_pyannote_venv_path, get_temp_dir
 from metalscribe.core.checks import validate_hf_token
 from metalscribe.core.models import DiarizeSegment
 from metalscribe.parsers.diarize_parser import parse_diarize_output
@@ -18,6 +18,9 @@ def run_diarization(
     audio_path: Path,
     num_speakers: Optional[int] = None,
     output_json: Optional[Path] = None,
+    device: str = "auto",
+    embedding_batch_size: Optional[int] = None,
+    segmentation_batch_size: Optional[int] = None,
 ) -> List[DiarizeSegment]:
     """
     Runs diarization using pyannote.audio with MPS GPU.
@@ -26,6 +29,10 @@ def run_diarization(
         audio_path: Path to WAV 16kHz file
         num_speakers: Number of speakers (optional, auto-detects if None)
         output_json: Path to save JSON (optional)
+        device: "auto" (MPS, then CUDA, then CPU), "mps", "cuda" or "cpu"
+        embedding_batch_size: Speaker embedding batch size (pyannote default if None).
+            Lower it when the default runs out of GPU memory, raise it on large GPUs.
+        segmentation_batch_size: Segmentation batch size (pyannote default if None)
 
     Returns:
         List of DiarizeSegment
@@ -33,6 +40,18 @@ def run_diarization(
     Raises:
         SystemExit: If diarization fails
     """
+    if output_json is None:
+        # Private temp dir (RAM-backed when available), removed once parsed
+        with tempfile.TemporaryDirectory(prefix="metalscribe-", dir=get_temp_dir()) as work_dir:
+            return run_diarization(
+                audio_path,
+                num_speakers,
+                Path(work_dir) / "diarize.json",
+                device=device,
+                embedding_batch_size=embedding_batch_size,
+                segmentation_batch_size=segmentation_batch_size,
+            )
+
     venv_path = get_pyannote_venv_path()
     python_path = venv_path / "bin" / "python"
 
@@ -43,10 +62,6 @@ def run_diarization(
     # Validate token
     token = validate_hf_token()
 
-    # Prepare temporary output JSON if not provided
-    if output_json is None:
-        output_json = Path(tempfile.mktemp(suffix=".json"))
-
     logger.info("Running diarization...")
 
     # Inline Python script to run diarization
@@ -58,8 +73,16 @@ from pyannote.audio import Pipeline
 import torch
 import json
 
-# Use MPS if available
-device = torch.device('mps' if torch.backends.mps.is_available() else 'cpu')
+# "auto" uses MPS if available, then CUDA, then CPU
+device_name = "{device}"
+if device_name == "auto":
+    if torch.backends.mps.is_available():
+        device_name = "mps"
+    elif torch.cuda.is_available():
+        device_name = "cuda"
+    else:
+        device_name = "cpu"
+device = torch.device(device_name)
 print(f"Using device: {{device}}")
 
 # Load pipeline
@@ -69,9 +92,24 @@ pipeline = Pipeline.from_pretrained(
 )
 pipeline.to(device)
 
-# Run diarization
+# Batch sizes: pyannote's defaults can exhaust GPU memory on small GPUs
+embedding_batch_size = {embedding_batch_size!r}
+segmentation_batch_size = {segmentation_batch_size!r}
+if embedding_batch_size:
+    pipeline.embedding_batch_size = embedding_batch_size
+if segmentation_batch_size:
+    pipeline.segmentation_batch_size = segmentation_batch_size
+
+# Run diarization on the waveform loaded once in memory: given a file path,
+# pyannote re-reads and resamples it on the CPU for every chunk
+import torchaudio
+
 audio_file = "{audio_path}"
-diarization = pipeline(audio_file, num_speakers={num_speakers if num_speakers else "None"})
+waveform, sample_rate = torchaudio.load(audio_file)
+diarization = pipeline(
+    {{"waveform": waveform, "sample_rate": sample_rate}},
+    num_speakers={num_speakers if num_speakers else "None"},
+)
 
 # Convert to JSON format
 output = {{
@@ -1,18 +1,111 @@
 """Module for refining transcriptions using LLM."""
 
+import asyncio
+import hashlib
+import json
 import logging
+import re
+from collections import Counter, deque
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
-from metalscribe.config import DEFAULT_PROMPT_LANGUAGE, DEFAULT_REFINE_MODEL
+from metalscribe.config import (
+    DEFAULT_PROMPT_LANGUAGE,
+    DEFAULT_REFINE_MODEL,
+    DEFAULT_REFINE_PARALLELISM,
+    get_cache_dir,
+)
 from metalscribe.core.prompt_loader import load_prompt
-from metalscribe.llm import LLMProvider
-from metalscribe.utils.metadata import extract_language_from_metadata
+from metalscribe.llm import (
+    AuthenticationError,
+    CLINotInstalledError,
+    LLMError,
+    LLMProvider,
+    SDKNotInstalledError,
+)
+from metalscribe.utils.files import atomic_write_text
+from metalscribe.utils.metadata import parse_md_header
 
 logger = logging.getLogger(__name__)
 
+# Refined-chunk cache counters for the current process
+cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
 
-def load_refine_prompt(language: Optional[str] = None, domain_context: str = "") -> str:
+# Transient query failures (rate limits, overload, dropped connections) are
+# retried with exponential backoff: 2s, 4s, 8s
+REFINE_MAX_RETRIES = 3
+REFINE_RETRY_BASE_DELAY_S = 2.0
+# Setup problems that a retry cannot fix
+_NON_RETRYABLE_ERRORS = (AuthenticationError, CLINotInstalledError, SDKNotInstalledError)
+# Dropped connections and timeouts raised by the transport
+_TRANSIENT_ERRORS = (ConnectionError, TimeoutError, asyncio.TimeoutError)
+# claude-agent-sdk transport errors, matched by name (the SDK is optional)
+_TRANSIENT_SDK_ERRORS = ("CLIConnectionError",)
+# LLMError messages reporting a rate limit, overload or timeout
+_TRANSIENT_MESSAGE_PATTERN = re.compile(
+    r"rate.?limit|overloaded|timed? ?out|timeout|connection|\b(?:429|503|529)\b", re.IGNORECASE
+)
+
+# Optional ```json fence some models wrap the edit list in
+_JSON_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+# needs_refine(): a word 4-gram seen more than 3 times within 200 words is
+# treated as a Whisper repetition loop
+REPETITION_NGRAM = 4
+REPETITION_WINDOW = 200
+REPETITION_MAX_COUNT = 3
+# Text Whisper hallucinates on silence/music (subtitle credits, outros)
+WHISPER_BOILERPLATE = (
+    "thanks for watching",
+    "thank you for watching",
+    "subtitles by the amara.org community",
+    "obrigado por assistir",
+    "legendas pela comunidade amara.org",
+    "legendado pela comunidade",
+    "inscreva-se no canal",
+)
+# Speaker headings and "**[MM:SS]**" timestamps of the merged markdown
+_MARKUP_PATTERN = re.compile(r"^## .*$|\*\*\[[\d:]+\]\*\*", re.MULTILINE)
+
+
+def needs_refine(content: str) -> bool:
+    """
+    Cheap local check for the ASR defects refinement is most needed for.
+
+    Looks for Whisper boilerplate (see WHISPER_BOILERPLATE) and for repetition
+    loops: a word n-gram repeated more than REPETITION_MAX_COUNT times within
+    a sliding window of REPETITION_WINDOW words. Runs in linear time, so it
+    can decide whether an LLM refinement is worth its latency.
+
+    Args:
+        content: Markdown transcription (metalscribe format)
+
+    Returns:
+        True if a marker was found, False if the transcript looks clean
+    """
+    text = _MARKUP_PATTERN.sub(" ", parse_md_header(content)[2]).lower()
+    if any(phrase in text for phrase in WHISPER_BOILERPLATE):
+        return True
+
+    words = re.findall(r"\w+", text)
+    grams = list(zip(*(words[i:] for i in range(REPETITION_NGRAM))))
+    counts: Counter = Counter()
+    window: deque = deque()
+    for gram in grams:
+        window.append(gram)
+        counts[gram] += 1
+        if counts[gram] > REPETITION_MAX_COUNT:
+            return True
+        if len(window) > REPETITION_WINDOW:
+            counts[window.popleft()] -= 1
+    return False
+
+
+def load_refine_prompt(
+    language: Optional[str] = None,
+    domain_context: str = "",
+    edits_only: bool = False,
+) -> str:
     """
     Load the refine prompt from the markdown file.
 
@@ -22,11 +115,16 @@ def load_refine_prompt(language: Optional[str] = None, domain_context: str = "")
     Args:
         language: Language code (e.g., "pt-BR"). Uses default if None.
         domain_context: Optional domain context to inject.
+        edits_only: Append the output format asking for changed lines only
+            (see number_lines / apply_line_edits).
 
     Returns:
         The prompt content as string.
     """
-    return load_prompt("refine", language=language, domain_context=domain_context)
+    prompt = load_prompt("refine", language=language, domain_context=domain_context)
+    if edits_only:
+        prompt += "\n\n" + load_prompt("refine-edits", language=language)
+    return prompt
 
 
 def get_language_warning(language: str, source: str = "default") -> Optional[str]:
@@ -88,79 +186,318 @@ def refine_text(
     return response.text
 
 
-def refine_markdown_file(
-    input_path: Path,
-    output_path: Path,
+def split_into_chunks(text: str, chunk_size: int) -> List[str]:
+    """
+    Split text into chunks of at most chunk_size characters at paragraph breaks.
+
+    Paragraphs (blank-line separated, i.e. speaker headings and timestamped
+    lines) are never cut; a single paragraph longer than chunk_size becomes
+    its own chunk. Joining the chunks with a blank line restores the text.
+
+    Args:
+        text: Text to split
+        chunk_size: Maximum chunk size in characters
+
+    Returns:
+        List of chunks (a single chunk if the text fits)
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    current_size = 0
+    for paragraph in text.split("\n\n"):
+        # +2 for the blank line joining it to the previous paragraph
+        added_size = len(paragraph) + (2 if current else 0)
+        if current and current_size + added_size > chunk_size:
+            chunks.append("\n\n".join(current))
+            current, current_size = [], 0
+            added_size = len(paragraph)
+        current.append(paragraph)
+        current_size += added_size
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def number_lines(chunk: str) -> str:
+    """Prefix each line of a chunk with its index ("N| "), as the edits-only prompt expects."""
+    return "\n".join(f"{index}| {line}" for index, line in enumerate(chunk.split("\n")))
+
+
+class InvalidEditListError(LLMError):
+    """The LLM returned a malformed edit list in edits-only mode."""
+
+    pass
+
+
+def apply_line_edits(chunk: str, response_text: str) -> str:
+    """
+    Apply an edit list returned in edits-only mode to the original chunk.
+
+    The response is a JSON array of {"line_index", "corrected_text"} objects for
+    the changed lines only; an empty or null corrected_text removes the line.
+
+    Args:
+        chunk: Original chunk text (without line numbers)
+        response_text: LLM response
+
+    Returns:
+        Refined chunk
+
+    Raises:
+        InvalidEditListError: If the response is not a valid edit list for this chunk
+    """
+    lines: List[Optional[str]] = list(chunk.split("\n"))
+    try:
+        edits = json.loads(_JSON_FENCE_PATTERN.sub("", response_text.strip()))
+        if not isinstance(edits, list):
+            raise ValueError("expected a JSON array")
+        for edit in edits:
+            index = edit["line_index"]
+            # bool is an int subclass: a JSON true/false is not an index
+            if isinstance(index, bool) or not isinstance(index, int):
+                raise ValueError(f"line_index is not an integer: {index!r}")
+            if not 0 <= index < len(lines):
+                raise ValueError(f"line_index out of range: {index!r}")
+            text = edit["corrected_text"]
+            if text is not None and not isinstance(text, str):
+                raise ValueError(f"corrected_text is not a string: {text!r}")
+            # null or "" removes the line
+            lines[index] = text or None
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidEditListError(f"Invalid edit list in LLM response: {e}") from e
+    return "\n".join(line for line in lines if line is not None)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """
+    Whether a failed chunk query is worth retrying.
+
+    Only transient failures are: dropped connections, timeouts, rate limits or
+    overload, and a malformed edit list (the next reply is usually valid).
+    Anything else, such as an invalid model or a bug, is raised at once.
+    """
+    if isinstance(error, _NON_RETRYABLE_ERRORS):
+        return False
+    if isinstance(error, (InvalidEditListError, *_TRANSIENT_ERRORS)):
+        return True
+    if type(error).__name__ in _TRANSIENT_SDK_ERRORS:
+        return True
+    return isinstance(error, LLMError) and bool(_TRANSIENT_MESSAGE_PATTERN.search(str(error)))
+
+
+def _chunk_cache_path(provider: LLMProvider, chunk: str) -> Path:
+    """
+    Cache entry of a refined chunk.
+
+    Keyed by model, full system prompt (which carries the prompt language and
+    domain context) and chunk text, so any change to those is a miss.
+    """
+    key = hashlib.sha256(
+        f"{provider.model}\0{provider.system_prompt}\0{chunk}".encode("utf-8")
+    ).hexdigest()
+    return get_cache_dir() / "refine" / f"{key}.txt"
+
+
+async def _refine_chunks(
+    chunks: List[str],
+    provider: LLMProvider,
+    parallelism: int,
+    use_cache: bool = True,
+    edits_only: bool = False,
+) -> List[str]:
+    """
+    Refine chunks concurrently, at most `parallelism` in flight; keeps input order.
+
+    With edits_only, chunks are sent with numbered lines and the returned edit
+    list is applied locally, so the model only generates the lines it changes.
+    """
+    semaphore = asyncio.Semaphore(max(parallelism, 1))
+    reused = 0
+    # Every chunk is sent with the same system prompt (the provider's), byte for
+    # byte, with the chunk as the only varying message, so the provider's prompt
+    # cache can serve the prefix. The first query goes alone to write that cache;
+    # the others wait for it and read the cached prefix instead of all writing it
+    primer_claimed = False
+    prefix_warm = asyncio.Event()
+
+    async def refine_chunk(index: int, chunk: str) -> str:
+        nonlocal reused, primer_claimed
+        cache_path = _chunk_cache_path(provider, chunk) if use_cache else None
+        if cache_path is not None and cache_path.exists():
+            cache_stats["hits"] += 1
+            reused += 1
+            return cache_path.read_text(encoding="utf-8")
+
+        if primer_claimed:
+            await prefix_warm.wait()
+        primer_claimed = True
+
+        for attempt in range(REFINE_MAX_RETRIES + 1):
+            try:
+                async with semaphore:
+                    logger.info(f"Refining chunk {index + 1}/{len(chunks)} ({len(chunk)} chars)...")
+                    if edits_only:
+                        response = await provider.aquery(text=number_lines(chunk))
+                        # A malformed edit list is retried like a failed query
+                        refined = apply_line_edits(chunk, response.text)
+                    else:
+                        response = await provider.aquery(text=chunk)
+                        refined = response.text
+                break
+            except Exception as e:
+                if attempt == REFINE_MAX_RETRIES or not _is_retryable(e):
+                    raise
+                delay = REFINE_RETRY_BASE_DELAY_S * 2**attempt
+                logger.warning(f"Chunk {index + 1} failed ({e}); retrying in {delay:.0f}s...")
+                # Sleep outside the semaphore so other chunks use the free slot
+                await asyncio.sleep(delay)
+            finally:
+                # Released after the first attempt, successful or not
+                prefix_warm.set()
+
+        if cache_path is not None:
+            cache_stats["misses"] += 1
+            try:
+                atomic_write_text(cache_path, refined)
+            except OSError as e:
+                logger.debug(f"Could not cache refined chunk: {e}")
+        return refined
+
+    # gather() returns results in submission order, so chunks are stitched back in place.
+    # A failing chunk doesn't cancel the others: every chunk that completes is
+    # cached, so rerunning after an interruption only queries what is missing
+    results = await asyncio.gather(
+        *(refine_chunk(i, chunk) for i, chunk in enumerate(chunks)), return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        if use_cache:
+            logger.warning(
+                f"{len(chunks) - len(errors)}/{len(chunks)} chunk(s) refined and saved; "
+                "rerun to resume from the remaining ones"
+            )
+        raise errors[0]
+    refined: List[str] = results
+    if reused:
+        # After an edit only the chunks whose text changed go back to the LLM
+        logger.info(f"Reused {reused}/{len(chunks)} unchanged chunk(s) from previous runs")
+    if use_cache:
+        logger.debug(f"Refine cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    return refined
+
+
+def refine_markdown(
+    content: str,
     model: Optional[str] = None,
     chunk_size: int = 10000,
     language: Optional[str] = None,
     domain_context: str = "",
-) -> tuple[str, str]:
+    parallelism: int = DEFAULT_REFINE_PARALLELISM,
+    use_cache: bool = True,
+    edits_only: bool = False,
+) -> tuple[str, str, str]:
     """
-    Refine a markdown transcription file, preserving structure and metadata.
+    Refine markdown transcription content, preserving structure and metadata.
 
     Args:
-        input_path: Input markdown file path
-        output_path: Output markdown file path
+        content: Markdown content (metalscribe format)
         model: Specific model
-        chunk_size: Maximum chunk size to process (characters, not used yet)
+        chunk_size: Maximum chunk size sent to the LLM per query (characters)
         language: Language code for prompt (overrides file metadata)
         domain_context: Optional domain context to inject.
+        parallelism: Maximum number of chunks refined concurrently
+        use_cache: Reuse previously refined chunks (same model, prompt and text)
+        edits_only: Ask the LLM for the changed lines only instead of the whole
+            chunk (fewer output tokens, so faster responses)
 
     Returns:
-        Tuple of (language_used, language_source) where source is "file", "cli", or "default"
+        Tuple of (refined_content, language_used, language_source) where source
+        is "file", "cli", or "default". refined_content is content itself when
+        there is no body to refine.
     """
-    content = input_path.read_text(encoding="utf-8")
+    # Separate header/metadata from main content and read the file language
+    # in one pass. metalscribe format has: title, metadata, "---", then content
+    file_language, header, body = parse_md_header(content)
 
-    # Extract language from file metadata if not provided
+    # Use language from file metadata if not provided
     language_source = "default"
     if language:
         language_source = "cli"
     else:
-        file_language = extract_language_from_metadata(content)
         if file_language:
             language = file_language
             language_source = "file"
         else:
             language = DEFAULT_PROMPT_LANGUAGE
 
-    # Separate header/metadata from main content
-    # metalscribe format has: title, metadata, "---", then content
-    lines = content.split("\n")
-    header_lines = []
-    body_start_idx = 0
+    if not body:
+        logger.warning("No content found to refine. Keeping original content.")
+        return content, language, language_source
 
-    # Find where header ends (line "---")
-    for i, line in enumerate(lines):
-        if line.strip() == "---":
-            body_start_idx = i + 1
-            break
-        header_lines.append(line)
+    # Process the body: chunks are independent queries, so they are sent
+    # concurrently (bounded by parallelism) instead of one round-trip at a time
+    chunks = split_into_chunks(body, chunk_size)
+    logger.info(f"Processing {len(body)} characters of content in {len(chunks)} chunk(s)...")
+    prompt = load_refine_prompt(language, domain_context=domain_context, edits_only=edits_only)
+    effective_model = model if model is not None else DEFAULT_REFINE_MODEL
+    provider = LLMProvider(model=effective_model, system_prompt=prompt)
+    refined_chunks = asyncio.run(
+        _refine_chunks(chunks, provider, parallelism, use_cache, edits_only=edits_only)
+    )
+    refined_body = "\n\n".join(chunk.strip() for chunk in refined_chunks)
 
-    header = "\n".join(header_lines) if header_lines else ""
-    body_lines = lines[body_start_idx:] if body_start_idx < len(lines) else lines
-    body = "\n".join(body_lines).strip()
+    # Reconstruct content preserving header
+    if header:
+        return header + "\n\n" + refined_body, language, language_source
+    return refined_body, language, language_source
 
-    if not body:
-        logger.warning("No content found to refine. Copying original file.")
-        output_path.write_text(content, encoding="utf-8")
-        return language, language_source
-
-    # Process the body
-    logger.info(f"Processing {len(body)} characters of content...")
-    refined_body = refine_text(
-        body,
+
+def refine_markdown_file(
+    input_path: Path,
+    output_path: Path,
+    model: Optional[str] = None,
+    chunk_size: int = 10000,
+    language: Optional[str] = None,
+    domain_context: str = "",
+    parallelism: int = DEFAULT_REFINE_PARALLELISM,
+    use_cache: bool = True,
+    edits_only: bool = False,
+    content: Optional[str] = None,
+) -> tuple[str, str]:
+    """
+    Refine a markdown transcription file, preserving structure and metadata.
+
+    Args:
+        input_path: Input markdown file path
+        output_path: Output markdown file path
+        model: Specific model
+        chunk_size: Maximum chunk size sent to the LLM per query (characters)
+        language: Language code for prompt (overrides file metadata)
+        domain_context: Optional domain context to inject.
+        parallelism: Maximum number of chunks refined concurrently
+        use_cache: Reuse previously refined chunks (same model, prompt and text)
+        edits_only: Ask the LLM for the changed lines only instead of the whole
+            chunk (fewer output tokens, so faster responses)
+        content: Content of input_path if the caller already has it (the
+            file is not read again).
+
+    Returns:
+        Tuple of (language_used, language_source) where source is "file", "cli", or "default"
+    """
+    if content is None:
+        content = input_path.read_text(encoding="utf-8")
+
+    output_content, language, language_source = refine_markdown(
+        content,
         model=model,
+        chunk_size=chunk_size,
         language=language,
         domain_context=domain_context,
+        parallelism=parallelism,
+        use_cache=use_cache,
+        edits_only=edits_only,
     )
 
-    # Reconstruct file preserving header
-    if header:
-        output_content = header + "\n\n" + refined_body
-    else:
-        output_content = refined_body
-
     output_path.write_text(output_content, encoding="utf-8")
     logger.info(f"Refined file saved to: {output_path}")
 
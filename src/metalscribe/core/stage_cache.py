@@ -0,0 +1,151 @@
+"""Content-addressed cache of transcription and diarization outputs."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, TypeVar
+
+from metalscribe.config import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Hit/miss counters for the current process (stages may run in parallel threads)
+stats: Dict[str, int] = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def audio_digest(audio_path: Path) -> str:
+    """
+    Returns the content hash of an audio file.
+
+    The file is streamed through the hasher in fixed-size chunks, so memory
+    stays constant even for hours-long recordings.
+
+    Args:
+        audio_path: Path to the (converted) WAV file
+
+    Returns:
+        Hex digest identifying the audio content, independent of its file name
+    """
+    with open(audio_path, "rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+
+def get_stage_cache_dir(digest: str) -> Path:
+    """Returns the cache directory holding the stage outputs of one audio."""
+    return get_cache_dir() / "stages" / digest
+
+
+def transcript_cache_path(digest: str, model_name: str, language: Optional[str]) -> Path:
+    """Returns the cached whisper JSON path for (audio, model, language)."""
+    return get_stage_cache_dir(digest) / f"{model_name}_{language or 'auto'}_transcript.json"
+
+
+def diarize_cache_path(digest: str, num_speakers: Optional[int]) -> Path:
+    """Returns the cached pyannote JSON path for (audio, speakers)."""
+    return get_stage_cache_dir(digest) / f"{num_speakers or 'auto'}_diarize.json"
+
+
+def _source_entry_path(input_path: Path, limit_minutes: Optional[float]) -> Path:
+    """Returns the cache entry of a source file, keyed by its identity and --limit."""
+    stat = input_path.stat()
+    key = f"{input_path.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}\0{limit_minutes}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return get_cache_dir() / "sources" / f"{digest}.json"
+
+
+def lookup_source(input_path: Path, limit_minutes: Optional[float] = None) -> Optional[dict]:
+    """
+    Returns what an earlier conversion of this source produced.
+
+    The source is identified by path, size and mtime (not content), so an
+    unchanged input can be matched without decoding it again.
+
+    Args:
+        input_path: Original (unconverted) audio file
+        limit_minutes: The --limit the audio was converted with
+
+    Returns:
+        Dict with the converted audio's "digest" and "duration" (seconds),
+        or None if this source was not converted before
+    """
+    try:
+        entry = json.loads(_source_entry_path(input_path, limit_minutes).read_text(encoding="utf-8"))
+        return {"digest": str(entry["digest"]), "duration": float(entry["duration"])}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def remember_source(
+    input_path: Path, limit_minutes: Optional[float], digest: str, duration: float
+) -> None:
+    """Records the digest and duration of a converted source for lookup_source(); best effort."""
+    entry_path = _source_entry_path(input_path, limit_minutes)
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"digest": digest, "duration": duration}, f)
+        os.replace(tmp_name, entry_path)
+    except OSError as e:
+        logger.debug(f"Could not record source {input_path}: {e}")
+
+
+def _count(key: str) -> None:
+    with _stats_lock:
+        stats[key] += 1
+
+
+def _store(output_json: Path, cache_path: Path) -> None:
+    """Copies a stage output into the cache; write-then-rename, best effort."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(output_json, tmp_name)
+        os.replace(tmp_name, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not cache {output_json}: {e}")
+
+
+def run_cached_stage(
+    cache_path: Optional[Path],
+    output_json: Path,
+    run: Callable[[], T],
+    parse: Callable[[Path], T],
+) -> T:
+    """
+    Runs a stage unless its raw JSON output is already cached.
+
+    On a hit the cached JSON is parsed and the stage (whisper-cli / pyannote)
+    is skipped. On a miss the stage runs and its output_json is copied into
+    the cache for the next run.
+
+    Args:
+        cache_path: Cache entry for this stage, or None to bypass the cache
+        output_json: JSON file the stage writes
+        run: Runs the stage and returns its parsed segments
+        parse: Parser for the stage's JSON output
+
+    Returns:
+        The stage segments
+    """
+    if cache_path is None:
+        return run()
+
+    if cache_path.exists():
+        _count("hits")
+        logger.info(f"Cache hit: {cache_path}")
+        return parse(cache_path)
+
+    _count("misses")
+    result = run()
+    _store(output_json, cache_path)
+    return result
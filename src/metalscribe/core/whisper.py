@@ -1,18 +1,165 @@
 """Wrapper for whisper.cpp."""
 
+import json
 import logging
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from metalscribe.config import ExitCode, get_brew_prefix
+from metalscribe.config import ExitCode, get_brew_prefix, get_temp_dir
+from metalscribe.core.audio import is_wav_16k_mono, load_wav_16k_mono
 from metalscribe.core.models import TranscriptSegment
 from metalscribe.core.setup import download_whisper_model, download_vad_model
 from metalscribe.parsers.whisper_parser import parse_whisper_output
 from metalscribe.utils.subprocess import run_command
 
+try:
+    # Optional CTranslate2 backend (int8 weights); whisper.cpp stays the default
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
 logger = logging.getLogger(__name__)
 
+BACKEND_WHISPER_CPP = "whisper.cpp"
+BACKEND_CT2_INT8 = "ct2-int8"
+BACKENDS = (BACKEND_WHISPER_CPP, BACKEND_CT2_INT8)
+
+# Read size used to pull model files into the OS page cache
+PRELOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Located whisper.cpp binary; only a found path is kept, so a binary built
+# later in the same process (e.g. by doctor --setup) is still picked up
+_whisper_binary: Optional[Path] = None
+
+
+def find_whisper_binary() -> Optional[Path]:
+    """Locates the whisper.cpp binary (cached once found)."""
+    global _whisper_binary
+    from metalscribe.config import get_cache_dir
+
+    if _whisper_binary is not None:
+        return _whisper_binary
+
+    brew_prefix = get_brew_prefix()
+    cache_dir = get_cache_dir()
+
+    whisper_paths = [
+        # Priority 1: locally compiled in cache
+        cache_dir / "whisper.cpp" / "build" / "bin" / "whisper-cli",
+        # Priority 2: Homebrew
+        brew_prefix / "bin" / "whisper",
+        brew_prefix / "bin" / "whisper-cli",
+        # Priority 3: global paths
+        Path("/usr/local/bin/whisper"),
+        Path("/usr/local/bin/whisper-cli"),
+    ]
+
+    for path in whisper_paths:
+        if path.exists():
+            _whisper_binary = path
+            return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def load_model(model_name: str) -> Tuple[Path, Path]:
+    """
+    Resolves (downloading if needed) the Whisper and VAD model files.
+
+    Cached so repeated transcriptions with the same model (e.g. batch runs)
+    skip the download/existence checks.
+
+    Returns:
+        Tuple of (model_path, vad_model_path)
+    """
+    return download_whisper_model(model_name), download_vad_model()
+
+
+@lru_cache(maxsize=None)
+def load_ct2_model(model_name: str) -> "WhisperModel":
+    """
+    Loads a CTranslate2 Whisper model with int8 weights (cached per model).
+
+    ggml quantization suffixes (e.g. large-v3-q5_0) are dropped: CTranslate2
+    quantizes the base checkpoint itself.
+    """
+    ct2_name = model_name.split("-q", 1)[0]
+    logger.info(f"Loading CTranslate2 model {ct2_name} (int8)...")
+    return WhisperModel(ct2_name, device="auto", compute_type="int8")
+
+
+def preload_model(model_name: str, backend: str = BACKEND_WHISPER_CPP) -> None:
+    """
+    Loads the model ahead of transcription, e.g. while the audio is converted.
+
+    ct2-int8 weights go into load_ct2_model's cache. whisper.cpp loads them in
+    its own process, so the model files are resolved (downloaded if needed)
+    and read once, leaving them in the OS page cache for whisper-cli.
+
+    Args:
+        model_name: Model name (tiny, base, small, medium, large-v3)
+        backend: "whisper.cpp" (default) or "ct2-int8"
+    """
+    if backend == BACKEND_CT2_INT8:
+        if WhisperModel is not None:
+            load_ct2_model(model_name)
+        return
+
+    for path in load_model(model_name):
+        with open(path, "rb") as f:
+            while f.read(PRELOAD_CHUNK_SIZE):
+                pass
+
+
+def _run_ct2_transcription(
+    audio_path: Path,
+    model_name: str,
+    language: Optional[str],
+    output_base: Optional[Path],
+) -> List[TranscriptSegment]:
+    """Transcribes with faster-whisper, writing whisper.cpp-compatible outputs."""
+    if WhisperModel is None:
+        logger.error("faster-whisper not installed. Run: pip install 'metalscribe[ct2]'")
+        exit(ExitCode.MISSING_DEPENDENCY)
+
+    # The converted WAV is already 16kHz mono PCM: hand faster-whisper the
+    # samples instead of letting it decode and resample the file again
+    # (numpy ships with faster-whisper)
+    audio = load_wav_16k_mono(audio_path) if is_wav_16k_mono(audio_path) else str(audio_path)
+
+    try:
+        raw_segments, _ = load_ct2_model(model_name).transcribe(
+            audio, language=language, vad_filter=True
+        )
+        segments = [
+            TranscriptSegment(
+                start_ms=int(seg.start * 1000), end_ms=int(seg.end * 1000), text=seg.text.strip()
+            )
+            for seg in raw_segments
+            if seg.text.strip()
+        ]
+    except Exception as e:
+        logger.error(f"Transcription error: {e}")
+        exit(ExitCode.TRANSCRIPTION_FAILED)
+
+    if output_base is not None:
+        # Same layout whisper.cpp writes with -oj/-otxt, so downstream readers don't care
+        payload = {
+            "transcription": [
+                {"offsets": {"from": seg.start_ms, "to": seg.end_ms}, "text": seg.text}
+                for seg in segments
+            ]
+        }
+        Path(f"{output_base}.json").write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        Path(f"{output_base}.txt").write_text(
+            "".join(f"{seg.text}\n" for seg in segments), encoding="utf-8"
+        )
+
+    logger.info(f"Transcription complete: {len(segments)} segments")
+    return segments
+
 
 def run_transcription(
     audio_path: Path,
@@ -20,6 +167,7 @@ def run_transcription(
     language: Optional[str] = None,
     output_base: Optional[Path] = None,
     verbose: bool = False,
+    backend: str = BACKEND_WHISPER_CPP,
 ) -> List[TranscriptSegment]:
     """
     Runs transcription using whisper.cpp with Metal GPU.
@@ -32,6 +180,8 @@ def run_transcription(
                     If provided, whisper will generate {output_base}.json, .srt, etc.
                     If None, temporary files are used.
         verbose: If True, adds --print-colors to whisper command.
+        backend: "whisper.cpp" (default) or "ct2-int8" (faster-whisper with
+                 int8 weights; requires the optional `ct2` extra).
 
     Returns:
         List of TranscriptSegment
@@ -39,45 +189,34 @@ def run_transcription(
     Raises:
         SystemExit: If transcription fails
     """
-    # Find whisper binary
-    from metalscribe.config import get_cache_dir
-
-    brew_prefix = get_brew_prefix()
-    cache_dir = get_cache_dir()
-
-    whisper_paths = [
-        # Priority 1: locally compiled in cache
-        cache_dir / "whisper.cpp" / "build" / "bin" / "whisper-cli",
-        # Priority 2: Homebrew
-        brew_prefix / "bin" / "whisper",
-        brew_prefix / "bin" / "whisper-cli",
-        # Priority 3: global paths
-        Path("/usr/local/bin/whisper"),
-        Path("/usr/local/bin/whisper-cli"),
-    ]
+    if output_base is None:
+        # Private temp dir (RAM-backed when available), removed once parsed
+        with tempfile.TemporaryDirectory(prefix="metalscribe-", dir=get_temp_dir()) as work_dir:
+            return run_transcription(
+                audio_path,
+                model_name,
+                language,
+                output_base=Path(work_dir) / "transcript",
+                verbose=verbose,
+                backend=backend,
+            )
 
-    whisper_bin = None
-    for path in whisper_paths:
-        if path.exists():
-            whisper_bin = path
-            break
+    if backend not in BACKENDS:
+        logger.error(f"Unknown transcription backend: {backend}")
+        exit(ExitCode.INVALID_INPUT)
+    if backend == BACKEND_CT2_INT8:
+        return _run_ct2_transcription(audio_path, model_name, language, output_base)
 
+    whisper_bin = find_whisper_binary()
     if not whisper_bin:
         logger.error("whisper.cpp not found. Run: metalscribe doctor --setup")
         exit(ExitCode.MISSING_DEPENDENCY)
 
-    # Download model if needed
-    model_path = download_whisper_model(model_name)
-    vad_model_path = download_vad_model()
+    # Download model if needed (resolved once per model per process)
+    model_path, vad_model_path = load_model(model_name)
 
-    # Prepare output base
-    if output_base is None:
-        temp_json = Path(tempfile.mktemp(suffix=".json"))
-        output_base_str = str(temp_json).rsplit(".json", 1)[0]
-        output_json = temp_json
-    else:
-        output_base_str = str(output_base)
-        output_json = output_base.with_suffix(".json")
+    output_base_str = str(output_base)
+    output_json = output_base.with_suffix(".json")
 
     logger.info(f"Transcribing with model {model_name}...")
     logger.info(f"Output base: {output_base_str}")
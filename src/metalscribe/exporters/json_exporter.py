@@ -7,9 +7,25 @@ from typing import List, Optional
 
 from metalscribe.core.models import DiarizeSegment, MergedSegment, TranscriptSegment
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _write_json(output: dict, output_path: Path) -> None:
+    # orjson encodes straight to UTF-8 bytes, with the same layout as
+    # indent=2/ensure_ascii=False below
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        return
+    # dumps() + one write instead of dump(), which streams many small chunks
+    # through the file object and never takes the one-shot encoder path
+    output_path.write_text(json.dumps(output, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
 def export_json(
     segments: List[MergedSegment], output_path: Path, metadata: Optional[dict] = None
 ) -> None:
@@ -34,8 +50,7 @@ def export_json(
         ],
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    _write_json(output, output_path)
 
     logger.info(f"JSON exported: {output_path}")
 
@@ -63,8 +78,7 @@ def export_transcript_json(
         ],
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    _write_json(output, output_path)
 
     logger.info(f"Transcription JSON exported: {output_path}")
 
@@ -92,7 +106,6 @@ def export_diarize_json(
         ],
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    _write_json(output, output_path)
 
     logger.info(f"Diarization JSON exported: {output_path}")
@@ -21,12 +21,62 @@ def format_timestamp_md(ms: int) -> str:
     return f"{minutes:02d}:{seconds:02d}"
 
 
+def render_markdown(
+    segments: List[MergedSegment],
+    title: Optional[str] = None,
+    metadata: Optional[dict] = None,
+) -> str:
+    """
+    Renders segments as readable Markdown.
+
+    Args:
+        segments: List of merged segments
+        title: Document title (optional)
+        metadata: Additional metadata (optional)
+
+    Returns:
+        The Markdown document
+    """
+    # Header
+    parts = [f"# {title}\n\n" if title else "# Transcription\n\n"]
+
+    # Metadata
+    if metadata:
+        parts.append("## Metadata\n\n")
+        for key, value in metadata.items():
+            parts.append(f"- **{key}**: {value}\n")
+        parts.append("\n")
+
+    # Total duration
+    if segments:
+        total_duration = segments[-1].end_ms - segments[0].start_ms
+        duration_str = format_timestamp_md(total_duration)
+        parts.append(f"**Total duration**: {duration_str}\n\n")
+
+    parts.append("---\n\n")
+
+    # Segments
+    current_speaker = None
+    for seg in segments:
+        # Group by speaker
+        if seg.speaker != current_speaker:
+            if current_speaker is not None:
+                parts.append("\n")
+            parts.append(f"## {seg.speaker}\n\n")
+            current_speaker = seg.speaker
+
+        timestamp = format_timestamp_md(seg.start_ms)
+        parts.append(f"**[{timestamp}]** {seg.text}\n\n")
+
+    return "".join(parts)
+
+
 def export_markdown(
     segments: List[MergedSegment],
     output_path: Path,
     title: Optional[str] = None,
     metadata: Optional[dict] = None,
-) -> None:
+) -> str:
     """
     Exports segments to readable Markdown.
 
@@ -35,40 +85,11 @@ def export_markdown(
         output_path: Output Markdown file path
         title: Document title (optional)
         metadata: Additional metadata (optional)
-    """
-    with open(output_path, "w", encoding="utf-8") as f:
-        # Header
-        if title:
-            f.write(f"# {title}\n\n")
-        else:
-            f.write("# Transcription\n\n")
-
-        # Metadata
-        if metadata:
-            f.write("## Metadata\n\n")
-            for key, value in metadata.items():
-                f.write(f"- **{key}**: {value}\n")
-            f.write("\n")
-
-        # Total duration
-        if segments:
-            total_duration = segments[-1].end_ms - segments[0].start_ms
-            duration_str = format_timestamp_md(total_duration)
-            f.write(f"**Total duration**: {duration_str}\n\n")
-
-        f.write("---\n\n")
-
-        # Segments
-        current_speaker = None
-        for seg in segments:
-            # Group by speaker
-            if seg.speaker != current_speaker:
-                if current_speaker is not None:
-                    f.write("\n")
-                f.write(f"## {seg.speaker}\n\n")
-                current_speaker = seg.speaker
-
-            timestamp = format_timestamp_md(seg.start_ms)
-            f.write(f"**[{timestamp}]** {seg.text}\n\n")
 
+    Returns:
+        The Markdown written, so callers can use it without reading the file back
+    """
+    content = render_markdown(segments, title=title, metadata=metadata)
+    output_path.write_text(content, encoding="utf-8")
     logger.info(f"Markdown exported: {output_path}")
+    return content
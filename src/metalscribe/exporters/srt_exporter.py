@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import List
+from typing import Iterable
 
 from metalscribe.core.models import MergedSegment
 
@@ -21,14 +21,14 @@ def format_timestamp(ms: int) -> str:
     return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
 
 
-def export_srt(segments: List[MergedSegment], output_path: Path) -> None:
+def export_srt(segments: Iterable[MergedSegment], output_path: Path) -> None:
     """
     Exports segments to SRT with speaker prefix.
 
     Format: [SPEAKER_00] text
 
     Args:
-        segments: List of merged segments
+        segments: Merged segments (any iterable; consumed in a single pass)
         output_path: Output SRT file path
     """
     with open(output_path, "w", encoding="utf-8") as f:
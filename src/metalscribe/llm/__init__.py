@@ -6,6 +6,7 @@ from .auth import (
     check_sdk_installed,
     ensure_authenticated,
     verify_setup,
+    warm_up_authentication,
 )
 from .exceptions import (
     AuthenticationError,
@@ -26,6 +27,7 @@ __all__ = [
     "check_sdk_installed",
     "ensure_authenticated",
     "verify_setup",
+    "warm_up_authentication",
     # Exceptions
     "LLMError",
     "AuthenticationError",
@@ -1,14 +1,20 @@
 """Claude Code authentication verification and setup guide."""
 
 import shutil
+import threading
 from typing import Tuple
 
-from rich.console import Console
 from rich.panel import Panel
 
+from metalscribe.utils.console import console
+
 from .exceptions import AuthenticationError, CLINotInstalledError, SDKNotInstalledError
 
-console = Console()
+# A successful verify_setup() is shared by every provider in the process, since
+# check_authenticated() makes a real test query. Failures are not cached, so
+# they are re-checked (and reported) by the next caller
+_setup_verified = False
+_setup_lock = threading.Lock()
 
 
 def check_sdk_installed() -> bool:
@@ -107,6 +113,34 @@ def verify_setup() -> Tuple[bool, str]:
     return True, ""
 
 
+def _verify_setup_once() -> Tuple[bool, str]:
+    """verify_setup(), skipped once it has succeeded in this process."""
+    global _setup_verified
+    # Held during the check, so a caller waits for a verification in flight
+    # (e.g. the background warm-up) instead of starting a second one
+    with _setup_lock:
+        if _setup_verified:
+            return True, ""
+        success, error_type = verify_setup()
+        _setup_verified = success
+        return success, error_type
+
+
+def warm_up_authentication() -> threading.Thread:
+    """
+    Verify the Claude Code setup in a background thread.
+
+    Lets callers overlap the CLI lookup and test query with other work
+    (e.g. transcription); the first provider query then finds it done.
+
+    Returns:
+        The started daemon thread
+    """
+    thread = threading.Thread(target=_verify_setup_once, name="llm-auth-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
 def show_setup_guide(error_type: str) -> None:
     """Show setup guide based on error type."""
 
@@ -162,7 +196,7 @@ def ensure_authenticated(auto_guide: bool = True) -> None:
         SDKNotInstalledError: If SDK is not installed
         AuthenticationError: If not authenticated
     """
-    success, error_type = verify_setup()
+    success, error_type = _verify_setup_once()
 
     if success:
         return
@@ -155,6 +155,33 @@ class LLMProvider:
             )
         )
 
+    async def aquery(
+        self,
+        text: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> LLMResponse:
+        """
+        Async version of query(), for running several queries concurrently.
+
+        Args:
+            text: Text to be processed (user message)
+            system_prompt: System prompt (overrides default)
+            model: Model (overrides default)
+
+        Returns:
+            LLMResponse with generated text
+        """
+        # The setup check runs its own event loop (asyncio.run), which is not
+        # allowed inside this one, so it runs in a worker thread
+        await asyncio.to_thread(self._ensure_setup)
+
+        return await self._async_query(
+            text=text,
+            system_prompt=system_prompt,
+            model=model,
+        )
+
     async def stream(
         self,
         text: str,
@@ -167,7 +194,7 @@ class LLMProvider:
         Yields:
             Text chunks as they are generated
         """
-        self._ensure_setup()
+        await asyncio.to_thread(self._ensure_setup)
 
         from claude_agent_sdk import ClaudeAgentOptions, query
         from claude_agent_sdk.types import AssistantMessage, TextBlock
@@ -2,16 +2,51 @@
 
 import json
 import logging
+import wave
 from pathlib import Path
+from typing import Optional
 
 from metalscribe.utils.subprocess import run_command
 
+try:
+    # Optional: reads the header of FLAC/OGG/AIFF/... without spawning ffprobe
+    import soundfile
+except ImportError:
+    soundfile = None
+
 logger = logging.getLogger(__name__)
 
 
+def _read_header_duration(audio_path: Path) -> Optional[float]:
+    """
+    Gets audio duration from the file header, without a subprocess.
+
+    Returns:
+        Duration in seconds, or None if the header can't be read here
+    """
+    if audio_path.suffix.lower() == ".wav":
+        try:
+            with wave.open(str(audio_path), "rb") as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError, OSError, ZeroDivisionError):
+            pass
+
+    if soundfile is not None:
+        try:
+            return soundfile.info(str(audio_path)).duration
+        except Exception:
+            # Container not supported by libsndfile (e.g. m4a)
+            pass
+
+    return None
+
+
 def get_audio_duration(audio_path: Path) -> float:
     """
-    Gets audio duration in seconds using ffprobe.
+    Gets audio duration in seconds.
+
+    Reads the file header when possible (WAV, or any format soundfile
+    supports if it is installed) and falls back to ffprobe otherwise.
 
     Args:
         audio_path: Audio file path
@@ -19,6 +54,10 @@ def get_audio_duration(audio_path: Path) -> float:
     Returns:
         Duration in seconds
     """
+    duration = _read_header_duration(audio_path)
+    if duration is not None:
+        return duration
+
     try:
         result = run_command(
             [
@@ -0,0 +1,7 @@
+"""Shared Rich console."""
+
+from rich.console import Console
+
+# One Console for the whole CLI: commands, logging and auth messages share it,
+# so terminal detection (tty, size, color system) runs once per process
+console = Console()
@@ -0,0 +1,47 @@
+"""File writing utilities."""
+
+import os
+import tempfile
+from pathlib import Path
+
+from metalscribe.config import get_temp_dir
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Writes text to path atomically (write to a temp file, then rename).
+
+    Concurrent readers see either the previous file or the complete new one,
+    never a partial write. Creates the parent directory if needed.
+
+    Args:
+        path: Destination file
+        text: Content to write (UTF-8)
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def make_work_dir() -> Path:
+    """
+    Creates a private (0700) directory for a pipeline run's intermediates.
+
+    Files are created inside it under fixed names, avoiding the mktemp()
+    name race. The caller removes it when done.
+
+    Returns:
+        Path of the new directory, under get_temp_dir()
+    """
+    temp_dir = get_temp_dir()
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(prefix="metalscribe-", dir=temp_dir))
@@ -1,13 +1,13 @@
 """Logging utilities."""
 
 import logging
+import time
 from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
 from rich.logging import RichHandler
 
-console = Console()
+from metalscribe.utils.console import console
 
 
 def format_duration(seconds: float) -> str:
@@ -26,6 +26,14 @@ def format_duration(seconds: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
+def format_timing(stage: str, duration: float, rtf: Optional[float] = None) -> str:
+    """Formats a timings log line: "Stage: HH:MM:SS (1.23s) (RTF: 0.123)"."""
+    line = f"{stage}: {format_duration(duration)} ({duration:.2f}s)"
+    if rtf:
+        line += f" (RTF: {rtf:.3f})"
+    return line
+
+
 def setup_logging(verbose: bool = False, log_file: Optional[Path] = None) -> None:
     """Configures logging with Rich."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -50,3 +58,10 @@ def log_timing(stage: str, duration: float, rtf: Optional[float] = None) -> None
     if rtf is not None:
         msg += f" (RTF: {rtf:.3f})"
     console.print(msg)
+
+
+def timed(fn, *args, **kwargs):
+    """Calls fn and returns (result, elapsed seconds), timed inside its worker."""
+    start = time.time()
+    result = fn(*args, **kwargs)
+    return result, time.time() - start
@@ -3,6 +3,133 @@
 from __future__ import annotations
 
 import re
+from pathlib import Path
+
+# A line holding only "---" ends the header (title + metadata) of metalscribe markdown
+_HEADER_SEPARATOR = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+_HEADER_SEPARATOR_BYTES = re.compile(rb"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+# read_header() gives up looking for the separator after this many bytes
+MAX_HEADER_BYTES = 256 * 1024
+# Matches: - **prompt_language**: pt-BR (at the start of any line)
+_PROMPT_LANGUAGE = re.compile(
+    r"^[-*\s]*?\*?\*?prompt_language\*?\*?:[^\S\n]*(.+)", re.IGNORECASE | re.MULTILINE
+)
+
+
+def split_header(content: str) -> tuple[str, str]:
+    """
+    Split markdown content at the first "---" line.
+
+    A single regex scan finds the separator, so large transcriptions are not
+    split into per-line lists and joined back.
+
+    Args:
+        content: The markdown file content.
+
+    Returns:
+        Tuple of (header, body). The header is the text before the separator
+        ("" if there is none); the body is the stripped text after it, or the
+        whole content stripped when there is no separator.
+    """
+    match = _HEADER_SEPARATOR.search(content)
+    if not match:
+        return "", content.strip()
+    header = content[: match.start()]
+    if header.endswith("\n"):
+        header = header[:-1]
+    return header, content[match.end() :].strip()
+
+
+def parse_md_header(content: str) -> tuple[str | None, str, str]:
+    """
+    Extract prompt_language, header and body of markdown content in one pass.
+
+    One regex search finds the "---" separator and one more finds the
+    language inside the header slice; no list of lines is built.
+
+    Args:
+        content: The markdown file content.
+
+    Returns:
+        Tuple of (language, header, body). language is the prompt_language
+        value or None (searched in the whole content when there is no
+        separator); header and body are the same as split_header().
+    """
+    separator = _HEADER_SEPARATOR.search(content)
+    header_end = separator.start() if separator else len(content)
+    language_match = _PROMPT_LANGUAGE.search(content, 0, header_end)
+    language = language_match.group(1).strip() if language_match else None
+
+    if not separator:
+        return language, "", content.strip()
+    header = content[:header_end]
+    if header.endswith("\n"):
+        header = header[:-1]
+    return language, header, content[separator.end() :].strip()
+
+
+def read_header(
+    path: Path, chunk_size: int = 65536, max_bytes: int = MAX_HEADER_BYTES
+) -> tuple[str | None, str, int]:
+    """
+    Read a markdown file only up to its "---" separator.
+
+    Lets callers inspect the metadata (e.g. the prompt language) without
+    loading a large transcription body. Each chunk is searched from the
+    start of the line it continues only, and the scan gives up after
+    max_bytes (metalscribe headers are a few lines).
+
+    Args:
+        path: The markdown file.
+        chunk_size: Bytes read per step while looking for the separator.
+        max_bytes: Bytes scanned before the file is treated as having no
+            separator.
+
+    Returns:
+        Tuple of (language, header, body_offset), like parse_md_header() on
+        the full text: language is the prompt_language value or None
+        (searched in the bytes read when there is no separator); body_offset
+        is the byte offset where the body starts (0 if there is no
+        separator, i.e. the whole file is body).
+    """
+    buf = bytearray()
+    # Start of the last (possibly unfinished) line: earlier lines were searched
+    line_start = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            buf += chunk
+            match = _HEADER_SEPARATOR_BYTES.search(buf, line_start)
+            # A match at the very end may be a longer line split across chunks
+            if match and (match.end() < len(buf) or not chunk):
+                header = buf[: match.start()].decode("utf-8")
+                language = _PROMPT_LANGUAGE.search(header)
+                if header.endswith("\n"):
+                    header = header[:-1]
+                return (language.group(1).strip() if language else None), header, match.end()
+            if not chunk or len(buf) >= max_bytes:
+                # No separator: the language is looked up in what was read
+                language = _PROMPT_LANGUAGE.search(buf.decode("utf-8", errors="ignore"))
+                return (language.group(1).strip() if language else None), "", 0
+            newline = chunk.rfind(b"\n")
+            if newline >= 0:
+                line_start = len(buf) - len(chunk) + newline + 1
+
+
+def read_body(path: Path, body_offset: int) -> str:
+    """
+    Read the stripped body of a markdown file from the offset given by read_header().
+
+    Args:
+        path: The markdown file.
+        body_offset: Byte offset where the body starts (from read_header()).
+
+    Returns:
+        The body text, stripped (same as the body returned by split_header()).
+    """
+    with open(path, "rb") as f:
+        f.seek(body_offset)
+        return f.read().decode("utf-8").strip()
 
 
 def extract_language_from_metadata(content: str) -> str | None:
@@ -18,12 +145,4 @@ def extract_language_from_metadata(content: str) -> str | None:
     Returns:
         The prompt_language value if found, None otherwise.
     """
-    lines = content.split("\n")
-    for line in lines:
-        if line.strip() == "---":
-            break
-        # Match: - **prompt_language**: pt-BR
-        match = re.match(r"[-*\s]*\*?\*?prompt_language\*?\*?:\s*(.+)", line, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-    return None
+    return parse_md_header(content)[0]
@@ -0,0 +1,113 @@
+"""Testes dos adaptadores de importação de transcrições."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from metalscribe.adapters import import_transcript
+from metalscribe.adapters.formats.voxtral import VoxtralAdapter
+
+
+def _voxtral_data() -> dict:
+    return {
+        "model": "voxtral-mini-latest",
+        "segments": [
+            {"start": 0.0, "end": 1.5, "text": " Olá ", "speaker_id": "speaker_1"},
+            {"start": 1.5, "end": 2.0, "text": "   ", "speaker_id": "speaker_2"},
+            {"start": 2.0, "end": 3.25, "text": "Tudo bem?", "speaker_id": "speaker_2"},
+        ],
+    }
+
+
+def test_voxtral_parse_skips_empty_segments():
+    """Testa conversão Voxtral -> MergedSegment descartando textos vazios."""
+    segments = VoxtralAdapter.parse(_voxtral_data())
+
+    assert len(segments) == 2
+    assert segments[0].start_ms == 0
+    assert segments[0].end_ms == 1500
+    assert segments[0].text == "Olá"
+    assert segments[0].speaker == "SPEAKER_01"
+    assert segments[1].start_ms == 2000
+    assert segments[1].end_ms == 3250
+    assert segments[1].speaker == "SPEAKER_02"
+
+
+def test_import_transcript_voxtral(tmp_path: Path):
+    """Testa importação de arquivo Voxtral com detecção automática."""
+    json_path = tmp_path / "voxtral.json"
+    json_path.write_text(json.dumps(_voxtral_data()), encoding="utf-8")
+
+    segments = import_transcript(json_path)
+
+    assert [seg.text for seg in segments] == ["Olá", "Tudo bem?"]
+
+
+def test_import_transcript_unknown_format(tmp_path: Path):
+    """Testa erro para formato não reconhecido."""
+    json_path = tmp_path / "unknown.json"
+    json_path.write_text(json.dumps({"foo": "bar"}), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        import_transcript(json_path)
+
+
+def test_detect_format_runs_detect_on_every_call(monkeypatch):
+    """Testa que a detecção não reaproveita resultados de outro JSON."""
+    from metalscribe.adapters import detect_format
+    from metalscribe.adapters.registry import _ADAPTER_REGISTRY, TranscriptFormat
+
+    calls = []
+
+    def counting_detect(data):
+        calls.append(data)
+        return VoxtralAdapter.detect(data)
+
+    # O detector chama o detect resolvido no registro, não o atributo da classe
+    monkeypatch.setitem(
+        _ADAPTER_REGISTRY, TranscriptFormat.VOXTRAL, (VoxtralAdapter, counting_detect)
+    )
+
+    assert detect_format(_voxtral_data()) == TranscriptFormat.VOXTRAL
+    assert detect_format(_voxtral_data()) == TranscriptFormat.VOXTRAL
+    assert len(calls) == 2
+
+    assert detect_format({"foo": "bar"}) is None
+
+
+def test_voxtral_normalize_speaker():
+    """Testa normalização de speaker_id."""
+    assert VoxtralAdapter._normalize_speaker("speaker_1") == "SPEAKER_01"
+    assert VoxtralAdapter._normalize_speaker("speaker_12") == "SPEAKER_12"
+    assert VoxtralAdapter._normalize_speaker("speaker_1") == "SPEAKER_01"
+    assert VoxtralAdapter._normalize_speaker("alice") == "ALICE"
+
+
+def test_iter_transcript_is_lazy(tmp_path: Path):
+    """Testa que iter_transcript devolve um gerador com os mesmos segmentos."""
+    from metalscribe.adapters import iter_transcript
+
+    json_path = tmp_path / "voxtral.json"
+    json_path.write_text(json.dumps(_voxtral_data()), encoding="utf-8")
+
+    segments = iter_transcript(json_path)
+
+    assert not isinstance(segments, list)
+    assert [seg.text for seg in segments] == ["Olá", "Tudo bem?"]
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"model": "Voxtral-Mini-Latest", "segments": []}, True),
+        ({"segments": [{"type": "transcription_segment"}]}, True),
+        ({"segments": [{"speaker_id": "speaker_1"}]}, True),
+        ({"segments": [{"text": "oi"}]}, False),
+        ({"model": "whisper", "segments": []}, False),
+        ({}, False),
+    ],
+)
+def test_voxtral_detect_triggers(data, expected):
+    """Testa os gatilhos pré-compilados do Voxtral."""
+    assert VoxtralAdapter.detect(data) is expected
@@ -0,0 +1,76 @@
+"""Tests for audio conversion."""
+
+from __future__ import annotations
+
+import wave
+
+import pytest
+
+from metalscribe.core import audio
+
+
+def write_wav(path, rate, channels=1):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\0\0" * channels * rate)
+
+
+def test_convert_skips_wav_already_16k_mono(tmp_path, monkeypatch):
+    commands = []
+    monkeypatch.setattr(audio, "run_command", lambda cmd: commands.append(cmd))
+    source = tmp_path / "meeting.wav"
+    write_wav(source, 16000)
+    output = tmp_path / "work" / "audio.wav"
+    output.parent.mkdir()
+
+    audio.convert_to_wav_16k(source, output)
+
+    assert commands == []
+    assert output.is_symlink() and output.resolve() == source.resolve()
+
+
+def test_convert_reencodes_other_wavs(tmp_path, monkeypatch):
+    def fake_ffmpeg(cmd):
+        commands.append(cmd)
+        write_wav(output, 16000)
+
+    commands = []
+    monkeypatch.setattr(audio, "run_command", fake_ffmpeg)
+    source = tmp_path / "meeting.wav"
+    output = tmp_path / "audio.wav"
+
+    write_wav(source, 44100, channels=2)
+    audio.convert_to_wav_16k(source, output)
+    write_wav(source, 16000)
+    audio.convert_to_wav_16k(source, output, limit_minutes=1)
+
+    assert len(commands) == 2
+    assert not audio.is_wav_16k_mono(tmp_path / "missing.wav")
+
+
+def test_convert_in_place_keeps_wav_already_16k_mono(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio, "run_command", lambda cmd: None)
+    source = tmp_path / "meeting.wav"
+    write_wav(source, 16000)
+    data = source.read_bytes()
+
+    audio.convert_to_wav_16k(source, source)
+
+    assert not source.is_symlink() and source.read_bytes() == data
+
+
+def test_load_wav_16k_mono_returns_float_samples(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "audio.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(np.array([0, 16384, -32768], dtype="<i2").tobytes())
+
+    samples = audio.load_wav_16k_mono(path)
+
+    assert samples.dtype == np.float32
+    assert samples.tolist() == [0.0, 0.5, -1.0]
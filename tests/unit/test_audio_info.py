@@ -0,0 +1,43 @@
+"""Tests for audio information utilities."""
+
+from __future__ import annotations
+
+import wave
+
+from metalscribe.utils import audio_info
+from metalscribe.utils.audio_info import get_audio_duration
+
+
+def test_wav_duration_is_read_from_header(tmp_path, monkeypatch):
+    audio = tmp_path / "audio.wav"
+    with wave.open(str(audio), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(bytes(2 * 16000 * 3))
+
+    def no_subprocess(*_args, **_kwargs):
+        raise AssertionError("ffprobe should not be called for WAV files")
+
+    monkeypatch.setattr(audio_info, "run_command", no_subprocess)
+
+    assert get_audio_duration(audio) == 3.0
+
+
+def test_unreadable_header_falls_back_to_ffprobe(tmp_path, monkeypatch):
+    audio = tmp_path / "audio.m4a"
+    audio.write_bytes(b"not audio")
+    calls = []
+
+    class Result:
+        stdout = '{"format": {"duration": "12.5"}}'
+
+    def fake_run_command(cmd, **_kwargs):
+        calls.append(cmd[0])
+        return Result()
+
+    monkeypatch.setattr(audio_info, "soundfile", None)
+    monkeypatch.setattr(audio_info, "run_command", fake_run_command)
+
+    assert get_audio_duration(audio) == 12.5
+    assert calls == ["ffprobe"]
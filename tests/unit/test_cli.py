@@ -0,0 +1,31 @@
+"""Tests for the CLI entry point."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+from click.testing import CliRunner
+
+from metalscribe.cli import LAZY_COMMANDS, main
+
+
+def test_version_does_not_import_subcommands():
+    for module_name, _ in LAZY_COMMANDS.values():
+        sys.modules.pop(module_name, None)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["version"])
+
+    assert result.exit_code == 0
+    assert "metalscribe" in result.output
+    assert not any(module_name in sys.modules for module_name, _ in LAZY_COMMANDS.values())
+
+
+def test_lazy_commands_resolve():
+    ctx = click.Context(main)
+    assert set(LAZY_COMMANDS) | {"version"} == set(main.list_commands(ctx))
+    for name in LAZY_COMMANDS:
+        command = main.get_command(ctx, name)
+        assert command is not None
+        assert command.name == name
@@ -12,6 +12,7 @@ from metalscribe.config import (
     get_cache_dir,
     get_prompt_path,
     get_prompts_dir,
+    get_temp_dir,
 )
 
 
@@ -36,6 +37,26 @@ def test_get_cache_dir():
     assert "metalscribe" in str(cache_dir)
 
 
+def test_get_cache_dir_follows_xdg_cache_home(tmp_path, monkeypatch):
+    """Testa que get_cache_dir acompanha XDG_CACHE_HOME apesar do cache interno."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "a"))
+    assert get_cache_dir() == tmp_path / "a" / "metalscribe"
+    assert get_cache_dir().is_dir()
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "b"))
+    assert get_cache_dir() == tmp_path / "b" / "metalscribe"
+    assert get_cache_dir().is_dir()
+
+
+def test_get_temp_dir_override(tmp_path, monkeypatch):
+    """Testa que METALSCRIBE_TMPDIR define o diretório de intermediários."""
+    monkeypatch.setenv("METALSCRIBE_TMPDIR", str(tmp_path))
+    assert get_temp_dir() == tmp_path
+
+    monkeypatch.delenv("METALSCRIBE_TMPDIR")
+    assert get_temp_dir().is_dir()
+
+
 def test_get_brew_prefix():
     """Testa que get_brew_prefix retorna um Path válido."""
     brew_prefix = get_brew_prefix()
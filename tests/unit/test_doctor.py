@@ -0,0 +1,45 @@
+"""Tests for the doctor command."""
+
+from __future__ import annotations
+
+import pytest
+from click.testing import CliRunner
+
+from metalscribe.commands.doctor import doctor
+from metalscribe.core import checks, setup
+from metalscribe.core.checks import CheckResult
+
+MISSING_CHECKS = {"check_claude_code_cli", "check_claude_code_auth"}
+
+
+@pytest.fixture
+def check_calls(monkeypatch):
+    calls = []
+
+    def make_check(name):
+        def check():
+            calls.append(name)
+            return CheckResult(name, name not in MISSING_CHECKS, "")
+
+        return check
+
+    for name in dir(checks):
+        if name.startswith("check_"):
+            monkeypatch.setattr(checks, name, make_check(name))
+    return calls
+
+
+@pytest.mark.parametrize("setup_fails", [False, True])
+def test_doctor_setup_does_not_recheck_claude_cli(monkeypatch, check_calls, setup_fails):
+    def setup_claude_code_cli():
+        if setup_fails:
+            raise RuntimeError("npm not found")
+
+    monkeypatch.setattr(setup, "setup_claude_code_cli", setup_claude_code_cli)
+
+    result = CliRunner().invoke(doctor, ["--setup"])
+
+    assert result.exit_code == 0
+    assert check_calls.count("check_claude_code_cli") == 1
+    # The auth warning follows the setup outcome, not a second probe
+    assert ("authentication required" in result.output) is not setup_fails
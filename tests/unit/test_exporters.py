@@ -166,3 +166,17 @@ def test_export_diarize_json():
         assert data["segments"][1]["speaker"] == "SPEAKER_01"
     finally:
         output_path.unlink()
+
+
+def test_export_json_same_bytes_with_and_without_orjson(tmp_path, monkeypatch):
+    """Testa que orjson e json da stdlib geram exatamente o mesmo arquivo."""
+    from metalscribe.exporters import json_exporter
+
+    segments = [MergedSegment(start_ms=0, end_ms=2500, text="Olá", speaker="SPEAKER_00")]
+    metadata = {"model": "medium", "num_speakers": 2}
+
+    export_json(segments, tmp_path / "fast.json", metadata=metadata)
+    monkeypatch.setattr(json_exporter, "orjson", None)
+    export_json(segments, tmp_path / "stdlib.json", metadata=metadata)
+
+    assert (tmp_path / "fast.json").read_bytes() == (tmp_path / "stdlib.json").read_bytes()
@@ -226,3 +226,20 @@ class TestFormatMeetingFile:
         assert "Body content here" in call_args
         assert "Meeting Title" not in call_args
         assert "Metadata" not in call_args
+
+    @patch("metalscribe.core.format_meeting.format_meeting_text")
+    def test_format_meeting_file_uses_content_already_read(self, mock_format_text, tmp_path):
+        """Test that content passed by the caller is used instead of re-reading the file."""
+        input_file = tmp_path / "missing.md"
+        output_file = tmp_path / "output.md"
+        mock_format_text.return_value = "Formatted body"
+
+        format_meeting_file(
+            input_path=input_file,
+            output_path=output_file,
+            content="# Meeting\n\n- **prompt_language**: pt-BR\n\n---\n\nBody content here",
+        )
+
+        assert mock_format_text.call_args[0][0] == "Body content here"
+        assert mock_format_text.call_args[1]["language"] == "pt-BR"
+        assert output_file.read_text() == "Formatted body"
@@ -0,0 +1,72 @@
+"""Tests for the LLM setup verification."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from metalscribe.llm import AuthenticationError, auth
+
+
+@pytest.fixture
+def setup_checks(monkeypatch):
+    results = []
+    monkeypatch.setattr(auth, "_setup_verified", False)
+    monkeypatch.setattr(auth, "show_setup_guide", lambda _error_type: None)
+    monkeypatch.setattr(auth, "verify_setup", lambda: results.pop(0))
+    return results
+
+
+def test_background_warm_up_is_reused(setup_checks):
+    setup_checks.append((True, ""))
+
+    auth.warm_up_authentication().join()
+    auth.ensure_authenticated()
+    auth.ensure_authenticated()
+
+    assert setup_checks == []
+
+
+def test_failed_verification_is_checked_again(setup_checks):
+    setup_checks.extend([(False, "not_authenticated"), (True, "")])
+
+    auth.warm_up_authentication().join()
+    auth.ensure_authenticated()
+
+    assert setup_checks == []
+    # Once verified, the result is not probed again
+    setup_checks.append((False, "not_authenticated"))
+    auth.ensure_authenticated()
+    assert setup_checks == [(False, "not_authenticated")]
+
+
+def test_ensure_authenticated_raises_on_failure(setup_checks):
+    setup_checks.append((False, "not_authenticated"))
+
+    with pytest.raises(AuthenticationError):
+        auth.ensure_authenticated()
+
+
+def test_aquery_verifies_setup_outside_the_event_loop(monkeypatch):
+    from metalscribe.llm import LLMResponse, provider
+
+    loops = []
+
+    def ensure_authenticated(auto_guide=True):
+        # check_authenticated() calls asyncio.run(), which fails inside a running loop
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+
+    async def fake_query(self, text, system_prompt=None, model=None):
+        return LLMResponse(text=text)
+
+    monkeypatch.setattr(provider, "ensure_authenticated", ensure_authenticated)
+    monkeypatch.setattr(provider.LLMProvider, "_async_query", fake_query)
+
+    response = asyncio.run(provider.LLMProvider().aquery("Hi"))
+
+    assert response.text == "Hi"
+    assert loops == [None]
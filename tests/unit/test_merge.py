@@ -1,6 +1,6 @@
 """Testes do algoritmo de merge."""
 
-from metalscribe.core.merge import merge_segments
+from metalscribe.core.merge import iter_merged_segments, merge_segments
 from metalscribe.core.models import DiarizeSegment, TranscriptSegment
 
 
@@ -51,3 +51,38 @@ def test_merge_overlap():
     assert len(merged) == 1
     # Deve escolher o speaker com maior overlap
     assert merged[0].speaker in ["SPEAKER_00", "SPEAKER_01"]
+
+
+def test_merge_streams_from_iterators():
+    """Testa merge incremental: consome a diarização só até onde precisa."""
+    consumed = []
+
+    def diarize():
+        for start, speaker in [(0, "SPEAKER_00"), (2000, "SPEAKER_01"), (9000, "SPEAKER_00")]:
+            consumed.append(start)
+            yield DiarizeSegment(start_ms=start, end_ms=start + 2000, speaker=speaker)
+
+    transcript = iter(
+        [
+            TranscriptSegment(start_ms=0, end_ms=1500, text="Olá"),
+            TranscriptSegment(start_ms=2200, end_ms=3800, text="Tudo bem"),
+        ]
+    )
+
+    merged = iter_merged_segments(transcript, diarize())
+
+    assert next(merged).speaker == "SPEAKER_00"
+    assert consumed == [0, 2000]
+    assert next(merged).speaker == "SPEAKER_01"
+    assert list(merged) == []
+
+
+def test_merge_long_turn_spans_short_turns():
+    """Testa que um turno longo continua disponível após turnos curtos terminarem."""
+    transcript = [TranscriptSegment(start_ms=5000, end_ms=6000, text="Continuando")]
+    diarize = [
+        DiarizeSegment(start_ms=0, end_ms=10000, speaker="SPEAKER_00"),
+        DiarizeSegment(start_ms=1000, end_ms=2000, speaker="SPEAKER_01"),
+    ]
+
+    assert merge_segments(transcript, diarize)[0].speaker == "SPEAKER_00"
@@ -0,0 +1,78 @@
+"""Tests for markdown metadata utilities."""
+
+import pytest
+
+from metalscribe.utils.metadata import (
+    extract_language_from_metadata,
+    parse_md_header,
+    read_body,
+    read_header,
+    split_header,
+)
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("# Title\n\n- Key: Value\n\n---\n\nBody", ("# Title\n\n- Key: Value\n", "Body")),
+        ("---\nBody\n", ("", "Body")),
+        ("# Title\r\n---\r\nBody\r\n", ("# Title\r", "Body")),
+        ("# Title\n  ---  \nBody\n---\nMore", ("# Title", "Body\n---\nMore")),
+        ("No separator\n----\n", ("", "No separator\n----")),
+    ],
+)
+def test_split_header(content, expected):
+    """Test splitting at the first line holding only '---'."""
+    assert split_header(content) == expected
+
+
+def test_extract_language_ignores_body():
+    """Test that prompt_language is only read from the header."""
+    content = "- **prompt_language**: pt-BR\n---\n- prompt_language: en-US\n"
+    assert extract_language_from_metadata(content) == "pt-BR"
+    assert extract_language_from_metadata("---\nprompt_language: en-US\n") is None
+
+
+@pytest.mark.parametrize(
+    "content, language",
+    [
+        ("# T\n\n- **prompt_language**: pt-BR\n\n---\n\nprompt_language: en-US\n", "pt-BR"),
+        ("# T\n* prompt_language:   en-US  \r\n---\r\nBody\r\n", "en-US"),
+        ("prompt_language:\nnext line\n---\nBody", None),
+        ("no separator\n- prompt_language: es\n", "es"),
+        ("", None),
+    ],
+)
+def test_parse_md_header(content, language):
+    """Test the fused language + header/body pass."""
+    assert parse_md_header(content) == (language, *split_header(content))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 65536])
+@pytest.mark.parametrize(
+    "content",
+    [
+        "# Título\n\n- prompt_language: pt-BR\n\n---\n\nCorpo ção\n",
+        "# Title\n----\n---\nBody",
+        "No separator at all\n",
+        "- prompt_language: es\nNo separator\n",
+        "# Title\n---",
+        "# Title\n- prompt_language: en-US\n" + " " * 100 + "---" + " " * 100 + "\nBody",
+    ],
+)
+def test_read_header_matches_parse_md_header(tmp_path, content, chunk_size):
+    """Test that chunked header reads agree with parse_md_header on the full text."""
+    path = tmp_path / "doc.md"
+    path.write_bytes(content.encode("utf-8"))
+
+    language, header, body_offset = read_header(path, chunk_size=chunk_size)
+
+    assert (language, header, read_body(path, body_offset)) == parse_md_header(content)
+
+
+def test_read_header_stops_at_max_bytes_without_separator(tmp_path):
+    """Test that a file with no separator is not scanned past max_bytes."""
+    path = tmp_path / "doc.md"
+    path.write_text("- prompt_language: en-US\n" + "text line\n" * 10000 + "---\nlate")
+
+    assert read_header(path, chunk_size=1024, max_bytes=4096) == ("en-US", "", 0)
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import pytest
+
 from metalscribe.core import prompt_loader
 from metalscribe.core.prompt_loader import load_prompt
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    prompt_loader._build_prompt.cache_clear()
+
+
 def test_load_prompt_injects_domain_context():
     prompt = load_prompt("format-meeting", language="pt-BR", domain_context="Contexto X")
     assert "Contexto X" in prompt
@@ -39,3 +47,40 @@ def test_load_prompt_removes_domain_context_when_last_section(tmp_path, monkeypa
     result = load_prompt("ignored", domain_context="")
     assert "CONTEXTO DE DOMÍNIO" not in result
     assert "Texto inicial." in result
+
+
+def test_load_prompt_reads_template_once(tmp_path, monkeypatch):
+    prompt_path = tmp_path / "cached.md"
+    prompt_path.write_text("# Title\n\n## INTRO\n\n{{DOMAIN_CONTEXT}}\n", encoding="utf-8")
+    monkeypatch.setattr(prompt_loader, "get_prompt_path", lambda *_args, **_kwargs: prompt_path)
+
+    reads = []
+    original_read_text = type(prompt_path).read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(prompt_path), "read_text", counting_read_text)
+
+    assert "Contexto A" in load_prompt("ignored", domain_context="Contexto A")
+    assert "Contexto B" in load_prompt("ignored", domain_context="Contexto B")
+    assert "{{DOMAIN_CONTEXT}}" not in load_prompt("ignored", domain_context="")
+    assert [path for path in reads if path == prompt_path] == [prompt_path]
+
+
+def test_load_prompt_persists_built_prompt(tmp_path, monkeypatch):
+    prompt_path = tmp_path / "persisted.md"
+    prompt_path.write_text("# Title\n\n## INTRO\n\n{{DOMAIN_CONTEXT}}\n", encoding="utf-8")
+    monkeypatch.setattr(prompt_loader, "get_prompt_path", lambda *_args, **_kwargs: prompt_path)
+
+    first = load_prompt("ignored", domain_context="Contexto A")
+    cached = list((tmp_path / "cache" / "metalscribe" / "prompts").glob("persisted-*.txt"))
+    assert len(cached) == 1
+
+    # New process: in-memory caches are empty, the disk entry is reused
+    prompt_loader._build_prompt.cache_clear()
+    prompt_loader._load_template.cache_clear()
+    cached[0].write_text("from disk", encoding="utf-8")
+    assert load_prompt("ignored", domain_context="Contexto A") == "from disk"
+    assert first != "from disk"
@@ -0,0 +1,278 @@
+"""Tests for chunked transcription refinement."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from metalscribe.core import refine
+from metalscribe.core.refine import (
+    needs_refine,
+    refine_markdown,
+    refine_markdown_file,
+    split_into_chunks,
+)
+from metalscribe.llm import AuthenticationError, LLMError, LLMResponse
+
+
+class FakeProvider:
+    """Echoes chunks back upper-cased, tracking how many queries overlap."""
+
+    instances: list["FakeProvider"] = []
+
+    def __init__(self, model=None, system_prompt=None):
+        self.model = model
+        self.system_prompt = system_prompt
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.queries: list[str] = []
+        FakeProvider.instances.append(self)
+
+    async def aquery(self, text, system_prompt=None, model=None):
+        self.queries.append(text)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later chunks finish first, so ordering must come from gather()
+        await asyncio.sleep(0.01 / len(self.queries))
+        self.in_flight -= 1
+        return LLMResponse(text=text.upper())
+
+
+@pytest.fixture(autouse=True)
+def fake_llm(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(refine, "cache_stats", {"hits": 0, "misses": 0})
+    monkeypatch.setattr(refine, "REFINE_RETRY_BASE_DELAY_S", 0)
+    monkeypatch.setattr(refine, "LLMProvider", FakeProvider)
+    monkeypatch.setattr(refine, "load_refine_prompt", lambda *_args, **_kwargs: "prompt")
+    FakeProvider.instances.clear()
+
+
+def write_merged(tmp_path, body):
+    input_path = tmp_path / "meeting_03_merged.md"
+    input_path.write_text(f"# Meeting\n\n- **prompt_language**: en-US\n\n---\n\n{body}\n")
+    return input_path
+
+
+def test_split_into_chunks_keeps_paragraphs_whole():
+    paragraphs = ["## SPEAKER_00", "**[00:01]** " + "a" * 30, "**[00:05]** " + "b" * 30]
+    text = "\n\n".join(paragraphs)
+
+    chunks = split_into_chunks(text, chunk_size=50)
+
+    assert chunks == [paragraphs[0], paragraphs[1], paragraphs[2]]
+    assert "\n\n".join(chunks) == text
+    assert split_into_chunks(text, chunk_size=len(text)) == [text]
+
+
+def test_refine_markdown_file_refines_chunks_concurrently_in_order(tmp_path):
+    body = "\n\n".join(f"paragraph {i} " + "x" * 20 for i in range(6))
+    input_path = write_merged(tmp_path, body)
+    output_path = tmp_path / "meeting_04_refined.md"
+
+    language, source = refine_markdown_file(input_path, output_path, chunk_size=40, parallelism=3)
+
+    provider = FakeProvider.instances[0]
+    assert (language, source) == ("en-US", "file")
+    assert len(provider.queries) == 6
+    assert provider.max_in_flight == 3
+    assert output_path.read_text() == "# Meeting\n\n- **prompt_language**: en-US\n\n\n" + body.upper()
+
+
+def test_refine_markdown_file_reuses_cached_chunks(tmp_path):
+    input_path = write_merged(tmp_path, "first " + "x" * 30 + "\n\nsecond " + "y" * 30)
+    output_path = tmp_path / "refined.md"
+
+    refine_markdown_file(input_path, output_path, chunk_size=40)
+    first_output = output_path.read_text()
+    input_path.write_text(input_path.read_text().replace("second", "edited"))
+    refine_markdown_file(input_path, output_path, chunk_size=40)
+    refine_markdown_file(input_path, output_path, chunk_size=40, use_cache=False)
+
+    assert [len(provider.queries) for provider in FakeProvider.instances] == [2, 1, 2]
+    assert refine.cache_stats == {"hits": 1, "misses": 3}
+    assert first_output.split("\n\n")[-2] == output_path.read_text().split("\n\n")[-2]
+
+
+def test_editing_one_paragraph_only_rerefines_its_chunk(tmp_path):
+    paragraphs = [f"**[00:{i:02d}]** " + "palavra " * (3 + i % 7) for i in range(40)]
+    input_path = write_merged(tmp_path, "\n\n".join(paragraphs))
+    output_path = tmp_path / "refined.md"
+    refine_markdown_file(input_path, output_path, chunk_size=200)
+    first_run_queries = len(FakeProvider.instances[0].queries)
+
+    paragraphs[20] += "corrigido"
+    input_path = write_merged(tmp_path, "\n\n".join(paragraphs))
+    refine_markdown_file(input_path, output_path, chunk_size=200)
+
+    assert first_run_queries > 5
+    assert FakeProvider.instances[1].queries == [
+        chunk for chunk in split_into_chunks("\n\n".join(paragraphs), 200) if "corrigido" in chunk
+    ]
+    assert "CORRIGIDO" in output_path.read_text()
+
+
+def test_interrupted_refine_resumes_from_saved_chunks(tmp_path, monkeypatch):
+    class FlakyProvider(FakeProvider):
+        async def aquery(self, text, system_prompt=None, model=None):
+            if "third" in text:
+                raise LLMError("connection reset")
+            return await super().aquery(text)
+
+    body = "\n\n".join(f"{name} " + "z" * 30 for name in ("first", "second", "third", "fourth"))
+    input_path = write_merged(tmp_path, body)
+    output_path = tmp_path / "refined.md"
+    monkeypatch.setattr(refine, "LLMProvider", FlakyProvider)
+
+    with pytest.raises(LLMError):
+        refine_markdown_file(input_path, output_path, chunk_size=40)
+    assert not output_path.exists()
+
+    monkeypatch.setattr(refine, "LLMProvider", FakeProvider)
+    refine_markdown_file(input_path, output_path, chunk_size=40)
+
+    assert FakeProvider.instances[-1].queries == ["third " + "z" * 30]
+    assert output_path.read_text().endswith(body.upper())
+
+
+@pytest.mark.parametrize(
+    ("error", "expected_attempts"),
+    [
+        (LLMError("overloaded"), refine.REFINE_MAX_RETRIES + 1),
+        (TimeoutError("read timed out"), refine.REFINE_MAX_RETRIES + 1),
+        (ConnectionResetError("reset by peer"), refine.REFINE_MAX_RETRIES + 1),
+        (AuthenticationError("login"), 1),
+        (LLMError("Claude Code error: invalid model"), 1),
+        (KeyError("text"), 1),
+        (TypeError("bad argument"), 1),
+    ],
+)
+def test_refine_retries_only_transient_errors(tmp_path, monkeypatch, error, expected_attempts):
+    attempts = []
+
+    class FailingProvider(FakeProvider):
+        async def aquery(self, text, system_prompt=None, model=None):
+            attempts.append(text)
+            raise error
+
+    monkeypatch.setattr(refine, "LLMProvider", FailingProvider)
+    input_path = write_merged(tmp_path, "only chunk")
+
+    with pytest.raises(type(error)):
+        refine_markdown_file(input_path, tmp_path / "refined.md")
+    assert len(attempts) == expected_attempts
+
+
+def test_refine_recovers_from_transient_error(tmp_path, monkeypatch):
+    failures = [LLMError("rate limited"), LLMError("rate limited")]
+
+    class RateLimitedProvider(FakeProvider):
+        async def aquery(self, text, system_prompt=None, model=None):
+            if failures:
+                raise failures.pop()
+            return await super().aquery(text)
+
+    monkeypatch.setattr(refine, "LLMProvider", RateLimitedProvider)
+    input_path = write_merged(tmp_path, "only chunk")
+
+    refine_markdown_file(input_path, tmp_path / "refined.md")
+
+    assert (tmp_path / "refined.md").read_text().endswith("ONLY CHUNK")
+
+
+def test_first_chunk_query_runs_alone_to_warm_prompt_cache(tmp_path, monkeypatch):
+    events = []
+
+    class RecordingProvider(FakeProvider):
+        async def aquery(self, text, system_prompt=None, model=None):
+            assert system_prompt is None  # the shared provider system prompt is used
+            events.append(("start", text[:6]))
+            response = await super().aquery(text)
+            events.append(("end", text[:6]))
+            return response
+
+    monkeypatch.setattr(refine, "LLMProvider", RecordingProvider)
+    body = "\n\n".join(f"chunk{i} " + "w" * 30 for i in range(4))
+    refine_markdown_file(write_merged(tmp_path, body), tmp_path / "refined.md", chunk_size=40)
+
+    assert events[:2] == [("start", "chunk0"), ("end", "chunk0")]
+    assert len(events) == 8
+
+
+def test_apply_line_edits_replaces_and_removes_lines():
+    chunk = "## SPEAKER_00\n\n**[00:01]** ola mundo\n**[00:03]** Obrigado por assistir"
+    response = (
+        '```json\n[{"line_index": 2, "corrected_text": "**[00:01]** Olá, mundo."},'
+        ' {"line_index": 3, "corrected_text": ""}]\n```'
+    )
+
+    assert refine.number_lines("a\nb") == "0| a\n1| b"
+    assert refine.apply_line_edits(chunk, response) == "## SPEAKER_00\n\n**[00:01]** Olá, mundo."
+    assert refine.apply_line_edits(chunk, "[]") == chunk
+    with pytest.raises(LLMError):
+        refine.apply_line_edits(chunk, '[{"line_index": 9, "corrected_text": "x"}]')
+
+
+def test_apply_line_edits_validates_edit_types():
+    assert refine.apply_line_edits("a\nb\nc", '[{"line_index": 1, "corrected_text": null}]') == "a\nc"
+    for edit in (
+        '{"line_index": true, "corrected_text": "x"}',
+        '{"line_index": 1, "corrected_text": 5}',
+        '{"line_index": 1, "corrected_text": ["x"]}',
+    ):
+        with pytest.raises(LLMError):
+            refine.apply_line_edits("a\nb\nc", f"[{edit}]")
+
+
+def test_edits_only_mode_applies_changed_lines(tmp_path, monkeypatch):
+    async def aquery(self, text, system_prompt=None, model=None):
+        self.queries.append(text)
+        if len(self.queries) == 1:
+            return LLMResponse(text="Sure! Here are the edits:")
+        return LLMResponse(text='[{"line_index": 1, "corrected_text": "Second line."}]')
+
+    monkeypatch.setattr(FakeProvider, "aquery", aquery)
+    input_path = write_merged(tmp_path, "first line\nsecond line")
+    output_path = tmp_path / "refined.md"
+
+    refine_markdown_file(input_path, output_path, edits_only=True)
+
+    # The malformed first reply is retried
+    assert FakeProvider.instances[0].queries == ["0| first line\n1| second line"] * 2
+    assert output_path.read_text().endswith("\n\nfirst line\nSecond line.")
+
+
+def test_refine_markdown_file_uses_content_already_in_memory(tmp_path):
+    output_path = tmp_path / "refined.md"
+    content = "# Meeting\n\n- **prompt_language**: en-US\n\n---\n\nin memory"
+
+    language, _ = refine_markdown_file(tmp_path / "missing.md", output_path, content=content)
+
+    assert language == "en-US"
+    assert output_path.read_text().endswith("\n\nIN MEMORY")
+
+
+def test_refine_markdown_returns_refined_content_without_writing(tmp_path):
+    header = "# Meeting\n\n- **prompt_language**: en-US\n"
+
+    refined, language, source = refine_markdown(header + "\n---\n\nin memory")
+
+    assert refined == header + "\n\nIN MEMORY"
+    assert (language, source) == ("en-US", "file")
+    assert refine_markdown(header + "\n---\n")[0] == header + "\n---\n"
+    assert not list(tmp_path.glob("*.md"))
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        ("## SPEAKER_00\n\n**[00:01]** So we ship on Friday.\n\n**[00:04]** Sounds good.", False),
+        ("**[00:01]** " + "and then we go " * 5, True),
+        ("**[00:01]** Obrigado por assistir!", True),
+        # Speaker headings and timestamps repeat by design, they are not loops
+        ("\n\n".join(f"## SPEAKER_00\n\n**[00:0{i}]** point {i}" for i in range(6)), False),
+    ],
+)
+def test_needs_refine_flags_loops_and_boilerplate(tmp_path, body, expected):
+    assert needs_refine(write_merged(tmp_path, body).read_text()) is expected
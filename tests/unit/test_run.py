@@ -0,0 +1,127 @@
+"""Tests for the run command."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from metalscribe.commands import run as run_module
+from metalscribe.core import audio, pyannote, whisper
+from metalscribe.parsers import diarize_parser, whisper_parser
+from metalscribe.utils import audio_info
+
+
+@pytest.fixture
+def stage_calls(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    calls = []
+
+    def convert(input_path, output_path, limit_minutes=None):
+        calls.append("convert")
+        output_path.write_bytes(b"RIFF")
+
+    def transcribe(*_args, output_base, **_kwargs):
+        Path(f"{output_base}.json").write_text("{}")
+        return []
+
+    def diarize(*_args, output_json, **_kwargs):
+        output_json.write_text("{}")
+        return []
+
+    # run imports its pipeline lazily, so patch the defining modules
+    monkeypatch.setattr(audio_info, "get_audio_duration", lambda _path: 60.0)
+    monkeypatch.setattr(audio, "convert_to_wav_16k", convert)
+    monkeypatch.setattr(whisper, "run_transcription", transcribe)
+    monkeypatch.setattr(pyannote, "run_diarization", diarize)
+    monkeypatch.setattr(whisper_parser, "parse_whisper_output", lambda _path: [])
+    monkeypatch.setattr(diarize_parser, "parse_diarize_output", lambda _path: [])
+    return calls
+
+
+def test_run_skips_when_outputs_are_fresh(tmp_path, stage_calls):
+    audio = tmp_path / "meeting.m4a"
+    audio.write_bytes(b"audio")
+    args = ["-i", str(audio), "-o", str(tmp_path / "meeting")]
+    runner = CliRunner()
+
+    assert runner.invoke(run_module.run, args).exit_code == 0
+    second = runner.invoke(run_module.run, args)
+    assert second.exit_code == 0
+    assert "up to date" in second.output
+    assert stage_calls == ["convert"]
+
+    # Different parameters, a removed output or --no-cache rerun the pipeline;
+    # conversion is skipped when both stages are cached for the unchanged input
+    assert runner.invoke(run_module.run, args + ["-l", "en"]).exit_code == 0
+    (tmp_path / "meeting_03_merged.md").unlink()
+    assert runner.invoke(run_module.run, args + ["-l", "en"]).exit_code == 0
+    assert stage_calls == ["convert"] * 2
+    assert runner.invoke(run_module.run, args + ["-l", "en", "--no-cache"]).exit_code == 0
+    audio.write_bytes(b"changed audio")
+    assert runner.invoke(run_module.run, args + ["-l", "en"]).exit_code == 0
+    assert stage_calls == ["convert"] * 4
+
+
+def test_run_writes_only_requested_formats(tmp_path, stage_calls):
+    audio = tmp_path / "meeting.m4a"
+    audio.write_bytes(b"audio")
+    args = ["-i", str(audio), "-o", str(tmp_path / "meeting")]
+    runner = CliRunner()
+
+    assert runner.invoke(run_module.run, args + ["--formats", "md"]).exit_code == 0
+    assert (tmp_path / "meeting_03_merged.md").exists()
+    assert not (tmp_path / "meeting_01_transcript.json").exists()
+    assert not (tmp_path / "meeting_03_merged.srt").exists()
+
+    assert runner.invoke(run_module.run, args + ["--formats", "all"]).exit_code == 0
+    assert (tmp_path / "meeting_01_transcript.json").exists()
+    assert (tmp_path / "meeting_03_merged.srt").exists()
+    assert stage_calls == ["convert"]
+
+    assert runner.invoke(run_module.run, args + ["--formats", "md,pdf"]).exit_code == 2
+
+
+def test_run_writes_timings_log(tmp_path, stage_calls):
+    audio = tmp_path / "meeting.m4a"
+    audio.write_bytes(b"audio")
+
+    result = CliRunner().invoke(run_module.run, ["-i", str(audio), "-o", str(tmp_path / "meeting")])
+
+    assert result.exit_code == 0
+    lines = (tmp_path / "meeting_06_timings.log").read_text().split("\n")
+    assert lines[0] == "Audio duration: 00:01:00 (60.00s)"
+    assert [line.split(":")[0] for line in lines[1:]] == [
+        "",
+        "Conversion",
+        "Transcription",
+        "Diarization",
+        "Merge",
+        "Export",
+        "",
+        "Total",
+        "",
+    ]
+
+
+def test_run_forwards_diarization_options(tmp_path, stage_calls, monkeypatch):
+    options = {}
+
+    def diarize(*_args, output_json, **kwargs):
+        options.update(kwargs)
+        output_json.write_text("{}")
+        return []
+
+    monkeypatch.setattr(pyannote, "run_diarization", diarize)
+    audio = tmp_path / "meeting.m4a"
+    audio.write_bytes(b"audio")
+    args = ["-i", str(audio), "--device", "cpu", "--embedding-batch-size", "8"]
+
+    assert CliRunner().invoke(run_module.run, args).exit_code == 0
+    assert options == {
+        "num_speakers": None,
+        "device": "cpu",
+        "embedding_batch_size": 8,
+        "segmentation_batch_size": None,
+    }
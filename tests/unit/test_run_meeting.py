@@ -0,0 +1,60 @@
+"""Tests for the run-meeting command."""
+
+from __future__ import annotations
+
+import pytest
+from click.testing import CliRunner
+
+from metalscribe import llm
+from metalscribe.commands.run_meeting import run_meeting
+from metalscribe.core import audio, pyannote, refine, whisper
+from metalscribe.exporters import json_exporter, markdown_exporter
+from metalscribe.utils import audio_info
+
+
+@pytest.fixture
+def meeting_args(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    def fail_export(_segments, output_path, **_kwargs):
+        raise OSError(f"disk full: {output_path.name}")
+
+    def fail_refine(*_args, **_kwargs):
+        raise llm.LLMError("invalid model")
+
+    # run-meeting imports its pipeline lazily, so patch the defining modules
+    monkeypatch.setattr(llm, "warm_up_authentication", lambda: None)
+    monkeypatch.setattr(audio, "convert_to_wav_16k", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(audio_info, "get_audio_duration", lambda _path: 60.0)
+    monkeypatch.setattr(whisper, "preload_model", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(whisper, "run_transcription", lambda *_args, **_kwargs: [])
+    monkeypatch.setattr(pyannote, "run_diarization", lambda *_args, **_kwargs: [])
+    monkeypatch.setattr(json_exporter, "export_transcript_json", fail_export)
+    monkeypatch.setattr(json_exporter, "export_diarize_json", fail_export)
+    monkeypatch.setattr(refine, "refine_markdown", fail_refine)
+    audio_path = tmp_path / "meeting.m4a"
+    audio_path.write_bytes(b"audio")
+    return ["-i", str(audio_path), "-o", str(tmp_path / "meeting"), "--yes"]
+
+
+def test_run_meeting_reports_every_json_export_error_when_refine_aborts(tmp_path, meeting_args):
+    result = CliRunner().invoke(run_meeting, meeting_args)
+
+    assert result.exit_code != 0
+    assert "LLM error during refinement: invalid model" in result.output
+    assert "Error exporting JSON: disk full: meeting_01_transcript.json" in result.output
+    assert "Error exporting JSON: disk full: meeting_02_diarize.json" in result.output
+    assert (tmp_path / "meeting_03_merged.md").exists()
+
+
+def test_run_meeting_checks_json_exports_when_markdown_export_fails(meeting_args, monkeypatch):
+    def fail_markdown(*_args, **_kwargs):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(markdown_exporter, "export_markdown", fail_markdown)
+
+    result = CliRunner().invoke(run_meeting, meeting_args)
+
+    assert result.exit_code != 0
+    assert "Error exporting JSON: disk full: meeting_01_transcript.json" in result.output
+    assert "Error exporting JSON: disk full: meeting_02_diarize.json" in result.output
@@ -0,0 +1,76 @@
+"""Tests for the transcription/diarization stage cache."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from metalscribe.core import stage_cache
+from metalscribe.core.stage_cache import (
+    audio_digest,
+    lookup_source,
+    remember_source,
+    run_cached_stage,
+    transcript_cache_path,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(stage_cache, "stats", {"hits": 0, "misses": 0})
+
+
+def test_audio_digest_depends_on_content_only(tmp_path):
+    first = tmp_path / "a.wav"
+    second = tmp_path / "b.wav"
+    first.write_bytes(b"RIFF" + bytes(100))
+    second.write_bytes(b"RIFF" + bytes(100))
+
+    assert audio_digest(first) == audio_digest(second)
+    second.write_bytes(b"RIFF" + bytes(101))
+    assert audio_digest(first) != audio_digest(second)
+
+
+def test_audio_digest_matches_whole_file_hash(tmp_path):
+    # Larger than the hasher's read buffer, so several chunks are consumed
+    content = bytes(range(256)) * 8192
+    audio = tmp_path / "long.wav"
+    audio.write_bytes(content)
+
+    assert audio_digest(audio) == hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def test_run_cached_stage_reuses_output(tmp_path):
+    output_json = tmp_path / "out.json"
+    cache_path = transcript_cache_path("abc", "tiny", "pt")
+    runs = []
+
+    def run():
+        runs.append(1)
+        output_json.write_text(json.dumps({"segments": [1, 2]}), encoding="utf-8")
+        return "fresh"
+
+    def parse(path):
+        return json.loads(path.read_text(encoding="utf-8"))["segments"]
+
+    assert run_cached_stage(cache_path, output_json, run, parse) == "fresh"
+    assert run_cached_stage(cache_path, output_json, run, parse) == [1, 2]
+    assert run_cached_stage(None, output_json, run, parse) == "fresh"
+    assert len(runs) == 2
+    assert stage_cache.stats == {"hits": 1, "misses": 1}
+
+
+def test_remembered_source_is_found_until_it_changes(tmp_path):
+    source = tmp_path / "meeting.m4a"
+    source.write_bytes(b"audio")
+    assert lookup_source(source) is None
+
+    remember_source(source, None, "abc123", 60.0)
+
+    assert lookup_source(source) == {"digest": "abc123", "duration": 60.0}
+    assert lookup_source(source, limit_minutes=5) is None
+    source.write_bytes(b"other audio")
+    assert lookup_source(source) is None
@@ -0,0 +1,111 @@
+"""Testes do wrapper de transcrição."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from metalscribe.core import whisper
+from metalscribe.parsers.whisper_parser import parse_whisper_output
+
+
+class _FakeCT2Model:
+    def transcribe(self, audio, language=None, vad_filter=False):
+        segments = [
+            SimpleNamespace(start=0.0, end=1.5, text=" Olá "),
+            SimpleNamespace(start=1.5, end=2.0, text="  "),
+            SimpleNamespace(start=2.0, end=3.25, text="mundo"),
+        ]
+        return iter(segments), None
+
+
+def test_ct2_backend_writes_whisper_cpp_outputs(tmp_path: Path, monkeypatch):
+    """Testa que o backend ct2-int8 gera JSON/TXT compatíveis com o whisper.cpp."""
+    monkeypatch.setattr(whisper, "WhisperModel", object)
+    monkeypatch.setattr(whisper, "load_ct2_model", lambda model_name: _FakeCT2Model())
+
+    output_base = tmp_path / "out"
+    segments = whisper.run_transcription(
+        tmp_path / "audio.wav", language="pt", output_base=output_base, backend="ct2-int8"
+    )
+
+    assert [(s.start_ms, s.end_ms, s.text) for s in segments] == [
+        (0, 1500, "Olá"),
+        (2000, 3250, "mundo"),
+    ]
+    assert parse_whisper_output(tmp_path / "out.json") == segments
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8") == "Olá\nmundo\n"
+
+
+def test_unknown_backend_exits(tmp_path: Path):
+    """Testa erro para backend desconhecido."""
+    with pytest.raises(SystemExit):
+        whisper.run_transcription(tmp_path / "audio.wav", backend="onnx")
+
+
+def test_preload_model_resolves_and_reads_model_files(tmp_path: Path, monkeypatch):
+    """Testa que o preload resolve os modelos e os lê por inteiro (page cache)."""
+    model_path = tmp_path / "ggml-tiny.bin"
+    vad_path = tmp_path / "ggml-vad.bin"
+    model_path.write_bytes(b"m" * 10)
+    vad_path.write_bytes(b"v" * 3)
+    resolved = []
+    reads = []
+
+    class _RecordingFile:
+        def __init__(self, path, mode):
+            self._file = open(path, mode)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self._file.close()
+
+        def read(self, size):
+            data = self._file.read(size)
+            reads.append(len(data))
+            return data
+
+    monkeypatch.setattr(whisper, "PRELOAD_CHUNK_SIZE", 4)
+    monkeypatch.setattr(
+        whisper, "load_model", lambda name: resolved.append(name) or (model_path, vad_path)
+    )
+    # preload_model resolve open() no módulo antes do builtin
+    monkeypatch.setattr(whisper, "open", _RecordingFile, raising=False)
+
+    whisper.preload_model("tiny")
+
+    assert resolved == ["tiny"]
+    assert sum(reads) == 13
+    assert max(reads) <= 4
+
+
+def test_preload_model_loads_ct2_weights(monkeypatch):
+    """Testa que o preload do backend ct2-int8 carrega o modelo no cache."""
+    loaded = []
+    monkeypatch.setattr(whisper, "WhisperModel", object)
+    monkeypatch.setattr(whisper, "load_ct2_model", loaded.append)
+
+    whisper.preload_model("large-v3", backend="ct2-int8")
+
+    assert loaded == ["large-v3"]
+
+
+def test_find_whisper_binary_caches_only_found_path(tmp_path: Path, monkeypatch):
+    """Testa que um binário ausente não fica em cache e que o encontrado fica."""
+    monkeypatch.setattr(whisper, "_whisper_binary", None)
+    monkeypatch.setattr(whisper, "get_brew_prefix", lambda: tmp_path / "brew")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    if any(Path(f"/usr/local/bin/{name}").exists() for name in ("whisper", "whisper-cli")):
+        pytest.skip("whisper.cpp installed globally")
+
+    assert whisper.find_whisper_binary() is None
+
+    binary = tmp_path / "brew" / "bin" / "whisper-cli"
+    binary.parent.mkdir(parents=True)
+    binary.touch()
+    assert whisper.find_whisper_binary() == binary
+
+    binary.unlink()
+    assert whisper.find_whisper_binary() == binary